@@ -0,0 +1,317 @@
+#!/usr/bin/env python
+"""
+날씨 뉴스 크롤러 오프라인 벤치마크
+
+저장된 네이버 뉴스 검색 페이지와 기사 HTML(benchmarks/fixtures)을 로컬 픽스처 서버로 재생하고,
+litellm.acompletion과 카카오 좌표 변환을 지연 시간을 설정할 수 있는 결정적(deterministic) 스텁으로 바꿔
+export_news_summaries_json의 단계별 소요 시간, 동시 지역 수에 따른 처리량, 최대 메모리(RSS)를 측정합니다.
+네트워크 연결 없이 실행됩니다. (뉴스 DB도 임시 파일을 사용합니다.)
+
+실행 (LLM_Weather 디렉토리에서):
+    python -m benchmarks.crawler_benchmark --locations 1 4 8 --rounds 3 --llm-latency-ms 800
+"""
+import argparse
+import asyncio
+import contextlib
+import io
+import json
+import os
+import re
+import resource
+import sqlite3
+import statistics
+import sys
+import tempfile
+import time
+from types import SimpleNamespace
+from typing import Dict, List, Optional, Tuple
+from urllib.parse import quote
+
+# 모듈을 가져올 수 있도록 부모 디렉토리를 경로에 추가
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+# litellm이 import 시점에 원격 모델 가격표를 내려받지 않도록 한다. (오프라인 실행)
+os.environ.setdefault("LITELLM_LOCAL_MODEL_COST_MAP", "True")
+
+from aiohttp import web
+import litellm
+
+import crawler.naver_news_crawler as naver_news_crawler
+import db.db_connection as db_connection
+from crawler.utils.stage_timer import StageTimer
+
+FIXTURES_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), "fixtures")
+MIGRATION_PATH = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "db", "migrations", "init.sql")
+
+# 벤치마크에 사용할 지역과 좌표 (좌표 변환 스텁은 이 표로 지역 이름을 돌려준다)
+BENCHMARK_LOCATIONS = [
+    ("서울", 37.5665, 126.9780),
+    ("부산", 35.1796, 129.0756),
+    ("대구", 35.8714, 128.6014),
+    ("인천", 37.4563, 126.7052),
+    ("광주", 35.1595, 126.8526),
+    ("대전", 36.3504, 127.3845),
+    ("울산", 35.5384, 129.3114),
+    ("수원", 37.2636, 127.0286),
+    ("춘천", 37.8813, 127.7298),
+    ("청주", 36.6424, 127.4890),
+    ("전주", 35.8242, 127.1480),
+    ("제주", 33.4996, 126.5312),
+]
+
+# 리포트에 표시할 단계 순서
+STAGE_ORDER = ["geocode", "listing_fetch", "listing_parse", "fetch", "extract", "compact", "dedup", "prompt_build", "summarize", "persist"]
+
+PRESS_URL_PATTERN = re.compile(r"__PRESS_URL_(\w+)__")
+
+
+class FixtureServer:
+    """
+    네이버 검색 페이지와 언론사 기사 페이지를 흉내 내는 로컬 HTTP 서버.
+    실제처럼 기사 링크가 여러 호스트에 흩어지도록 언론사마다 별도의 포트를 사용합니다.
+    (크롤러 세션은 호스트별 동시 연결 수를 제한하므로, 한 포트로 모든 기사를 내보내면 결과가 왜곡됩니다.)
+    """
+
+    def __init__(self, latency_ms: float, page_padding_kb: int):
+        """
+        Args:
+            latency_ms (float): 응답마다 추가할 지연 시간 (ms).
+            page_padding_kb (int): 기사 페이지 </article> 뒤에 덧붙일 스크립트/광고 영역 크기 (KB). 실제 기사 페이지 크기를 흉내 냅니다.
+        """
+        self.latency = latency_ms / 1000
+        self.padding = "<script>" + "var _ad=0;" * (page_padding_kb * 1024 // 10) + "</script>\n" if page_padding_kb else ""
+
+        with open(os.path.join(FIXTURES_DIR, "naver_search.html"), encoding="utf-8") as f:
+            self.search_template = f.read()
+        self.articles: Dict[str, str] = {}
+        articles_dir = os.path.join(FIXTURES_DIR, "articles")
+        for name in sorted(os.listdir(articles_dir)):
+            with open(os.path.join(articles_dir, name), encoding="utf-8") as f:
+                self.articles[name] = f.read()
+
+        self.press_names = sorted(set(PRESS_URL_PATTERN.findall(self.search_template)))
+        self.press_urls: Dict[str, str] = {}
+        self.search_url = ""
+        self.request_count = 0
+        self._runner: Optional[web.AppRunner] = None
+
+    async def handle_search(self, request: web.Request) -> web.Response:
+        """검색어의 지역 이름과 언론사 주소를 채운 검색 결과 페이지를 반환합니다."""
+        self.request_count += 1
+        await asyncio.sleep(self.latency)
+        location = request.query.get("query", "").replace("날씨", "").strip()
+        html = PRESS_URL_PATTERN.sub(lambda m: self.press_urls[m.group(1)], self.search_template)
+        # 기사 페이지에도 같은 지역 이름이 들어가도록 기사 링크에 지역을 붙인다.
+        html = re.sub(r'(/articles/[^"?]+)"', lambda m: f'{m.group(1)}?location={quote(location)}"', html)
+        return web.Response(text=html.replace("__LOCATION__", location), content_type="text/html")
+
+    async def handle_article(self, request: web.Request) -> web.Response:
+        """기사 페이지를 반환합니다. (지역 이름은 검색 페이지가 붙여 준 location 쿼리로 채움)"""
+        self.request_count += 1
+        await asyncio.sleep(self.latency)
+        html = self.articles.get(request.match_info["name"])
+        if html is None:
+            raise web.HTTPNotFound()
+        html = html.replace("</body>", self.padding + "</body>")
+        return web.Response(text=html.replace("__LOCATION__", request.query.get("location", "서울")), content_type="text/html")
+
+    async def start(self) -> None:
+        """서버를 시작하고, 검색 페이지 주소와 언론사별 주소를 정합니다."""
+        app = web.Application()
+        app.router.add_get("/search.naver", self.handle_search)
+        app.router.add_get("/articles/{name}", self.handle_article)
+
+        self._runner = web.AppRunner(app, access_log=None)
+        await self._runner.setup()
+
+        ports = []
+        for _ in range(len(self.press_names) + 1):
+            site = web.TCPSite(self._runner, "127.0.0.1", 0)
+            await site.start()
+            ports.append(site._server.sockets[0].getsockname()[1])
+
+        self.search_url = f"http://127.0.0.1:{ports[0]}/search.naver"
+        self.press_urls = {press: f"http://127.0.0.1:{port}" for press, port in zip(self.press_names, ports[1:])}
+
+    async def stop(self) -> None:
+        """서버를 종료합니다."""
+        if self._runner:
+            await self._runner.cleanup()
+
+
+def make_fake_acompletion(latency_ms: float, per_article_ms: float, stats: Dict[str, int]):
+    """
+    litellm.acompletion을 대신할 결정적 스텁을 만듭니다.
+    prompt에 포함된 기사 제목으로 요약문을 만들며, 단일 요약과 묶음 요약(JSON 배열) 형식을 모두 지원합니다.
+
+    Args:
+        latency_ms (float): 호출마다 기본 지연 시간 (ms).
+        per_article_ms (float): 묶음에 포함된 기사 하나당 추가 지연 시간 (ms).
+        stats (Dict[str, int]): 호출 수/입력 글자 수를 누적할 딕셔너리.
+
+    Returns:
+        Callable: litellm.acompletion과 같은 형태로 호출할 수 있는 비동기 함수.
+    """
+    async def fake_acompletion(model: str, messages: list, **kwargs):
+        user_prompt = messages[-1]["content"]
+        titles = re.findall(r"기사 제목:\s*\n(.*)", user_prompt)
+        batched = "[기사 0]" in user_prompt
+
+        stats["calls"] += 1
+        stats["articles"] += len(titles)
+        stats["prompt_chars"] += sum(len(message["content"]) for message in messages)
+
+        await asyncio.sleep((latency_ms + per_article_ms * max(len(titles), 1)) / 1000)
+
+        summaries = [{"requestCode": 200, "news_content": f"{title.strip()} (요약)"} for title in titles]
+        if batched:
+            content = json.dumps([{"index": index, **summary} for index, summary in enumerate(summaries)], ensure_ascii=False)
+        else:
+            content = json.dumps(summaries[0] if summaries else {"requestCode": 400, "news_content": ""}, ensure_ascii=False)
+
+        return SimpleNamespace(choices=[SimpleNamespace(message=SimpleNamespace(content=content))])
+
+    return fake_acompletion
+
+
+def make_fake_geocoder(latency_ms: float):
+    """
+    카카오 좌표 -> 행정구역 변환을 대신할 스텁을 만듭니다. BENCHMARK_LOCATIONS에서 가장 가까운 지역을 반환합니다.
+
+    Args:
+        latency_ms (float): 호출마다 지연 시간 (ms).
+
+    Returns:
+        Callable: get_city_from_coordinates와 같은 형태의 비동기 함수.
+    """
+    async def fake_get_city_from_coordinates(latitude: float, longitude: float) -> str:
+        await asyncio.sleep(latency_ms / 1000)
+        return min(BENCHMARK_LOCATIONS, key=lambda item: (item[1] - latitude) ** 2 + (item[2] - longitude) ** 2)[0]
+
+    return fake_get_city_from_coordinates
+
+
+def setup_temp_database(path: str) -> None:
+    """임시 DB 파일에 init.sql을 적용하고, 크롤러가 이 DB를 사용하도록 설정합니다."""
+    with open(MIGRATION_PATH, "r") as sql_file:
+        conn = sqlite3.connect(path)
+        conn.executescript(sql_file.read())
+        conn.close()
+    db_connection.DB_PATH = path
+
+
+def clear_news_table() -> None:
+    """라운드마다 DB 캐시(최근 1시간 뉴스)가 재사용되지 않도록 뉴스 테이블을 비웁니다."""
+    with db_connection.get_db_cursor() as cursor:
+        cursor.execute("DELETE FROM news")
+
+
+def peak_rss_mb() -> float:
+    """현재 프로세스의 최대 RSS를 MB 단위로 반환합니다. (macOS는 bytes, Linux는 KB 단위로 보고됨)"""
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    return peak / (1024 * 1024) if sys.platform == "darwin" else peak / 1024
+
+
+async def run_round(concurrency: int, server: FixtureServer) -> Tuple[float, List[float], StageTimer, int]:
+    """
+    서로 다른 지역 concurrency개에 대해 export_news_summaries_json을 동시에 실행합니다.
+
+    Returns:
+        Tuple[float, List[float], StageTimer, int]: (전체 소요 시간, 지역별 소요 시간 리스트, 단계별 타이머, 반환된 요약 수 합계)
+    """
+    timer = StageTimer()
+    locations = [BENCHMARK_LOCATIONS[index % len(BENCHMARK_LOCATIONS)] for index in range(concurrency)]
+
+    async def run_one(latitude: float, longitude: float) -> Tuple[float, int]:
+        start = time.perf_counter()
+        summaries = await naver_news_crawler.export_news_summaries_json(latitude, longitude)
+        return time.perf_counter() - start, len(summaries)
+
+    start = time.perf_counter()
+    with timer.activate():
+        results = await asyncio.gather(*[run_one(latitude, longitude) for _, latitude, longitude in locations])
+    wall = time.perf_counter() - start
+
+    return wall, [latency for latency, _ in results], timer, sum(count for _, count in results)
+
+
+def format_stage_report(timer: StageTimer, requests: int) -> List[str]:
+    """단계별 누적 시간을 요청 1건당 평균(ms)과 호출 횟수로 정리합니다."""
+    lines = [f"    {'stage':<14}{'ms/request':>12}{'calls':>8}{'ms/call':>10}"]
+    for stage in STAGE_ORDER + sorted(set(timer.totals) - set(STAGE_ORDER)):
+        if stage not in timer.totals:
+            continue
+        total_ms = timer.totals[stage] * 1000
+        calls = timer.counts[stage]
+        lines.append(f"    {stage:<14}{total_ms / requests:>12.1f}{calls:>8}{total_ms / calls:>10.1f}")
+    return lines
+
+
+async def main(args: argparse.Namespace) -> None:
+    server = FixtureServer(args.http_latency_ms, args.page_padding_kb)
+    await server.start()
+
+    llm_stats = {"calls": 0, "articles": 0, "prompt_chars": 0}
+    naver_news_crawler.NAVER_NEWS_SEARCH_URL = server.search_url
+    naver_news_crawler.get_city_from_coordinates = make_fake_geocoder(args.geocode_latency_ms)
+    litellm.acompletion = make_fake_acompletion(args.llm_latency_ms, args.llm_per_article_ms, llm_stats)
+    os.environ["NEWS_SUMMARY_MODE"] = args.mode
+
+    with tempfile.TemporaryDirectory() as temp_dir:
+        setup_temp_database(os.path.join(temp_dir, "benchmark.db"))
+
+        print(f"모드: {args.mode}, LLM 지연: {args.llm_latency_ms}ms (+{args.llm_per_article_ms}ms/기사), "
+              f"HTTP 지연: {args.http_latency_ms}ms, 좌표 변환 지연: {args.geocode_latency_ms}ms, 라운드: {args.rounds}")
+
+        try:
+            for concurrency in args.locations:
+                walls, latencies, summaries = [], [], 0
+                timer = StageTimer()
+                calls_before, articles_before = llm_stats["calls"], llm_stats["articles"]
+
+                for _ in range(args.rounds):
+                    clear_news_table()
+                    # 크롤러의 진행 로그는 측정 결과만 보이도록 숨긴다.
+                    output = contextlib.nullcontext() if args.verbose else contextlib.redirect_stdout(io.StringIO())
+                    with output:
+                        wall, round_latencies, round_timer, round_summaries = await run_round(concurrency, server)
+                    walls.append(wall)
+                    latencies.extend(round_latencies)
+                    summaries += round_summaries
+                    for stage, seconds in round_timer.totals.items():
+                        timer.totals[stage] += seconds
+                        timer.counts[stage] += round_timer.counts[stage]
+
+                requests = concurrency * args.rounds
+                latencies.sort()
+                print(f"\n[동시 지역 {concurrency}개]")
+                print(f"  처리량: {requests / sum(walls):.2f} 요청/초 (라운드 평균 {statistics.mean(walls) * 1000:.0f}ms)")
+                print(f"  요청 지연: p50 {latencies[len(latencies) // 2] * 1000:.0f}ms, "
+                      f"p95 {latencies[min(len(latencies) - 1, int(len(latencies) * 0.95))] * 1000:.0f}ms")
+                print(f"  요약 수: 요청당 {summaries / requests:.1f}개, LLM 호출: 요청당 {(llm_stats['calls'] - calls_before) / requests:.1f}회 "
+                      f"(기사 {(llm_stats['articles'] - articles_before) / requests:.1f}건)")
+                print("  단계별 시간 (동시에 실행되는 단계는 겹쳐서 합산됨):")
+                print("\n".join(format_stage_report(timer, requests)))
+        finally:
+            await server.stop()
+
+    print(f"\nHTTP 요청 수: {server.request_count}, LLM 입력 글자 수: {llm_stats['prompt_chars']}")
+    print(f"최대 RSS: {peak_rss_mb():.1f}MB")
+
+
+def parse_args() -> argparse.Namespace:
+    parser = argparse.ArgumentParser(description="날씨 뉴스 크롤러 오프라인 벤치마크")
+    parser.add_argument("--locations", type=int, nargs="+", default=[1, 4, 8], help="동시에 요청할 지역 수 (여러 개 지정 가능)")
+    parser.add_argument("--rounds", type=int, default=3, help="동시 지역 수마다 반복할 횟수")
+    parser.add_argument("--mode", choices=["single", "batch"], default="single", help="LLM 요약 모드 (NEWS_SUMMARY_MODE)")
+    parser.add_argument("--llm-latency-ms", type=float, default=800, help="LLM 호출당 기본 지연 시간")
+    parser.add_argument("--llm-per-article-ms", type=float, default=200, help="LLM 호출에 포함된 기사당 추가 지연 시간")
+    parser.add_argument("--http-latency-ms", type=float, default=50, help="픽스처 서버 응답 지연 시간")
+    parser.add_argument("--geocode-latency-ms", type=float, default=30, help="좌표 -> 행정구역 변환 지연 시간")
+    parser.add_argument("--page-padding-kb", type=int, default=200, help="기사 페이지 </article> 뒤에 붙일 스크립트 크기")
+    parser.add_argument("--verbose", action="store_true", help="크롤러 로그를 그대로 출력")
+    return parser.parse_args()
+
+
+if __name__ == "__main__":
+    asyncio.run(main(parse_args()))
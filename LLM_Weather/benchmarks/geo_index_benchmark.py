@@ -0,0 +1,95 @@
+#!/usr/bin/env python
+"""
+GeoUtils 최근접 지점 검색 벤치마크
+
+무작위 CCTV 좌표(대한민국 영역)를 만들어, 기존의 선형 탐색(GeoUtils.find_nearest_point)과
+공간 색인(GeoSpatialIndex)의 nearest / k_nearest / within_radius 조회 시간을 지점 수별로 비교합니다.
+색인 결과가 선형 탐색과 같은 지점을 찾는지도 함께 확인합니다.
+
+실행 (LLM_Weather 디렉토리에서):
+    python -m benchmarks.geo_index_benchmark --points 1000 10000 100000 --queries 200
+"""
+import argparse
+import os
+import random
+import statistics
+import sys
+import time
+from typing import Callable, Dict, List, Tuple
+
+# 모듈을 가져올 수 있도록 부모 디렉토리를 경로에 추가
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from chatbot.utils.geo_utils import GeoUtils
+
+# 무작위 좌표를 만들 영역 (남쪽 위도, 서쪽 경도, 북쪽 위도, 동쪽 경도)
+KOREA_BOUNDS = (33.1, 124.6, 38.6, 130.9)
+
+
+def make_points(count: int, rng: random.Random) -> List[Dict]:
+    """CCTV 데이터와 같은 형태의 무작위 지점 목록을 만듭니다."""
+    south, west, north, east = KOREA_BOUNDS
+    return [
+        {
+            "cctvname": f"CCTV {i}",
+            "cctvurl": f"http://example.com/{i}.mp4",
+            "coordx": rng.uniform(west, east),
+            "coordy": rng.uniform(south, north),
+        }
+        for i in range(count)
+    ]
+
+
+def measure(function: Callable[[float, float], object], queries: List[Tuple[float, float]]) -> Tuple[float, List[object]]:
+    """조회 함수를 모든 기준점에 대해 실행하고, (조회당 평균 시간(µs), 결과 리스트)를 반환합니다."""
+    results = []
+    started = time.perf_counter()
+    for latitude, longitude in queries:
+        results.append(function(latitude, longitude))
+    return (time.perf_counter() - started) / len(queries) * 1e6, results
+
+
+def run(count: int, query_count: int, k: int, radius_km: float, rng: random.Random) -> None:
+    points = make_points(count, rng)
+    south, west, north, east = KOREA_BOUNDS
+    queries = [(rng.uniform(south, north), rng.uniform(west, east)) for _ in range(query_count)]
+
+    started = time.perf_counter()
+    index = GeoUtils.build_spatial_index(points)
+    build_ms = (time.perf_counter() - started) * 1000
+
+    scan_us, scan_results = measure(lambda lat, lon: GeoUtils.find_nearest_point(lat, lon, points), queries)
+    nearest_us, nearest_results = measure(index.nearest, queries)
+    k_nearest_us, _ = measure(lambda lat, lon: index.k_nearest(lat, lon, k), queries)
+    radius_us, radius_results = measure(lambda lat, lon: index.within_radius(lat, lon, radius_km), queries)
+
+    mismatches = sum(
+        1 for scan, hit in zip(scan_results, nearest_results)
+        if abs(scan["distance"] - hit[1]) > 1e-6
+    )
+
+    print(f"\n[지점 {count:,}개, 조회 {query_count}회]")
+    print(f"  색인 생성: {build_ms:.1f}ms")
+    print(f"  선형 탐색 find_nearest_point: {scan_us:,.1f}µs/조회")
+    print(f"  색인 nearest:               {nearest_us:,.1f}µs/조회 ({scan_us / nearest_us:,.0f}배)")
+    print(f"  색인 k_nearest (k={k}):      {k_nearest_us:,.1f}µs/조회")
+    print(f"  색인 within_radius ({radius_km:g}km): {radius_us:,.1f}µs/조회 "
+          f"(평균 {statistics.mean(len(result) for result in radius_results):.1f}개)")
+    print(f"  선형 탐색과 다른 결과: {mismatches}건")
+
+
+def parse_args() -> argparse.Namespace:
+    parser = argparse.ArgumentParser(description="GeoUtils 최근접 지점 검색 벤치마크")
+    parser.add_argument("--points", type=int, nargs="+", default=[1000, 10000, 100000], help="지점 수 (여러 개 지정 가능)")
+    parser.add_argument("--queries", type=int, default=200, help="지점 수마다 실행할 조회 수")
+    parser.add_argument("--k", type=int, default=5, help="k_nearest의 k")
+    parser.add_argument("--radius-km", type=float, default=5.0, help="within_radius의 반경 (km)")
+    parser.add_argument("--seed", type=int, default=42, help="난수 시드")
+    return parser.parse_args()
+
+
+if __name__ == "__main__":
+    args = parse_args()
+    rng = random.Random(args.seed)
+    for count in args.points:
+        run(count, args.queries, args.k, args.radius_km, rng)
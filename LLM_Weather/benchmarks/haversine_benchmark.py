@@ -0,0 +1,143 @@
+#!/usr/bin/env python
+"""
+거리 계산 벤치마크
+
+기존의 순수 파이썬 하버사인 함수를 지점마다 호출하는 방식과 GeoUtils.calculate_distances(numpy 벡터화)를
+일대다(기준점 1개 x 지점 N개)와 다대다(distance_matrix) 배치에서 비교합니다.
+하버사인(float64/float32)과 equirectangular 근사식의 속도와 최대 오차를 함께 출력하며,
+일대다 하버사인(--gate-dtype, 기본 float32)의 속도 향상이 --min-speedup 배 미만이면 실패(종료 코드 1)합니다.
+(float64 하버사인은 삼각함수 3번의 계산 시간이 대부분이라, 순수 파이썬 대비 약 20~30배에 그칩니다.)
+
+실행 (LLM_Weather 디렉토리에서):
+    python -m benchmarks.haversine_benchmark --points 100000 --matrix 1000 2000
+"""
+import argparse
+import math
+import os
+import sys
+import time
+from typing import Callable, Dict, Tuple
+
+import numpy as np
+
+# 모듈을 가져올 수 있도록 부모 디렉토리를 경로에 추가
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from chatbot.utils.geo_utils import EQUIRECTANGULAR, HAVERSINE, GeoUtils
+
+# 무작위 좌표를 만들 영역 (남쪽 위도, 서쪽 경도, 북쪽 위도, 동쪽 경도)
+KOREA_BOUNDS = (33.1, 124.6, 38.6, 130.9)
+
+
+def python_haversine(lat1: float, lon1: float, lat2: float, lon2: float) -> float:
+    """벡터화 이전의 GeoUtils.calculate_distance와 같은 순수 파이썬 하버사인 공식 (비교 기준)"""
+    R = 6371
+    dlat = math.radians(lat2 - lat1)
+    dlon = math.radians(lon2 - lon1)
+    a = (math.sin(dlat/2) * math.sin(dlat/2) +
+         math.cos(math.radians(lat1)) * math.cos(math.radians(lat2)) *
+         math.sin(dlon/2) * math.sin(dlon/2))
+    c = 2 * math.atan2(math.sqrt(a), math.sqrt(1-a))
+    return R * c
+
+
+def best_time(function: Callable[[], np.ndarray], repeat: int) -> Tuple[float, np.ndarray]:
+    """함수를 repeat번 실행해 (가장 빠른 실행 시간(초), 결과)를 반환합니다."""
+    best, result = float("inf"), None
+    for _ in range(repeat):
+        started = time.perf_counter()
+        result = function()
+        best = min(best, time.perf_counter() - started)
+    return best, result
+
+
+def random_coordinates(count: int, rng: np.random.Generator) -> Tuple[np.ndarray, np.ndarray]:
+    south, west, north, east = KOREA_BOUNDS
+    return rng.uniform(south, north, count), rng.uniform(west, east, count)
+
+
+def run_one_to_many(count: int, repeat: int, rng: np.random.Generator) -> Dict[type, float]:
+    latitudes, longitudes = random_coordinates(count, rng)
+    target_lat, target_lon = 37.5665, 126.9780
+    lat_list, lon_list = latitudes.tolist(), longitudes.tolist()
+
+    loop_seconds, expected = best_time(
+        lambda: np.array([python_haversine(target_lat, target_lon, lat, lon) for lat, lon in zip(lat_list, lon_list)]),
+        repeat
+    )
+
+    print(f"\n[일대다: 기준점 1개 x 지점 {count:,}개]")
+    print(f"  순수 파이썬 반복:          {loop_seconds * 1000:9.2f}ms")
+
+    speedups = {}
+    for label, method, dtype in (
+        ("하버사인 float64", HAVERSINE, np.float64),
+        ("하버사인 float32", HAVERSINE, np.float32),
+        ("equirectangular float64", EQUIRECTANGULAR, np.float64),
+    ):
+        seconds, distances = best_time(
+            lambda: GeoUtils.calculate_distances(target_lat, target_lon, latitudes, longitudes, method, dtype),
+            repeat
+        )
+        speedup = loop_seconds / seconds
+        if method == HAVERSINE:
+            speedups[dtype] = speedup
+        print(f"  {label:<24} {seconds * 1000:9.2f}ms ({speedup:,.0f}배), "
+              f"최대 오차 {np.max(np.abs(distances - expected)) * 1000:,.3f}m")
+
+    # equirectangular 근사식은 가까운 거리에서 사용하므로, 50km 이내 지점의 오차를 따로 확인한다.
+    near = expected <= 50
+    if near.any():
+        approx = GeoUtils.calculate_distances(target_lat, target_lon, latitudes[near], longitudes[near], EQUIRECTANGULAR)
+        print(f"  equirectangular 50km 이내 최대 오차: {np.max(np.abs(approx - expected[near])) * 1000:,.3f}m")
+
+    return speedups
+
+
+def run_many_to_many(rows: int, columns: int, repeat: int, rng: np.random.Generator) -> None:
+    lats_a, lons_a = random_coordinates(rows, rng)
+    lats_b, lons_b = random_coordinates(columns, rng)
+
+    # 순수 파이썬 반복은 오래 걸리므로 일부 행만 측정해 전체 시간을 추정한다.
+    sample_rows = min(rows, 20)
+    lat_b_list, lon_b_list = lats_b.tolist(), lons_b.tolist()
+    sample_seconds, _ = best_time(
+        lambda: [[python_haversine(lat_a, lon_a, lat_b, lon_b) for lat_b, lon_b in zip(lat_b_list, lon_b_list)]
+                 for lat_a, lon_a in zip(lats_a[:sample_rows].tolist(), lons_a[:sample_rows].tolist())],
+        1
+    )
+    loop_seconds = sample_seconds * rows / sample_rows
+
+    print(f"\n[다대다: {rows:,} x {columns:,} = {rows * columns:,}쌍]")
+    print(f"  순수 파이썬 반복 (추정):   {loop_seconds * 1000:9.1f}ms")
+    for label, method, dtype in (
+        ("하버사인 float64", HAVERSINE, np.float64),
+        ("하버사인 float32", HAVERSINE, np.float32),
+        ("equirectangular float32", EQUIRECTANGULAR, np.float32),
+    ):
+        seconds, _ = best_time(lambda: GeoUtils.distance_matrix(lats_a, lons_a, lats_b, lons_b, method, dtype), repeat)
+        print(f"  {label:<24} {seconds * 1000:9.1f}ms ({loop_seconds / seconds:,.0f}배)")
+
+
+def parse_args() -> argparse.Namespace:
+    parser = argparse.ArgumentParser(description="거리 계산 벤치마크")
+    parser.add_argument("--points", type=int, default=100000, help="일대다 배치의 지점 수")
+    parser.add_argument("--matrix", type=int, nargs=2, default=[1000, 2000], metavar=("ROWS", "COLUMNS"), help="다대다 배치 크기")
+    parser.add_argument("--repeat", type=int, default=3, help="측정 반복 횟수 (가장 빠른 값을 사용)")
+    parser.add_argument("--min-speedup", type=float, default=50.0, help="일대다 하버사인이 넘어야 하는 속도 향상 배수")
+    parser.add_argument("--gate-dtype", choices=["float32", "float64"], default="float32", help="속도 향상 기준을 적용할 자료형")
+    parser.add_argument("--seed", type=int, default=42, help="난수 시드")
+    return parser.parse_args()
+
+
+if __name__ == "__main__":
+    args = parse_args()
+    rng = np.random.default_rng(args.seed)
+
+    speedups = run_one_to_many(args.points, args.repeat, rng)
+    run_many_to_many(args.matrix[0], args.matrix[1], args.repeat, rng)
+
+    speedup = speedups[getattr(np, args.gate_dtype)]
+    print(f"\n일대다 하버사인({args.gate_dtype}) 속도 향상: {speedup:,.0f}배 (기준 {args.min_speedup:g}배)")
+    if speedup < args.min_speedup:
+        sys.exit(1)
@@ -0,0 +1,120 @@
+#!/usr/bin/env python
+"""
+규칙 기반 의도 분류기 평가
+
+레이블을 붙인 질문 목록(benchmarks/fixtures/intent_eval.jsonl)으로 chatbot/utils/intent_classifier.py를 평가합니다.
+각 줄은 {"message", "function_name", "args"}이며, function_name이 null이면 LLM이 처리해야 하는 질문입니다.
+
+- 적중률: LLM 없이 바로 함수를 호출한 질문의 비율
+- 정확도: 바로 호출한 질문 중 함수와 인자(location, hours, full_day)가 레이블과 같은 비율
+- 잘못된 적중: LLM이 처리해야 하는 질문을 바로 호출한 경우
+
+실행 (LLM_Weather 디렉토리에서):
+    python -m benchmarks.intent_eval --now 2025-07-01T10:00 --threshold 0.8
+"""
+import argparse
+import contextlib
+import io
+import json
+import os
+import sys
+import time
+from datetime import datetime
+from typing import Any, Dict, List, Optional
+
+# 모듈을 가져올 수 있도록 부모 디렉토리를 경로에 추가
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from chatbot.utils.intent_classifier import classify_intent
+from chatbot.utils.place_alias_index import resolve_place_alias
+
+DEFAULT_DATASET_PATH = os.path.join(os.path.dirname(os.path.abspath(__file__)), "fixtures", "intent_eval.jsonl")
+
+
+def load_dataset(path: str) -> List[Dict[str, Any]]:
+    with open(path, encoding="utf-8") as f:
+        return [json.loads(line) for line in f if line.strip()]
+
+
+def same_location(expected: str, actual: str) -> bool:
+    """지역명이 같은 지역을 가리키는지 비교합니다. ("춘천"과 "춘천시"는 같은 지역)"""
+    if expected == actual:
+        return True
+    expected_area, actual_area = resolve_place_alias(expected), resolve_place_alias(actual)
+    return bool(expected_area and actual_area and expected_area == actual_area)
+
+
+def is_correct(label: Dict[str, Any], intent: Dict[str, Any]) -> bool:
+    if label["function_name"] != intent["function_name"]:
+        return False
+    expected, actual = label["args"], intent["args"]
+    if not same_location(expected.get("location", ""), actual.get("location", "")):
+        return False
+    return all(expected.get(key) == actual.get(key) for key in ("hours", "full_day") if key in expected)
+
+
+def describe(intent: Optional[Dict[str, Any]]) -> str:
+    if not intent or not intent["function_name"]:
+        return "LLM"
+    return f"{intent['function_name']}({json.dumps(intent['args'], ensure_ascii=False)})"
+
+
+def main(args: argparse.Namespace) -> int:
+    dataset = load_dataset(args.dataset)
+    now = datetime.fromisoformat(args.now)
+
+    hits, correct, false_hits, expected_calls, covered = 0, 0, 0, 0, 0
+    failures = []
+    started = time.perf_counter()
+    for row in dataset:
+        # 지역명 색인의 모호함 경고 등은 숨긴다.
+        with contextlib.redirect_stdout(io.StringIO()):
+            intent = classify_intent(row["message"], now)
+        hit = intent["function_name"] is not None and intent["confidence"] >= args.threshold
+        if row["function_name"]:
+            expected_calls += 1
+
+        if not hit:
+            if args.verbose:
+                print(f"  [LLM] {row['message']} ({intent['reason']})")
+            continue
+
+        hits += 1
+        if row["function_name"]:
+            covered += 1
+        else:
+            false_hits += 1
+
+        if is_correct(row, intent):
+            correct += 1
+        else:
+            failures.append((row["message"], describe(row), describe(intent)))
+    elapsed = time.perf_counter() - started
+
+    print(f"질문 {len(dataset)}개 (함수 호출 레이블 {expected_calls}개), 기준 시각 {now:%Y-%m-%d %H:%M}, 확신도 기준 {args.threshold}")
+    print(f"적중률: {hits / len(dataset):.1%} ({hits}/{len(dataset)})")
+    print(f"함수 호출 질문 중 바로 처리한 비율: {covered / max(1, expected_calls):.1%} ({covered}/{expected_calls})")
+    print(f"정확도 (바로 처리한 질문 중): {correct / max(1, hits):.1%} ({correct}/{hits})")
+    print(f"잘못된 적중 (LLM이 처리해야 하는 질문): {false_hits}개")
+    print(f"분류 시간: 질문당 {elapsed / len(dataset) * 1e6:.0f}µs")
+
+    if failures:
+        print("\n틀린 질문:")
+        for message, expected, actual in failures:
+            print(f"  {message}\n    기대: {expected}\n    결과: {actual}")
+
+    return 0 if correct / max(1, hits) >= args.min_accuracy else 1
+
+
+def parse_args() -> argparse.Namespace:
+    parser = argparse.ArgumentParser(description="규칙 기반 의도 분류기 평가")
+    parser.add_argument("--dataset", default=DEFAULT_DATASET_PATH, help="레이블 파일 (JSONL)")
+    parser.add_argument("--now", default="2025-07-01T10:00", help="레이블의 기준 시각 (hours 계산에 사용)")
+    parser.add_argument("--threshold", type=float, default=0.8, help="바로 함수를 호출할 확신도 기준")
+    parser.add_argument("--min-accuracy", type=float, default=0.95, help="이 정확도보다 낮으면 종료 코드 1을 반환")
+    parser.add_argument("--verbose", action="store_true", help="LLM으로 넘긴 질문과 이유를 출력")
+    return parser.parse_args()
+
+
+if __name__ == "__main__":
+    sys.exit(main(parse_args()))
@@ -1,8 +1,9 @@
 import os
 import sys
+import time
 import warnings
 import google.generativeai as genai
-from typing import Optional, Dict, Any
+from typing import Optional, Dict, Any, AsyncIterator, Callable, List, Tuple
 
 # 상위 디렉토리의 모듈들을 import하기 위해 경로 추가
 sys.path.append(os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__)))))
@@ -14,7 +15,13 @@ from forecast.forecast_service import ForecastService
 # 리팩토링된 모듈들 import
 from chatbot.utils.function_tools import WeatherFunctionTools
 from chatbot.utils.prompt_builder import PromptBuilder
-from chatbot.utils.function_executor import FunctionExecutor
+from chatbot.utils.function_executor import WEATHER_FUNCTIONS, FunctionExecutor
+from chatbot.utils.llm_runner import get_gemini_runner
+from chatbot.utils.intent_classifier import match_fast_path_intent
+from chatbot.utils.weather_renderer import LLM_RENDERER, TEMPLATE_RENDERER, resolve_answer_renderer
+from chatbot.utils.conversation_cache import get_conversation_cache
+from chatbot.utils.forecast_prefetch import ForecastPrefetch, start_forecast_prefetch
+from chatbot.utils.answer_cache import AnswerCacheKey, answer_cache_enabled, answer_cache_key, get_cached_answer, store_answer
 
 # urllib3 경고 무시 (macOS LibreSSL 호환성 문제)
 warnings.filterwarnings("ignore", message="urllib3 v2 only supports OpenSSL 1.1.1+")
@@ -33,6 +40,18 @@ class ChatbotService:
         self.forecast_service = ForecastService()
         self.function_executor = FunctionExecutor(self.forecast_service)
         
+        # Gemini SDK 호출은 동기(REST)이므로, 스레드 풀에서 실행해 이벤트 루프를 막지 않는다.
+        self.llm_runner = get_gemini_runner()
+        
+        # 채팅별 최근 대화를 메모리에 두고(DB에는 바로 저장), 대화 기록을 만들 때 DB를 다시 읽지 않는다.
+        self.conversations = get_conversation_cache()
+        
+        # 확실한 날씨/CCTV 질문은 규칙 기반 분류기로 함수를 바로 고른다. (INTENT_FAST_PATH=0 으로 끌 수 있음)
+        self.intent_fast_path = os.getenv('INTENT_FAST_PATH', '1') != '0'
+        
+        # 날씨 최종 답변을 만드는 기본 방식 (template: 템플릿으로 바로 답변, llm: Gemini로 답변 생성). 요청마다 바꿀 수 있다.
+        self.default_answer_renderer = resolve_answer_renderer(None, os.getenv('WEATHER_ANSWER_RENDERER', TEMPLATE_RENDERER))
+        
         # Function calling tools 가져오기
         self.weather_tools = WeatherFunctionTools.get_weather_tools()
         
@@ -48,7 +67,7 @@ class ChatbotService:
 
 
     
-    async def process_message(self, message: str, user_id: str, chat_id: Optional[int] = None, latitude: Optional[float] = None, longitude: Optional[float] = None) -> Dict[str, Any]:
+    async def process_message(self, message: str, user_id: str, chat_id: Optional[int] = None, latitude: Optional[float] = None, longitude: Optional[float] = None, renderer: Optional[str] = None) -> Dict[str, Any]:
         """
         사용자 메시지를 처리하고 챗봇 응답을 생성한다.
         
@@ -58,96 +77,455 @@ class ChatbotService:
             chat_id (int, optional): 채팅 ID
             latitude (float, optional): 사용자의 현재 위치 좌표 위도
             longitude (float, optional): 사용자의 현재 위치 좌표 경도
+            renderer (str, optional): 날씨 최종 답변 방식 ("template" 또는 "llm", 생략하면 WEATHER_ANSWER_RENDERER)
             
         Returns:
-            dict: 챗봇 응답과 채팅 ID를 포함한 딕셔너리
+            dict: 챗봇 응답, 채팅 ID, 최종 답변을 만든 방식(renderer), 캐시 적중 여부(cached), 답변과 별도로 표시할 CCTV 영상 정보 목록(cctv)을 포함한 딕셔너리
         """
         user_message = message.strip()
         
         if not user_message:
             raise ValueError("메시지가 비어있습니다.")
         
+        renderer = resolve_answer_renderer(renderer, self.default_answer_renderer)
+        started_at = time.perf_counter()
+        answered_by = None
+        cached = False
+        cctv = []
+        
         # 채팅 세션이 없으면 새로 생성
         if not chat_id:
             chat_id = ChatRepository.create(user_id)
         
         # 사용자 메시지를 DB에 저장
-        user_message_id = ChatMessageRepository.create(
-            chat_id=chat_id,
-            role="user",
-            content=user_message
-        )
+        user_message_id = self.conversations.append(chat_id, "user", user_message)
         
         # Gemini API가 설정되지 않은 경우 기본 응답
         if not self.GEMINI_API_KEY:
             bot_response = "안녕하세요! 무엇을 도와드릴까요?"
         else:
-            # 이전 대화 기록 조회
-            recent_messages = ChatMessageRepository.get_last_n_messages(chat_id, 10)
-
-            conversation_history = ""
-            if recent_messages:
-                history_lines = []
-                for msg in recent_messages:
-                    role_name = "사용자" if msg['role'] == 'user' else "챗봇"
-                    history_lines.append(f"{role_name}: {msg['content']}")
-                conversation_history = "\n".join(history_lines)
-            
-            # Function calling을 위한 프롬프트 생성
-            prompt = PromptBuilder.build_function_call_prompt(user_message, conversation_history)
+            # 규칙 기반 분류기가 확실하게 분류한 질문은 첫 번째 LLM 호출(함수 선택) 없이 바로 함수를 실행
+            fast_path_intent = match_fast_path_intent(user_message) if self.intent_fast_path else None
             
             try:
-                response = self.model.generate_content(prompt)
-                
-                if response.candidates[0].content.parts:
-                    for part in response.candidates[0].content.parts:
-                        if hasattr(part, 'function_call') and part.function_call:
-                            print(f"Function call detected: {part.function_call.name}")
-                            # Function call 실행
-                            function_name = part.function_call.name
-                            function_args = {}
-                            for key, value in part.function_call.args.items():
-                                function_args[key] = value
-                            
-                            print(f"Executing function: {function_name} with args: {function_args}")
-                            
-                            # 함수 실행 (위치 정보 포함)
-                            function_result = await self.function_executor.execute_function(
-                                function_name, 
-                                function_args, 
-                                latitude,
-                                longitude
-                            )
-                            
-                            # 결과를 바탕으로 최종 응답 생성
-                            if function_name in ["get_location_coordinates", "get_cctv_info"]:
-                                # 위치 조회 및 CCTV 함수의 경우 직접 결과를 반환
-                                bot_response = function_result
-                            else:
-                                # 날씨 함수의 경우 LLM에게 데이터를 해석하도록 요청
-                                final_prompt = PromptBuilder.build_final_response_prompt(user_message, function_result)
-                                final_response = self.model.generate_content(final_prompt)
-                                bot_response = final_response.text.strip()
-                            break
+                if fast_path_intent:
+                    function_name, function_args = fast_path_intent['function_name'], fast_path_intent['args']
+                    print(f"Intent fast path: {function_name} with args: {function_args}")
+                    
+                    # 같은 격자, 같은 예보 발표 시각에 같은 의도로 물은 질문은 LLM/기상청 호출 없이 저장된 답변을 사용
+                    cache_key = await self._answer_cache_key(function_name, function_args, latitude, longitude, renderer, fast_path_intent['aspect'])
+                    answer = get_cached_answer(cache_key) if cache_key else None
+                    if answer:
+                        print(f"Answer cache hit: {cache_key}")
+                        cached = True
                     else:
-                        # Function call이 없으면 일반 대화
-                        print("No function call detected, using direct response")
-                        bot_response = response.text.strip()
+                        # 분류기가 확실하게 분류한 질문(지금, N시간 후, 내일, 하루 전체)만 템플릿으로 답변할 수 있다.
+                        answer = await self._respond_with_function(
+                            user_message,
+                            function_name,
+                            function_args,
+                            latitude,
+                            longitude,
+                            use_template=renderer == TEMPLATE_RENDERER
+                        )
+                        if cache_key and answer["cacheable"]:
+                            store_answer(cache_key, answer["reply"], answer["renderer"])
                 else:
-                    bot_response = "죄송합니다. 응답을 생성할 수 없습니다."
+                    answer = await self._respond_with_llm(user_message, chat_id, latitude, longitude)
+                bot_response, answered_by = answer["reply"], answer["renderer"]
+                cctv = answer.get("cctv", cctv)
                     
             except Exception as e:
                 print(f"Gemini API 오류: {e}")
                 bot_response = "죄송합니다. 응답을 생성하는 중 오류가 발생했습니다."
+            
+            print(f"Answer renderer: {renderer} (answered by {answered_by}{', cached' if cached else ''}), {(time.perf_counter() - started_at) * 1000:.0f}ms")
         
         # 봇 응답을 DB에 저장
-        bot_message_id = ChatMessageRepository.create(
-            chat_id=chat_id,
-            role="assistant",
-            content=bot_response
-        )
+        bot_message_id = self.conversations.append(chat_id, "assistant", bot_response)
+        # 여러 함수를 함께 실행한 답변의 CCTV 영상 정보는 답변 뒤에 별도 메시지로 저장
+        for cctv_data in cctv:
+            self.conversations.append(chat_id, "assistant", cctv_data)
+        
+        return {"reply": bot_response, "chat_id": chat_id, "renderer": answered_by, "cached": cached, "cctv": cctv}
+    
+    async def _answer_cache_key(self, function_name: str, function_args: Dict[str, Any], latitude: Optional[float], longitude: Optional[float], renderer: str, aspect: str) -> Optional[AnswerCacheKey]:
+        """
+        날씨 질문의 답변 캐시 키를 만든다. 지역의 격자 좌표만 계산하고 예보는 조회하지 않는다.
+        
+        Args:
+            function_name (str): 실행할 함수명
+            function_args (dict): 함수 인자
+            latitude (float, optional): 사용자의 현재 위치 좌표 위도
+            longitude (float, optional): 사용자의 현재 위치 좌표 경도
+            renderer (str): 답변 방식
+            aspect (str): 분류기가 찾은 질문 요소 (ex: "precipitation", "temperature", "general")
+            
+        Returns:
+            AnswerCacheKey: 캐시 키 또는 캐시를 사용할 수 없으면(날씨 함수가 아님, 지역을 찾지 못함 등) None
+        """
+        if not answer_cache_enabled() or function_name not in WEATHER_FUNCTIONS:
+            return None
+        grid = await self.function_executor.resolve_forecast_grid(function_args, latitude, longitude)
+        return answer_cache_key(function_name, function_args, grid, renderer, aspect) if grid else None
+    
+    async def _respond_with_llm(self, user_message: str, chat_id: int, latitude: Optional[float], longitude: Optional[float]) -> Dict[str, Any]:
+        """
+        Gemini function calling으로 호출할 함수를 고르고, 그 결과로 응답을 생성한다.
+        
+        Args:
+            user_message (str): 사용자 메시지
+            chat_id (int): 채팅 ID
+            latitude (float, optional): 사용자의 현재 위치 좌표 위도
+            longitude (float, optional): 사용자의 현재 위치 좌표 경도
+            
+        Returns:
+            dict: reply (챗봇 응답), renderer (응답을 만든 방식), cacheable (답변 캐시에 저장해도 되는지 여부)
+        """
+        prompt = self._build_function_call_prompt(user_message, chat_id)
+        # 좌표가 있으면 현재 위치 날씨 질문일 가능성이 높으므로, LLM이 함수를 고르는 동안 예보를 미리 조회한다.
+        prefetch = start_forecast_prefetch(self.forecast_service, latitude, longitude)
+        try:
+            response = await self.llm_runner.run(self.model.generate_content, prompt)
+            
+            if not response.candidates[0].content.parts:
+                return {"reply": "죄송합니다. 응답을 생성할 수 없습니다.", "renderer": None, "cacheable": False}
+            
+            function_calls = self._find_function_calls(response.candidates[0].content.parts)
+            if len(function_calls) > 1:
+                # 여러 함수를 동시에 실행하고, 결과를 한 번의 후속 호출로 모아 답변
+                return await self._respond_with_functions(user_message, function_calls, latitude, longitude, prefetch)
+            if function_calls:
+                # Function call 실행
+                function_name, function_args = function_calls[0]
+                return await self._respond_with_function(user_message, function_name, function_args, latitude, longitude, prefetch=prefetch)
+            
+            # Function call이 없으면 일반 대화
+            print("No function call detected, using direct response")
+            return {"reply": response.text.strip(), "renderer": LLM_RENDERER, "cacheable": False}
+        finally:
+            # 모델이 다른 함수나 지역을 골랐으면 미리 조회한 예보는 버린다.
+            if prefetch:
+                prefetch.cancel()
+    
+    def _build_function_call_prompt(self, user_message: str, chat_id: int) -> str:
+        """이전 대화 기록을 포함한 function calling용 프롬프트를 만든다."""
+        # 이전 대화 요약과 토큰 예산 안의 최근 대화. 방금 저장한 현재 질문은 프롬프트에 따로 들어가므로 제외한다.
+        conversation_history = self.conversations.history(chat_id, skip_last=1)
+        
+        # Function calling을 위한 프롬프트 생성
+        return PromptBuilder.build_function_call_prompt(user_message, conversation_history)
+    
+    @staticmethod
+    def _find_function_calls(parts) -> List[Tuple[str, Dict[str, Any]]]:
+        """Gemini 응답 part 중 function call을 모두 (함수명, 인자) 목록으로 반환한다. (같은 호출이 반복되면 한 번만)"""
+        function_calls = []
+        for part in parts:
+            if hasattr(part, 'function_call') and part.function_call:
+                print(f"Function call detected: {part.function_call.name}")
+                function_args = {}
+                for key, value in part.function_call.args.items():
+                    function_args[key] = value
+                if (part.function_call.name, function_args) not in function_calls:
+                    function_calls.append((part.function_call.name, function_args))
+        return function_calls
+    
+    async def _respond_with_function(self, user_message: str, function_name: str, function_args: Dict[str, Any], latitude: Optional[float], longitude: Optional[float], use_template: bool = False, prefetch: Optional[ForecastPrefetch] = None) -> Dict[str, Any]:
+        """
+        함수를 실행하고, 그 결과로 최종 응답을 생성한다.
+        
+        Args:
+            user_message (str): 사용자 메시지
+            function_name (str): 실행할 함수명
+            function_args (dict): 함수 인자
+            latitude (float, optional): 사용자의 현재 위치 좌표 위도
+            longitude (float, optional): 사용자의 현재 위치 좌표 경도
+            use_template (bool): True이면 날씨 함수의 최종 응답을 LLM 대신 템플릿으로 생성
+            prefetch (ForecastPrefetch, optional): 함수 선택과 동시에 미리 조회한 예보
+            
+        Returns:
+            dict: reply (챗봇 응답), renderer (응답을 만든 방식. 함수 결과를 그대로 반환하면 None),
+                cacheable (예보를 정상적으로 받아 답변 캐시에 저장해도 되는지 여부)
+        """
+        print(f"Executing function: {function_name} with args: {function_args}")
+        
+        # 위치 조회 및 CCTV 함수의 경우 직접 결과를 반환
+        if function_name in ["get_location_coordinates", "get_cctv_info"]:
+            function_result = await self.function_executor.execute_function(function_name, function_args, latitude, longitude)
+            return {"reply": function_result, "renderer": None, "cacheable": False}
+        
+        cacheable = False
+        if function_name in WEATHER_FUNCTIONS:
+            weather = await self.function_executor.execute_weather_function_with_answer(
+                function_name, 
+                function_args, 
+                latitude,
+                longitude,
+                render_answer=use_template,
+                prefetch=prefetch
+            )
+            # 템플릿으로 답변을 만들 수 있으면 두 번째 LLM 호출을 생략
+            if weather["answer"]:
+                return {"reply": weather["answer"], "renderer": TEMPLATE_RENDERER, "cacheable": weather["forecast_ok"]}
+            function_result, cacheable = weather["result"], weather["forecast_ok"]
+        else:
+            # 함수 실행 (위치 정보 포함)
+            function_result = await self.function_executor.execute_function(
+                function_name, 
+                function_args, 
+                latitude,
+                longitude
+            )
+        
+        # 날씨 함수의 경우 LLM에게 데이터를 해석하도록 요청
+        final_prompt = PromptBuilder.build_final_response_prompt(user_message, function_result)
+        final_response = await self.llm_runner.run(self.model.generate_content, final_prompt)
+        return {"reply": final_response.text.strip(), "renderer": LLM_RENDERER, "cacheable": cacheable}
+    
+    async def _respond_with_functions(self, user_message: str, function_calls: List[Tuple[str, Dict[str, Any]]], latitude: Optional[float], longitude: Optional[float], prefetch: Optional[ForecastPrefetch] = None) -> Dict[str, Any]:
+        """
+        한 응답에 들어 있는 여러 함수를 동시에 실행하고, 모든 결과를 한 번의 LLM 호출로 모아 최종 응답을 생성한다.
         
-        return {"reply": bot_response, "chat_id": chat_id}
+        Args:
+            user_message (str): 사용자 메시지
+            function_calls (List[Tuple[str, Dict[str, Any]]]): (함수명, 인자) 목록
+            latitude (float, optional): 사용자의 현재 위치 좌표 위도
+            longitude (float, optional): 사용자의 현재 위치 좌표 경도
+            prefetch (ForecastPrefetch, optional): 함수 선택과 동시에 미리 조회한 예보
+            
+        Returns:
+            dict: reply (챗봇 응답), renderer (응답을 만든 방식), cacheable (여러 함수의 답변은 캐시하지 않으므로 항상 False),
+                cctv (답변과 별도로 표시할 CCTV 영상 정보("cctv_data:" 형식) 목록)
+        """
+        print(f"Executing {len(function_calls)} functions concurrently: {function_calls}")
+        function_results = await self.function_executor.execute_functions(function_calls, latitude, longitude, prefetch=prefetch)
+        
+        final_prompt = PromptBuilder.build_multi_function_response_prompt(user_message, function_results)
+        final_response = await self.llm_runner.run(self.model.generate_content, final_prompt)
+        return {"reply": final_response.text.strip(), "renderer": LLM_RENDERER, "cacheable": False, "cctv": self._cctv_results(function_results)}
+    
+    async def stream_message(self, message: str, user_id: str, chat_id: Optional[int] = None, latitude: Optional[float] = None, longitude: Optional[float] = None, renderer: Optional[str] = None) -> AsyncIterator[Dict[str, Any]]:
+        """
+        process_message의 스트리밍 버전. 메시지를 검증하고 저장한 뒤, 응답 이벤트 스트림을 반환한다.
+        최종 답변은 Gemini 스트리밍 API로 받은 조각(token)을 받는 즉시 전달하며, 스트림이 끝나면 전체 답변을 DB에 저장한다.
+        
+        이벤트 형식:
+            - {"event": "start", "chat_id"}: 스트림 시작
+            - {"event": "function", "name", "args", "fast_path", "elapsed_ms"}: 호출할 함수를 고름 (여러 함수를 함께 호출하면 함수마다 한 번)
+            - {"event": "data", "name", "ok", "elapsed_ms"}: 함수 실행(예보 조회 등)이 끝남 (함수마다 한 번)
+            - {"event": "cctv", "data", "elapsed_ms"}: 여러 함수를 함께 호출한 답변과 별도로 표시할 CCTV 영상 정보 ("cctv_data:" 형식)
+            - {"event": "token", "text", "elapsed_ms"}: 답변 조각
+            - {"event": "done", "chat_id", "reply", "renderer", "cached", "cctv", "elapsed_ms", "time_to_first_token_ms"}: 스트림 종료
+        
+        Args:
+            message (str): 사용자 메시지
+            user_id (str): 사용자 ID
+            chat_id (int, optional): 채팅 ID
+            latitude (float, optional): 사용자의 현재 위치 좌표 위도
+            longitude (float, optional): 사용자의 현재 위치 좌표 경도
+            renderer (str, optional): 날씨 최종 답변 방식 ("template" 또는 "llm", 생략하면 WEATHER_ANSWER_RENDERER)
+            
+        Returns:
+            AsyncIterator[Dict[str, Any]]: 위 형식의 이벤트 스트림
+        """
+        user_message = message.strip()
+        
+        if not user_message:
+            raise ValueError("메시지가 비어있습니다.")
+        
+        renderer = resolve_answer_renderer(renderer, self.default_answer_renderer)
+        
+        # 채팅 세션이 없으면 새로 생성
+        if not chat_id:
+            chat_id = ChatRepository.create(user_id)
+        
+        # 사용자 메시지를 DB에 저장
+        self.conversations.append(chat_id, "user", user_message)
+        
+        return self._stream_reply(user_message, chat_id, latitude, longitude, renderer)
+    
+    async def _stream_reply(self, user_message: str, chat_id: int, latitude: Optional[float], longitude: Optional[float], renderer: str) -> AsyncIterator[Dict[str, Any]]:
+        """stream_message의 이벤트를 만든다. (답변 상태는 state에 모은다)"""
+        started_at = time.perf_counter()
+        state = {"parts": [], "renderer": None, "cached": False, "cacheable": False, "first_token_ms": None, "cctv": []}
+        prefetch = None
+        
+        def elapsed_ms() -> int:
+            return int((time.perf_counter() - started_at) * 1000)
+        
+        def token(text: str) -> Dict[str, Any]:
+            state["parts"].append(text)
+            if state["first_token_ms"] is None:
+                state["first_token_ms"] = elapsed_ms()
+            return {"event": "token", "text": text, "elapsed_ms": elapsed_ms()}
+        
+        yield {"event": "start", "chat_id": chat_id}
+        
+        try:
+            # Gemini API가 설정되지 않은 경우 기본 응답
+            if not self.GEMINI_API_KEY:
+                yield token("안녕하세요! 무엇을 도와드릴까요?")
+            else:
+                fast_path_intent = match_fast_path_intent(user_message) if self.intent_fast_path else None
+                
+                if fast_path_intent:
+                    function_name, function_args = fast_path_intent['function_name'], fast_path_intent['args']
+                    print(f"Intent fast path: {function_name} with args: {function_args}")
+                    yield {"event": "function", "name": function_name, "args": function_args, "fast_path": True, "elapsed_ms": elapsed_ms()}
+                    
+                    cache_key = await self._answer_cache_key(function_name, function_args, latitude, longitude, renderer, fast_path_intent['aspect'])
+                    answer = get_cached_answer(cache_key) if cache_key else None
+                    if answer:
+                        print(f"Answer cache hit: {cache_key}")
+                        state["cached"], state["renderer"] = True, answer["renderer"]
+                        yield {"event": "data", "name": function_name, "ok": True, "elapsed_ms": elapsed_ms()}
+                        yield token(answer["reply"])
+                    else:
+                        async for event in self._stream_function_answer(user_message, function_name, function_args, latitude, longitude, renderer == TEMPLATE_RENDERER, state, token, elapsed_ms):
+                            yield event
+                        if cache_key and state["cacheable"]:
+                            store_answer(cache_key, "".join(state["parts"]), state["renderer"])
+                else:
+                    # 첫 번째 호출도 스트리밍으로 받아, 함수 호출 없이 바로 답하는 경우 첫 조각부터 전달한다.
+                    # 여러 함수 호출이 여러 조각에 나뉘어 올 수 있으므로, 스트림이 끝나거나 텍스트 조각이 올 때까지 모은다.
+                    prompt = self._build_function_call_prompt(user_message, chat_id)
+                    prefetch = start_forecast_prefetch(self.forecast_service, latitude, longitude)
+                    function_calls = []
+                    chunks = self.llm_runner.stream(self.model.generate_content, prompt, stream=True)
+                    try:
+                        async for chunk in chunks:
+                            if not chunk.candidates or not chunk.candidates[0].content.parts:
+                                continue
+                            chunk_calls = self._find_function_calls(chunk.candidates[0].content.parts)
+                            if chunk_calls:
+                                function_calls += [call for call in chunk_calls if call not in function_calls]
+                                continue
+                            if function_calls:
+                                break
+                            text = self._chunk_text(chunk)
+                            if text:
+                                state["renderer"] = LLM_RENDERER
+                                yield token(text)
+                    finally:
+                        await chunks.aclose()
+                    
+                    for function_name, function_args in function_calls:
+                        yield {"event": "function", "name": function_name, "args": function_args, "fast_path": False, "elapsed_ms": elapsed_ms()}
+                    if len(function_calls) > 1:
+                        state["renderer"] = LLM_RENDERER
+                        async for event in self._stream_functions_answer(user_message, function_calls, latitude, longitude, state, token, elapsed_ms, prefetch):
+                            yield event
+                    elif function_calls:
+                        function_name, function_args = function_calls[0]
+                        async for event in self._stream_function_answer(user_message, function_name, function_args, latitude, longitude, False, state, token, elapsed_ms, prefetch):
+                            yield event
+                    elif not state["parts"]:
+                        yield token("죄송합니다. 응답을 생성할 수 없습니다.")
+                        
+        except Exception as e:
+            print(f"Gemini API 오류: {e}")
+            if not state["parts"]:
+                yield token("죄송합니다. 응답을 생성하는 중 오류가 발생했습니다.")
+        finally:
+            if prefetch:
+                prefetch.cancel()
+            # 클라이언트가 중간에 연결을 끊어도, 그때까지 만든 답변은 저장한다.
+            bot_response = "".join(state["parts"]).strip()
+            if bot_response:
+                self.conversations.append(chat_id, "assistant", bot_response)
+            for cctv_data in state["cctv"]:
+                self.conversations.append(chat_id, "assistant", cctv_data)
+            print(f"Chat stream: renderer {state['renderer']}{', cached' if state['cached'] else ''}, "
+                  f"첫 조각까지 {state['first_token_ms']}ms, 전체 {elapsed_ms()}ms")
+        
+        yield {
+            "event": "done",
+            "chat_id": chat_id,
+            "reply": bot_response,
+            "renderer": state["renderer"],
+            "cached": state["cached"],
+            "cctv": state["cctv"],
+            "elapsed_ms": elapsed_ms(),
+            "time_to_first_token_ms": state["first_token_ms"],
+        }
+    
+    async def _stream_function_answer(self, user_message: str, function_name: str, function_args: Dict[str, Any], latitude: Optional[float], longitude: Optional[float], use_template: bool, state: Dict[str, Any], token: Callable[[str], Dict[str, Any]], elapsed_ms: Callable[[], int], prefetch: Optional[ForecastPrefetch] = None) -> AsyncIterator[Dict[str, Any]]:
+        """함수를 실행하고(data 이벤트), 최종 답변을 템플릿 또는 Gemini 스트리밍으로 전달한다. (_respond_with_function의 스트리밍 버전)"""
+        print(f"Executing function: {function_name} with args: {function_args}")
+        
+        # 위치 조회 및 CCTV 함수의 경우 직접 결과를 반환
+        if function_name in ["get_location_coordinates", "get_cctv_info"]:
+            function_result = await self.function_executor.execute_function(function_name, function_args, latitude, longitude)
+            # execute_functions(_execute_one)와 같은 기준: CCTV 데이터가 있을 때만 성공
+            yield {"event": "data", "name": function_name, "ok": function_result.startswith("cctv_data:"), "elapsed_ms": elapsed_ms()}
+            yield token(function_result)
+            return
+        
+        if function_name in WEATHER_FUNCTIONS:
+            weather = await self.function_executor.execute_weather_function_with_answer(
+                function_name, 
+                function_args, 
+                latitude,
+                longitude,
+                render_answer=use_template,
+                prefetch=prefetch
+            )
+            function_result, state["cacheable"] = weather["result"], weather["forecast_ok"]
+            yield {"event": "data", "name": function_name, "ok": weather["forecast_ok"], "elapsed_ms": elapsed_ms()}
+            # 템플릿으로 답변을 만들 수 있으면 두 번째 LLM 호출을 생략
+            if weather["answer"]:
+                state["renderer"] = TEMPLATE_RENDERER
+                yield token(weather["answer"])
+                return
+        else:
+            function_result = await self.function_executor.execute_function(function_name, function_args, latitude, longitude)
+            yield {"event": "data", "name": function_name, "ok": False, "elapsed_ms": elapsed_ms()}
+        
+        # 날씨 함수의 경우 LLM에게 데이터를 해석하도록 요청 (받는 즉시 조각을 전달)
+        state["renderer"] = LLM_RENDERER
+        final_prompt = PromptBuilder.build_final_response_prompt(user_message, function_result)
+        # 클라이언트가 연결을 끊어도 Gemini 스트림을 닫아, 스트림을 읽는 작업 스레드가 멈추도록 한다.
+        chunks = self.llm_runner.stream(self.model.generate_content, final_prompt, stream=True)
+        try:
+            async for chunk in chunks:
+                text = self._chunk_text(chunk)
+                if text:
+                    yield token(text)
+        finally:
+            await chunks.aclose()
+    
+    async def _stream_functions_answer(self, user_message: str, function_calls: List[Tuple[str, Dict[str, Any]]], latitude: Optional[float], longitude: Optional[float], state: Dict[str, Any], token: Callable[[str], Dict[str, Any]], elapsed_ms: Callable[[], int], prefetch: Optional[ForecastPrefetch] = None) -> AsyncIterator[Dict[str, Any]]:
+        """여러 함수를 동시에 실행하고(함수마다 data 이벤트, CCTV 영상마다 cctv 이벤트), 모든 결과로 만든 답변을 Gemini 스트리밍으로 전달한다. (_respond_with_functions의 스트리밍 버전)"""
+        print(f"Executing {len(function_calls)} functions concurrently: {function_calls}")
+        function_results = await self.function_executor.execute_functions(function_calls, latitude, longitude, prefetch=prefetch)
+        for result in function_results:
+            yield {"event": "data", "name": result["name"], "ok": result["ok"], "elapsed_ms": elapsed_ms()}
+        state["cctv"] = self._cctv_results(function_results)
+        for cctv_data in state["cctv"]:
+            yield {"event": "cctv", "data": cctv_data, "elapsed_ms": elapsed_ms()}
+        
+        final_prompt = PromptBuilder.build_multi_function_response_prompt(user_message, function_results)
+        chunks = self.llm_runner.stream(self.model.generate_content, final_prompt, stream=True)
+        try:
+            async for chunk in chunks:
+                text = self._chunk_text(chunk)
+                if text:
+                    yield token(text)
+        finally:
+            await chunks.aclose()
+    
+    @staticmethod
+    def _cctv_results(function_results: List[Dict[str, Any]]) -> List[str]:
+        """여러 함수의 실행 결과 중 CCTV 영상 정보("cctv_data:" 형식)만 순서대로 반환한다."""
+        return [result["result"] for result in function_results if result["name"] == "get_cctv_info" and result["ok"]]
+    
+    @staticmethod
+    def _chunk_text(chunk) -> str:
+        """스트리밍 응답 조각의 텍스트를 반환한다. (텍스트가 없는 조각이면 빈 문자열)"""
+        try:
+            return chunk.text
+        except ValueError:
+            return ""
     
     def get_chat_messages(self, chat_id: int) -> Dict[str, Any]:
         """
@@ -0,0 +1,163 @@
+import os
+import sys
+import time
+from collections import OrderedDict
+from datetime import datetime, timedelta
+from typing import Any, Dict, Optional, Tuple
+
+# 상위 디렉토리의 모듈들을 import하기 위해 경로 추가
+sys.path.append(os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__)))))
+
+from forecast.utils import short_term_forecast, ultra_short_term_forecast
+
+# 메모리에 유지할 최대 답변 수 (ANSWER_CACHE_SIZE 환경 변수로 변경 가능, 0이면 캐시를 사용하지 않음)
+DEFAULT_ANSWER_CACHE_SIZE = 5000
+# 새 예보가 발표되면 키가 바뀌어 자동으로 무효화되지만, 발표가 늦어지는 경우를 위해 최대 보관 시간도 둔다. (ANSWER_CACHE_TTL_SECONDS)
+DEFAULT_ANSWER_CACHE_TTL_SECONDS = 3 * 60 * 60
+
+# 캐시 키: (함수명, 격자 X, 격자 Y, 예보 발표 시각, 오늘 날짜, 예보 시간대, 지역명, 질문 요소, 답변 방식)
+AnswerCacheKey = Tuple[str, int, int, str, str, str, str, str, str]
+
+# 키 -> (답변, 답변 방식, 만료 시각). 오래 사용하지 않은 항목부터 밀려나도록 OrderedDict를 LRU로 사용한다.
+_memory_cache: "OrderedDict[AnswerCacheKey, Tuple[str, str, float]]" = OrderedDict()
+# 함수별로 마지막으로 본 예보 발표 시각. 더 새로운 발표 시각이 보이면 이전 발표의 답변을 지운다.
+_latest_versions: Dict[str, str] = {}
+
+_stats = {"hits": 0, "misses": 0, "stores": 0, "invalidated": 0}
+
+
+def _env_int(name: str, default: int) -> int:
+    """정수 환경 변수를 읽고, 없거나 잘못된 값이면 기본값을 반환합니다."""
+    try:
+        return int(os.getenv(name, default))
+    except ValueError:
+        return default
+
+
+def answer_cache_enabled() -> bool:
+    return _env_int("ANSWER_CACHE_SIZE", DEFAULT_ANSWER_CACHE_SIZE) > 0
+
+
+def forecast_version(function_name: str, now: datetime) -> str:
+    """
+    지금 조회하면 받게 되는 기상청 예보의 발표 시각(base_date + base_time)을 계산합니다.
+    예보 API가 사용하는 get_base_time과 같은 규칙이므로, 새 예보가 발표되면 값이 바뀝니다.
+
+    Args:
+        function_name (str): get_ultra_short_term_weather 또는 get_short_term_weather
+        now (datetime): 현재 시각
+
+    Returns:
+        str: "YYYYMMDD_HHMM" 형식의 발표 시각
+    """
+    module = ultra_short_term_forecast if function_name == "get_ultra_short_term_weather" else short_term_forecast
+    base_date, base_time = module.get_base_time(int(now.strftime("%Y%m%d")), int(now.strftime("%H%M")))
+    return f"{base_date}_{base_time}"
+
+
+def forecast_slot(args: Dict[str, Any], now: datetime) -> str:
+    """
+    질문이 가리키는 예보 시간대를 만듭니다. 표현이 달라도 같은 시간대를 묻는 질문은 같은 값이 됩니다.
+    ex) "지금 날씨", "날씨 어때?" -> 다음 정시 / "내일 날씨", "내일 하루 종일" -> 내일 날짜
+
+    Args:
+        args (Dict[str, Any]): 날씨 함수 인자 (hours, full_day)
+        now (datetime): 현재 시각
+
+    Returns:
+        str: "at:YYYYMMDD_HH00" (특정 시각) 또는 "day:YYYYMMDD" (하루 전체)
+    """
+    target = now + timedelta(hours=int(args.get("hours", 1)))
+    if args.get("full_day"):
+        # 오늘 하루 요약은 지난 시간대를 빼고 만들므로, 현재 시각(정시)까지 키에 넣는다.
+        slot = f"day:{target:%Y%m%d}"
+        return f"{slot}@{now:%H}" if target.date() == now.date() else slot
+    return f"at:{target:%Y%m%d_%H}00"
+
+
+def answer_cache_key(
+    function_name: str,
+    args: Dict[str, Any],
+    grid: Tuple[int, int],
+    renderer: str,
+    aspect: str,
+    now: Optional[datetime] = None
+) -> AnswerCacheKey:
+    """
+    챗봇 답변 캐시 키를 만듭니다.
+
+    Args:
+        function_name (str): 실행할 날씨 함수명
+        args (Dict[str, Any]): 함수 인자 (location, hours, full_day)
+        grid (Tuple[int, int]): 지역의 기상청 격자 좌표 (nx, ny)
+        renderer (str): 답변 방식 ("template" 또는 "llm")
+        aspect (str): classify_intent가 찾은 질문 요소 (ex: "precipitation", "temperature", "general")
+        now (Optional[datetime]): 현재 시각 (생략하면 datetime.now())
+
+    Returns:
+        AnswerCacheKey: 캐시 키
+    """
+    now = now or datetime.now()
+    # 답변에 지역명과 "오늘/내일" 같은 표현이 들어가므로, 지역명과 오늘 날짜도 키에 넣는다.
+    # LLM 답변은 질문에 맞춰 달라지므로("내일 비 와?"와 "내일 기온 어때?"), 질문 요소도 키에 넣는다.
+    # (템플릿으로 만들지 못한 질문은 LLM이 답하므로, 템플릿 방식 요청도 질문 요소로 나눈다)
+    location = " ".join(str(args.get("location", "")).split())
+    return (
+        function_name, grid[0], grid[1], forecast_version(function_name, now),
+        now.strftime("%Y%m%d"), forecast_slot(args, now), location, aspect, renderer
+    )
+
+
+def get_cached_answer(key: AnswerCacheKey) -> Optional[Dict[str, str]]:
+    """
+    같은 예보 발표 시각, 같은 격자, 같은 질문 의도로 만든 답변을 찾습니다.
+
+    Args:
+        key (AnswerCacheKey): answer_cache_key로 만든 키
+
+    Returns:
+        Optional[Dict[str, str]]: {"reply", "renderer"} 또는 없으면 None
+    """
+    entry = _memory_cache.get(key)
+    if entry and entry[2] > time.time():
+        _memory_cache.move_to_end(key)
+        _stats["hits"] += 1
+        return {"reply": entry[0], "renderer": entry[1]}
+    if entry:
+        del _memory_cache[key]
+    _stats["misses"] += 1
+    return None
+
+
+def store_answer(key: AnswerCacheKey, reply: str, renderer: str) -> None:
+    """
+    답변을 저장합니다. 새 예보가 발표된 뒤 처음 저장할 때는 이전 발표로 만든 답변을 지웁니다.
+
+    Args:
+        key (AnswerCacheKey): answer_cache_key로 만든 키
+        reply (str): 챗봇 답변
+        renderer (str): 답변을 만든 방식
+    """
+    function_name, version = key[0], key[3]
+    if version > _latest_versions.get(function_name, ""):
+        _latest_versions[function_name] = version
+        stale_keys = [cached for cached in _memory_cache if cached[0] == function_name and cached[3] < version]
+        for stale_key in stale_keys:
+            del _memory_cache[stale_key]
+        _stats["invalidated"] += len(stale_keys)
+
+    _memory_cache[key] = (reply, renderer, time.time() + _env_int("ANSWER_CACHE_TTL_SECONDS", DEFAULT_ANSWER_CACHE_TTL_SECONDS))
+    _memory_cache.move_to_end(key)
+    _stats["stores"] += 1
+    while len(_memory_cache) > _env_int("ANSWER_CACHE_SIZE", DEFAULT_ANSWER_CACHE_SIZE):
+        _memory_cache.popitem(last=False)
+
+
+def answer_cache_stats() -> Dict[str, Any]:
+    """캐시 적중/실패/저장/무효화 횟수와 현재 항목 수를 반환합니다."""
+    lookups = _stats["hits"] + _stats["misses"]
+    return {
+        **_stats,
+        "entries": len(_memory_cache),
+        "hit_rate": round(_stats["hits"] / lookups, 3) if lookups else 0.0,
+    }
@@ -1,11 +1,28 @@
+import asyncio
+import json
 import os
-import requests
-from typing import List, Dict
+from typing import List, Dict, Optional, Tuple
+
+import aiohttp
 from dotenv import load_dotenv
 
 # .env 파일 로드
 load_dotenv(os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), '.env'))
 
+CCTV_API_URL = 'https://openapi.its.go.kr:9443/cctvInfo'
+
+# 조회할 CCTV type 목록 (its: 국도, ex: 고속도로)
+CCTV_TYPES = ('its', 'ex')
+
+# 중심 좌표 기준으로 CCTV를 조회할 범위 (위도/경도 ±도)
+CCTV_SEARCH_RADIUS_DEG = 0.1
+
+# type별 요청 제한 시간. 한 type의 응답이 늦어도 다른 type의 결과는 그대로 사용한다.
+CCTV_REQUEST_TIMEOUT = aiohttp.ClientTimeout(total=10, connect=3)
+
+# ITS API 서버로 동시에 열어 둘 최대 연결 수
+CCTV_MAX_CONNECTIONS = 8
+
 
 class CCTVApiClient:
     """CCTV API 호출을 담당하는 클래스"""
@@ -13,6 +30,9 @@ class CCTVApiClient:
     def __init__(self):
         """CCTVApiClient 초기화"""
         self.api_key = self._get_api_key()
+        self._session: Optional[aiohttp.ClientSession] = None
+        # 세션을 만든 이벤트 루프 (ClientSession.loop는 deprecated이므로 직접 기록한다)
+        self._session_loop: Optional[asyncio.AbstractEventLoop] = None
     
     def _get_api_key(self) -> str:
         """환경변수에서 CCTV API 키를 가져옵니다."""
@@ -33,9 +53,31 @@ class CCTVApiClient:
         
         return api_key
     
+    def _get_session(self) -> aiohttp.ClientSession:
+        """
+        ITS API 호출에 사용할 aiohttp 세션을 반환합니다.
+        세션은 처음 사용할 때 만들어 연결을 재사용하며, 닫혔거나 다른 이벤트 루프에서 만든 세션이면 새로 만듭니다.
+
+        Returns:
+            aiohttp.ClientSession: 연결 수와 제한 시간이 설정된 클라이언트 세션
+        """
+        loop = asyncio.get_running_loop()
+        if self._session is None or self._session.closed or self._session_loop is not loop:
+            connector = aiohttp.TCPConnector(limit=CCTV_MAX_CONNECTIONS, ttl_dns_cache=300)
+            self._session = aiohttp.ClientSession(connector=connector, timeout=CCTV_REQUEST_TIMEOUT)
+            self._session_loop = loop
+        return self._session
+
+    async def close(self) -> None:
+        """사용 중인 aiohttp 세션을 닫습니다. (서버 종료 시 호출)"""
+        if self._session is not None and not self._session.closed:
+            await self._session.close()
+        self._session = None
+        self._session_loop = None
+
     async def fetch_cctv_list(self, latitude: float, longitude: float) -> List[Dict]:
         """
-        ITS API에서 CCTV 목록을 가져옵니다.
+        ITS API에서 CCTV 목록을 가져옵니다. 모든 type을 동시에 조회합니다.
         
         Args:
             latitude (float): 중심 위도
@@ -44,64 +86,121 @@ class CCTVApiClient:
         Returns:
             List[Dict]: CCTV 데이터 목록
         """
+        all_cctvs, _ = await self.fetch_cctv_in_bounds(
+            latitude - CCTV_SEARCH_RADIUS_DEG, longitude - CCTV_SEARCH_RADIUS_DEG,
+            latitude + CCTV_SEARCH_RADIUS_DEG, longitude + CCTV_SEARCH_RADIUS_DEG
+        )
+        return all_cctvs
+
+    async def fetch_cctv_in_bounds(
+        self,
+        min_lat: float,
+        min_lon: float,
+        max_lat: float,
+        max_lon: float
+    ) -> Tuple[List[Dict], bool]:
+        """
+        ITS API에서 지정한 영역 안의 CCTV 목록을 가져옵니다. 모든 type을 동시에 조회합니다.
+        
+        Args:
+            min_lat (float): 남쪽 위도
+            min_lon (float): 서쪽 경도
+            max_lat (float): 북쪽 위도
+            max_lon (float): 동쪽 경도
+            
+        Returns:
+            Tuple[List[Dict], bool]: (CCTV 데이터 목록, 모든 type을 정상적으로 조회했는지 여부)
+        """
         if not self.api_key:
-            return []
+            return [], False
 
-        # 조회할 type 목록
-        types = ['its', 'ex']
-        all_cctvs = []
+        results = await asyncio.gather(
+            *[self._fetch_cctv_by_type(cctv_type, min_lat, min_lon, max_lat, max_lon) for cctv_type in CCTV_TYPES],
+            return_exceptions=True
+        )
 
-        for cctv_type in types:
-            try:
-                cctvs = await self._fetch_cctv_by_type(cctv_type, latitude, longitude)
-                all_cctvs.extend(cctvs)
-            except Exception as e:
-                print(f"CCTV API 호출 오류 (type={cctv_type}): {e}")
+        all_cctvs = []
+        complete = True
+        for cctv_type, cctvs in zip(CCTV_TYPES, results):
+            if isinstance(cctvs, asyncio.TimeoutError):
+                print(f"CCTV API 응답 시간 초과 (type={cctv_type})")
+                complete = False
                 continue
+            if isinstance(cctvs, Exception):
+                print(f"CCTV API 호출 오류 (type={cctv_type}): {cctvs}")
+                complete = False
+                continue
+            if cctvs is None:
+                complete = False
+                continue
+            all_cctvs.extend(cctvs)
         
         print(f"총 {len(all_cctvs)}개의 CCTV 데이터를 가져왔습니다.")
-        return all_cctvs
+        return all_cctvs, complete
     
-    async def _fetch_cctv_by_type(self, cctv_type: str, latitude: float, longitude: float) -> List[Dict]:
+    async def _fetch_cctv_by_type(
+        self,
+        cctv_type: str,
+        min_lat: float,
+        min_lon: float,
+        max_lat: float,
+        max_lon: float
+    ) -> Optional[List[Dict]]:
         """
         특정 타입의 CCTV 데이터를 가져옵니다.
         
         Args:
             cctv_type (str): CCTV 타입 ('its' 또는 'ex')
-            latitude (float): 중심 위도
-            longitude (float): 중심 경도
+            min_lat (float): 남쪽 위도
+            min_lon (float): 서쪽 경도
+            max_lat (float): 북쪽 위도
+            max_lon (float): 동쪽 경도
             
         Returns:
-            List[Dict]: 해당 타입의 CCTV 데이터 목록
+            Optional[List[Dict]]: 해당 타입의 CCTV 데이터 목록 또는 요청이 실패하면 None
         """
         params = {
             'apiKey': self.api_key,
             'type': cctv_type,
             'cctvType': '2',      # 동영상(mp4)
-            'minX': longitude - 0.1,
-            'maxX': longitude + 0.1,
-            'minY': latitude - 0.1,
-            'maxY': latitude + 0.1,
+            'minX': min_lon,
+            'maxX': max_lon,
+            'minY': min_lat,
+            'maxY': max_lat,
             'getType': 'json',
         }
         
-        url = 'https://openapi.its.go.kr:9443/cctvInfo'
-        response = requests.get(url, params=params, timeout=10)
-        
-        if response.status_code != 200:
-            print(f"CCTV API 요청 실패 (type={cctv_type}): {response.status_code}")
-            return []
-        
-        data = response.json()
+        session = self._get_session()
+        async with session.get(CCTV_API_URL, params=params) as response:
+            if response.status != 200:
+                print(f"CCTV API 요청 실패 (type={cctv_type}): {response.status}")
+                return None
+            body = await response.read()
+
+        # 응답이 클 수 있으므로 JSON 파싱과 정제는 이벤트 루프 밖(스레드)에서 처리한다.
+        return await asyncio.to_thread(self._parse_cctv_response, body)
+
+    @classmethod
+    def _parse_cctv_response(cls, body: bytes) -> List[Dict]:
+        """
+        ITS API 응답 본문을 파싱해 좌표가 유효한 CCTV 목록을 만듭니다.
+
+        Args:
+            body (bytes): 응답 본문 (JSON)
+
+        Returns:
+            List[Dict]: 정제된 CCTV 데이터 목록
+        """
+        data = json.loads(body)
         if 'response' not in data or 'data' not in data['response']:
             return []
-        
+
         cctvs = data['response']['data']
         cleaned_cctvs = []
         
         # 데이터 정제
         for cctv in cctvs:
-            cleaned_cctv = self._clean_cctv_data(cctv)
+            cleaned_cctv = cls._clean_cctv_data(cctv)
             # 유효한 좌표가 있는 것만 추가
             if cleaned_cctv['coordx'] > 0 and cleaned_cctv['coordy'] > 0:
                 cleaned_cctvs.append(cleaned_cctv)
@@ -0,0 +1,359 @@
+import asyncio
+import mmap
+import os
+import struct
+import sys
+import time
+from typing import Dict, List, Optional, Tuple
+
+import numpy as np
+
+# 여러 워커 프로세스 중 한 곳만 스냅샷을 만들도록 파일 잠금을 사용한다. (fcntl은 POSIX 전용이므로 Windows에서는 msvcrt 사용)
+try:
+    import fcntl
+except ImportError:
+    fcntl = None
+    import msvcrt
+
+# 상위 디렉토리의 모듈들을 import하기 위해 경로 추가
+sys.path.append(os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__)))))
+
+from chatbot.utils.cctv_api import CCTVApiClient, CCTV_SEARCH_RADIUS_DEG
+from chatbot.utils.geo_utils import GeoUtils
+
+# 전국 CCTV 스냅샷 파일 경로 (CCTV_SNAPSHOT_PATH 환경 변수로 변경 가능)
+DEFAULT_CCTV_SNAPSHOT_PATH = os.path.join(
+    os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__)))), 'cctv_snapshot.bin'
+)
+
+# 스냅샷을 다시 받는 주기 (CCTV_SNAPSHOT_REFRESH_SECONDS 환경 변수로 변경 가능)
+DEFAULT_CCTV_SNAPSHOT_REFRESH_SECONDS = 24 * 60 * 60
+
+# 전국 CCTV를 받을 영역 (남쪽 위도, 서쪽 경도, 북쪽 위도, 동쪽 경도). 제주도, 울릉도 포함
+KOREA_BOUNDS = (33.0, 124.5, 38.7, 131.0)
+# 전국 영역을 나눠 요청할 칸 크기 (도)와 동시 요청 수
+CCTV_SNAPSHOT_TILE_SIZE_DEG = 1.0
+CCTV_SNAPSHOT_CONCURRENCY = 8
+
+# 파일 형식
+# [헤더 24바이트: magic(8s), version(u32), count(u32), created_at(f64)]
+# [위도 float32 x count (오름차순)] [경도 float32 x count]
+# [문자열 오프셋 u32 x (2 x count + 1)] [UTF-8 문자열 (cctvname, cctvurl 순서로 이어 붙임)]
+SNAPSHOT_MAGIC = b'CCTVSNAP'
+SNAPSHOT_VERSION = 1
+SNAPSHOT_HEADER = struct.Struct('<8sIId')
+
+
+def _env_int(name: str, default: int) -> int:
+    """정수 환경 변수를 읽고, 없거나 잘못된 값이면 기본값을 반환합니다."""
+    try:
+        return int(os.getenv(name, default))
+    except ValueError:
+        return default
+
+
+def _try_lock(lock_file) -> bool:
+    """잠금 파일을 기다리지 않고 잠급니다. 다른 프로세스가 이미 잠갔으면 False를 반환합니다."""
+    try:
+        if fcntl is not None:
+            fcntl.flock(lock_file, fcntl.LOCK_EX | fcntl.LOCK_NB)
+        else:
+            msvcrt.locking(lock_file.fileno(), msvcrt.LK_NBLCK, 1)
+    except OSError:
+        return False
+    return True
+
+
+def _unlock(lock_file) -> None:
+    """_try_lock으로 잠근 파일의 잠금을 풉니다."""
+    if fcntl is not None:
+        fcntl.flock(lock_file, fcntl.LOCK_UN)
+    else:
+        lock_file.seek(0)
+        msvcrt.locking(lock_file.fileno(), msvcrt.LK_UNLCK, 1)
+
+
+def get_snapshot_path() -> str:
+    """스냅샷 파일 경로를 반환합니다."""
+    return os.getenv('CCTV_SNAPSHOT_PATH', DEFAULT_CCTV_SNAPSHOT_PATH)
+
+
+def write_snapshot(path: str, cctvs: List[Dict]) -> int:
+    """
+    CCTV 목록을 스냅샷 파일로 저장합니다.
+    임시 파일에 쓴 뒤 교체하므로, 기존 파일을 메모리 매핑해 사용 중인 프로세스는 영향을 받지 않습니다.
+
+    Args:
+        path (str): 저장할 파일 경로
+        cctvs (List[Dict]): CCTV 목록 (cctvname, cctvurl, coordx, coordy 키를 가져야 함)
+
+    Returns:
+        int: 저장한 CCTV 수
+    """
+    cctvs = sorted(cctvs, key=lambda cctv: cctv['coordy'])
+    count = len(cctvs)
+
+    latitudes = np.array([cctv['coordy'] for cctv in cctvs], dtype='<f4')
+    longitudes = np.array([cctv['coordx'] for cctv in cctvs], dtype='<f4')
+
+    strings = []
+    offsets = [0]
+    for cctv in cctvs:
+        for field in ('cctvname', 'cctvurl'):
+            encoded = cctv[field].encode('utf-8')
+            strings.append(encoded)
+            offsets.append(offsets[-1] + len(encoded))
+
+    temp_path = f"{path}.tmp.{os.getpid()}"
+    with open(temp_path, 'wb') as f:
+        f.write(SNAPSHOT_HEADER.pack(SNAPSHOT_MAGIC, SNAPSHOT_VERSION, count, time.time()))
+        f.write(latitudes.tobytes())
+        f.write(longitudes.tobytes())
+        f.write(np.array(offsets, dtype='<u4').tobytes())
+        f.write(b''.join(strings))
+    os.replace(temp_path, path)
+    return count
+
+
+class CCTVSnapshot:
+    """
+    메모리 매핑한 전국 CCTV 스냅샷에서 가장 가까운 CCTV를 찾는 클래스.
+    좌표 배열은 파일을 그대로 가리키므로 (복사하지 않음) 여러 워커 프로세스가 OS 페이지 캐시를 공유합니다.
+    """
+
+    def __init__(self, path: str):
+        """
+        Args:
+            path (str): 스냅샷 파일 경로
+        """
+        with open(path, 'rb') as f:
+            stat = os.fstat(f.fileno())
+            self.file_id = (stat.st_ino, stat.st_mtime_ns)
+            self._mmap = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+
+        magic, version, count, created_at = SNAPSHOT_HEADER.unpack_from(self._mmap, 0)
+        if magic != SNAPSHOT_MAGIC or version != SNAPSHOT_VERSION:
+            self._mmap.close()
+            raise ValueError(f"지원하지 않는 CCTV 스냅샷 형식입니다: {path}")
+
+        self.count = count
+        self.created_at = created_at
+
+        offset = SNAPSHOT_HEADER.size
+        self.latitudes = np.frombuffer(self._mmap, dtype='<f4', count=count, offset=offset)
+        offset += 4 * count
+        self.longitudes = np.frombuffer(self._mmap, dtype='<f4', count=count, offset=offset)
+        offset += 4 * count
+        self.string_offsets = np.frombuffer(self._mmap, dtype='<u4', count=2 * count + 1, offset=offset)
+        self.strings_start = offset + 4 * (2 * count + 1)
+
+    def _string(self, position: int) -> str:
+        """문자열 테이블에서 position번째 문자열을 읽습니다."""
+        start = self.strings_start + int(self.string_offsets[position])
+        end = self.strings_start + int(self.string_offsets[position + 1])
+        return self._mmap[start:end].decode('utf-8')
+
+    def get(self, index: int) -> Dict:
+        """
+        index번째 CCTV 정보를 반환합니다.
+
+        Args:
+            index (int): CCTV 인덱스
+
+        Returns:
+            Dict: CCTV 데이터 (cctvname, cctvurl, coordx, coordy)
+        """
+        return {
+            'cctvname': self._string(2 * index),
+            'cctvurl': self._string(2 * index + 1),
+            # float32로 저장하므로 소수점 6자리(약 0.1m)까지만 사용한다.
+            'coordx': round(float(self.longitudes[index]), 6),
+            'coordy': round(float(self.latitudes[index]), 6),
+        }
+
+    def find_nearest(
+        self,
+        latitude: float,
+        longitude: float,
+        search_radius_deg: float = CCTV_SEARCH_RADIUS_DEG
+    ) -> Optional[Dict]:
+        """
+        좌표 주변 ±search_radius_deg 영역에서 가장 가까운 CCTV를 찾습니다.
+        위도로 정렬된 배열을 이진 탐색해 후보를 좁힌 뒤, 후보와의 거리만 계산합니다.
+
+        Args:
+            latitude (float): 기준점의 위도
+            longitude (float): 기준점의 경도
+            search_radius_deg (float): 검색 범위 (위도/경도 ±도)
+
+        Returns:
+            Optional[Dict]: 가장 가까운 CCTV 정보 (distance 포함) 또는 None
+        """
+        start = int(np.searchsorted(self.latitudes, latitude - search_radius_deg, side='left'))
+        end = int(np.searchsorted(self.latitudes, latitude + search_radius_deg, side='right'))
+        if start >= end:
+            return None
+
+        longitudes = self.longitudes[start:end].astype(np.float64)
+        in_range = np.flatnonzero(np.abs(longitudes - longitude) <= search_radius_deg)
+        if in_range.size == 0:
+            return None
+
+        # 가장 가까운 CCTV를 고르는 데는 float32 하버사인(오차 수 cm)으로 충분하고, float64보다 몇 배 빠르다.
+        distances = GeoUtils.calculate_distances(
+            latitude, longitude, self.latitudes[start:end][in_range], longitudes[in_range], dtype=np.float32
+        )
+
+        best = int(np.argmin(distances))
+        cctv = self.get(start + int(in_range[best]))
+        cctv['distance'] = float(distances[best])
+        return cctv
+
+    def close(self) -> None:
+        """메모리 매핑을 닫습니다."""
+        self._mmap.close()
+
+
+_snapshot: Optional[CCTVSnapshot] = None
+
+
+def get_cctv_snapshot() -> Optional[CCTVSnapshot]:
+    """
+    현재 스냅샷을 반환합니다. 파일이 새로 만들어졌으면 다시 메모리 매핑합니다.
+
+    Returns:
+        Optional[CCTVSnapshot]: 스냅샷 또는 파일이 없으면 None
+    """
+    global _snapshot
+    path = get_snapshot_path()
+    try:
+        stat = os.stat(path)
+    except FileNotFoundError:
+        return None
+
+    if _snapshot is None or _snapshot.file_id != (stat.st_ino, stat.st_mtime_ns):
+        try:
+            # 이전 매핑은 닫지 않고 참조가 사라질 때 해제되게 둔다. (진행 중인 조회가 사용 중일 수 있음)
+            _snapshot = CCTVSnapshot(path)
+            print(f"CCTV 스냅샷을 불러왔습니다: {_snapshot.count}개")
+        except (OSError, ValueError, struct.error) as e:
+            print(f"CCTV 스냅샷을 읽을 수 없습니다: {e}")
+            return _snapshot
+    return _snapshot
+
+
+def _snapshot_tiles() -> List[Tuple[float, float, float, float]]:
+    """전국 영역을 요청 단위 칸 (남쪽 위도, 서쪽 경도, 북쪽 위도, 동쪽 경도)으로 나눕니다."""
+    south, west, north, east = KOREA_BOUNDS
+    tiles = []
+    lat = south
+    while lat < north:
+        lon = west
+        while lon < east:
+            tiles.append((lat, lon, min(lat + CCTV_SNAPSHOT_TILE_SIZE_DEG, north), min(lon + CCTV_SNAPSHOT_TILE_SIZE_DEG, east)))
+            lon += CCTV_SNAPSHOT_TILE_SIZE_DEG
+        lat += CCTV_SNAPSHOT_TILE_SIZE_DEG
+    return tiles
+
+
+async def download_nationwide_cctvs(api_client: CCTVApiClient) -> Optional[List[Dict]]:
+    """
+    전국 영역을 칸으로 나눠 동시에 요청해 전체 CCTV 목록을 받습니다.
+
+    Args:
+        api_client (CCTVApiClient): ITS API 클라이언트
+
+    Returns:
+        Optional[List[Dict]]: 중복을 제거한 CCTV 목록 또는 일부 칸의 조회가 실패하면 None
+    """
+    semaphore = asyncio.Semaphore(CCTV_SNAPSHOT_CONCURRENCY)
+
+    async def fetch(bounds: Tuple[float, float, float, float]) -> Tuple[List[Dict], bool]:
+        async with semaphore:
+            return await api_client.fetch_cctv_in_bounds(*bounds)
+
+    results = await asyncio.gather(*[fetch(bounds) for bounds in _snapshot_tiles()], return_exceptions=True)
+
+    cctvs: Dict[Tuple[str, str, float, float], Dict] = {}
+    for result in results:
+        if isinstance(result, Exception) or not result[1]:
+            return None
+        for cctv in result[0]:
+            # 칸 경계에 있는 CCTV는 양쪽 칸에서 모두 받으므로 중복을 제거한다.
+            cctvs.setdefault((cctv['cctvname'], cctv['cctvurl'], cctv['coordx'], cctv['coordy']), cctv)
+    return list(cctvs.values())
+
+
+async def refresh_cctv_snapshot(api_client: CCTVApiClient, force: bool = False) -> bool:
+    """
+    스냅샷이 없거나 오래됐으면 전국 CCTV 목록을 받아 새로 만듭니다.
+    여러 워커 프로세스가 동시에 호출해도 파일 잠금으로 한 프로세스만 받습니다.
+
+    Args:
+        api_client (CCTVApiClient): ITS API 클라이언트
+        force (bool): True이면 스냅샷이 최신이어도 새로 만듭니다.
+
+    Returns:
+        bool: 스냅샷을 새로 만들었는지 여부
+    """
+    path = get_snapshot_path()
+    refresh_seconds = _env_int('CCTV_SNAPSHOT_REFRESH_SECONDS', DEFAULT_CCTV_SNAPSHOT_REFRESH_SECONDS)
+
+    with open(f"{path}.lock", 'w') as lock_file:
+        if not _try_lock(lock_file):
+            # 다른 프로세스가 이미 만들고 있다.
+            return False
+
+        try:
+            if not force and os.path.exists(path) and time.time() - os.path.getmtime(path) < refresh_seconds:
+                return False
+
+            started = time.perf_counter()
+            cctvs = await download_nationwide_cctvs(api_client)
+            if not cctvs:
+                print("전국 CCTV 목록을 받지 못해 기존 스냅샷을 유지합니다.")
+                return False
+
+            count = await asyncio.to_thread(write_snapshot, path, cctvs)
+            print(f"CCTV 스냅샷 생성 완료: {count}개 ({time.perf_counter() - started:.1f}초)")
+            return True
+        finally:
+            _unlock(lock_file)
+
+
+async def run_cctv_snapshot_scheduler(api_client: Optional[CCTVApiClient] = None) -> None:
+    """
+    주기적으로 스냅샷을 확인해, 오래됐으면 새로 만듭니다. (서버가 실행되는 동안 백그라운드 작업으로 실행)
+    전국 다운로드는 한 번에 많은 요청을 보내므로, 사용자 CCTV 조회와 연결 풀을 나눠 쓰지 않도록 별도의 클라이언트(세션)를 사용합니다.
+
+    Args:
+        api_client (CCTVApiClient, optional): ITS API 클라이언트. 생략하면 이 작업 전용 클라이언트를 만들고, 작업이 끝날 때 닫습니다.
+    """
+    own_client = api_client is None
+    api_client = api_client or CCTVApiClient()
+    try:
+        while True:
+            try:
+                await refresh_cctv_snapshot(api_client)
+            except Exception as e:
+                print(f"CCTV 스냅샷 생성 실패: {e}")
+            # 다른 워커가 만들고 있었거나 실패한 경우를 위해, 갱신 주기보다 자주 확인한다.
+            await asyncio.sleep(max(60, _env_int('CCTV_SNAPSHOT_REFRESH_SECONDS', DEFAULT_CCTV_SNAPSHOT_REFRESH_SECONDS) // 24))
+    finally:
+        if own_client:
+            await api_client.close()
+
+
+if __name__ == '__main__':
+    from dotenv import load_dotenv
+
+    load_dotenv()
+
+    async def main():
+        api_client = CCTVApiClient()
+        try:
+            await refresh_cctv_snapshot(api_client, force=True)
+        finally:
+            await api_client.close()
+
+    asyncio.run(main())
@@ -0,0 +1,200 @@
+import asyncio
+import math
+import os
+import sys
+import time
+from typing import Dict, List, Optional, Tuple
+
+# 상위 디렉토리의 모듈들을 import하기 위해 경로 추가
+sys.path.append(os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__)))))
+
+from chatbot.utils.cctv_api import CCTVApiClient, CCTV_SEARCH_RADIUS_DEG
+from chatbot.utils.geo_utils import GeoSpatialIndex
+
+# 지도를 나누는 고정 타일 크기 (도). 0.2도 ≈ 남북 22km x 동서 18km
+CCTV_TILE_SIZE_DEG = 0.2
+
+# CCTV 위치는 거의 바뀌지 않으므로 기본 7일 동안 재사용한다. (CCTV_TILE_TTL_SECONDS 환경 변수로 변경 가능)
+DEFAULT_CCTV_TILE_TTL_SECONDS = 7 * 24 * 60 * 60
+# 이 시간이 지난 타일은 기존 데이터로 바로 응답하고, 백그라운드에서 새로 받아 둔다. (CCTV_TILE_REFRESH_SECONDS)
+DEFAULT_CCTV_TILE_REFRESH_SECONDS = 24 * 60 * 60
+# 일부 type의 조회가 실패한 타일은 이 시간 뒤에 다시 받는다. (CCTV_TILE_RETRY_SECONDS)
+DEFAULT_CCTV_TILE_RETRY_SECONDS = 5 * 60
+
+TileKey = Tuple[int, int]
+
+
+def _env_int(name: str, default: int) -> int:
+    """정수 환경 변수를 읽고, 없거나 잘못된 값이면 기본값을 반환합니다."""
+    try:
+        return int(os.getenv(name, default))
+    except ValueError:
+        return default
+
+
+def tile_key(latitude: float, longitude: float) -> TileKey:
+    """좌표가 속한 타일의 키 (위도 칸 번호, 경도 칸 번호)를 반환합니다."""
+    return math.floor(latitude / CCTV_TILE_SIZE_DEG), math.floor(longitude / CCTV_TILE_SIZE_DEG)
+
+
+def tile_bounds(key: TileKey) -> Tuple[float, float, float, float]:
+    """타일의 경계 좌표 (남쪽 위도, 서쪽 경도, 북쪽 위도, 동쪽 경도)를 반환합니다."""
+    lat_index, lon_index = key
+    return (
+        lat_index * CCTV_TILE_SIZE_DEG,
+        lon_index * CCTV_TILE_SIZE_DEG,
+        (lat_index + 1) * CCTV_TILE_SIZE_DEG,
+        (lon_index + 1) * CCTV_TILE_SIZE_DEG,
+    )
+
+
+def tiles_covering(min_lat: float, min_lon: float, max_lat: float, max_lon: float) -> List[TileKey]:
+    """영역과 겹치는 모든 타일의 키를 반환합니다."""
+    south, west = tile_key(min_lat, min_lon)
+    north, east = tile_key(max_lat, max_lon)
+    return [(lat_index, lon_index) for lat_index in range(south, north + 1) for lon_index in range(west, east + 1)]
+
+
+class CCTVTile:
+    """한 타일 안의 CCTV 목록과, 그 좌표로 만든 공간 색인"""
+
+    __slots__ = ("cctvs", "index", "fetched_at", "refresh_at", "expires_at")
+
+    def __init__(self, cctvs: List[Dict], fetched_at: float, refresh_at: float, expires_at: float):
+        """
+        Args:
+            cctvs (List[Dict]): 타일 안의 CCTV 목록 (coordx, coordy 키를 가져야 함)
+            fetched_at (float): 데이터를 받은 시각 (time.time())
+            refresh_at (float): 이 시각 이후에는 백그라운드에서 새로 받는다.
+            expires_at (float): 이 시각 이후에는 새로 받을 때까지 기다린다.
+        """
+        self.cctvs = cctvs
+        self.index = GeoSpatialIndex.from_points(cctvs)
+        self.fetched_at = fetched_at
+        self.refresh_at = refresh_at
+        self.expires_at = expires_at
+
+
+class CCTVTileCache:
+    """
+    CCTV 목록을 고정 크기 타일 단위로 메모리에 캐시하는 클래스.
+    이미 받은 타일 안의 좌표는 ITS API를 호출하지 않고 타일별 공간 색인(GeoSpatialIndex)으로 가장 가까운 CCTV를 찾습니다.
+    새로 고칠 때가 된 타일은 기존 데이터로 먼저 응답하고 백그라운드에서 다시 받습니다. (stale-while-revalidate)
+    """
+
+    def __init__(self, api_client: CCTVApiClient):
+        """
+        Args:
+            api_client (CCTVApiClient): 타일 데이터를 받을 때 사용할 ITS API 클라이언트
+        """
+        self.api_client = api_client
+        self.tiles: Dict[TileKey, CCTVTile] = {}
+        # 같은 타일을 동시에 받지 않도록, 진행 중인 조회를 공유한다.
+        self._in_flight: Dict[TileKey, "asyncio.Task[Optional[CCTVTile]]"] = {}
+        self._stats = {"hits": 0, "stale_hits": 0, "misses": 0, "api_fetches": 0, "fetch_failures": 0}
+
+    async def get_tile(self, key: TileKey) -> Optional[CCTVTile]:
+        """
+        타일 데이터를 반환합니다. 캐시에 없거나 만료된 타일만 ITS API에서 받습니다.
+
+        Args:
+            key (TileKey): 타일 키
+
+        Returns:
+            Optional[CCTVTile]: 타일 데이터 또는 받지 못했으면 None
+        """
+        tile = self.tiles.get(key)
+        now = time.time()
+
+        if tile is not None and now < tile.refresh_at:
+            self._stats["hits"] += 1
+            return tile
+
+        if tile is not None and now < tile.expires_at:
+            # 기존 데이터로 바로 응답하고, 새 데이터는 백그라운드에서 받는다.
+            self._stats["stale_hits"] += 1
+            self._start_fetch(key)
+            return tile
+
+        self._stats["misses"] += 1
+        # 조회 task는 같은 타일을 기다리는 요청들이 공유하므로, 이 요청이 취소되어도 조회는 취소되지 않도록 shield로 기다린다.
+        fresh = await asyncio.shield(self._start_fetch(key))
+        # 새로 받지 못했으면 만료된 데이터라도 사용한다.
+        return fresh or tile
+
+    def _start_fetch(self, key: TileKey) -> "asyncio.Task[Optional[CCTVTile]]":
+        """타일 조회 작업을 시작하거나, 이미 진행 중인 작업을 반환합니다."""
+        task = self._in_flight.get(key)
+        if task is None:
+            task = asyncio.ensure_future(self._fetch_tile(key))
+            self._in_flight[key] = task
+            task.add_done_callback(lambda _: self._in_flight.pop(key, None))
+        return task
+
+    async def _fetch_tile(self, key: TileKey) -> Optional[CCTVTile]:
+        """ITS API에서 타일 데이터를 받아 색인을 만들고 캐시에 저장합니다."""
+        self._stats["api_fetches"] += 1
+        try:
+            cctvs, complete = await self.api_client.fetch_cctv_in_bounds(*tile_bounds(key))
+        except Exception as e:
+            print(f"CCTV 타일 조회 실패 {key}: {e}")
+            cctvs, complete = [], False
+
+        if not complete:
+            self._stats["fetch_failures"] += 1
+            # 받은 데이터가 전혀 없으면 기존 캐시를 그대로 둔다.
+            if not cctvs:
+                return None
+
+        now = time.time()
+        if complete:
+            refresh_at = now + _env_int("CCTV_TILE_REFRESH_SECONDS", DEFAULT_CCTV_TILE_REFRESH_SECONDS)
+            expires_at = now + _env_int("CCTV_TILE_TTL_SECONDS", DEFAULT_CCTV_TILE_TTL_SECONDS)
+        else:
+            refresh_at = expires_at = now + _env_int("CCTV_TILE_RETRY_SECONDS", DEFAULT_CCTV_TILE_RETRY_SECONDS)
+
+        tile = await asyncio.to_thread(CCTVTile, cctvs, now, refresh_at, expires_at)
+        self.tiles[key] = tile
+        return tile
+
+    async def find_nearest(
+        self,
+        latitude: float,
+        longitude: float,
+        search_radius_deg: float = CCTV_SEARCH_RADIUS_DEG
+    ) -> Optional[Dict]:
+        """
+        좌표에서 가장 가까운 CCTV를 찾습니다.
+        좌표 주변 ±search_radius_deg 영역과 겹치는 타일을 모두 검색합니다.
+
+        Args:
+            latitude (float): 기준점의 위도
+            longitude (float): 기준점의 경도
+            search_radius_deg (float): 검색 범위 (위도/경도 ±도)
+
+        Returns:
+            Optional[Dict]: 가장 가까운 CCTV 정보 (distance 포함) 또는 None
+        """
+        keys = tiles_covering(
+            latitude - search_radius_deg, longitude - search_radius_deg,
+            latitude + search_radius_deg, longitude + search_radius_deg
+        )
+        tiles = await asyncio.gather(*[self.get_tile(key) for key in keys])
+
+        best: Optional[Tuple[float, Dict]] = None
+        for tile in tiles:
+            if tile is None:
+                continue
+            hit = tile.index.nearest(latitude, longitude)
+            if hit is not None and (best is None or hit[1] < best[0]):
+                best = (hit[1], tile.cctvs[hit[0]])
+
+        if best is None:
+            return None
+
+        distance, cctv = best
+        return {**cctv, 'distance': distance}
+
+    def stats(self) -> Dict[str, int]:
+        """캐시 적중/미스 횟수와 ITS API 조회 횟수를 반환합니다."""
+        return {**self._stats, "tiles": len(self.tiles), "cctvs": sum(len(tile.cctvs) for tile in self.tiles.values())}
@@ -6,8 +6,10 @@ from typing import Dict, Optional
 sys.path.append(os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__)))))
 
 from kakaoapi.get_coordinates_by_city import get_coordinates_by_city
+from chatbot.utils.place_alias_index import resolve_place_alias
 from chatbot.utils.cctv_api import CCTVApiClient
-from chatbot.utils.geo_utils import GeoUtils
+from chatbot.utils.cctv_tile_cache import CCTVTileCache
+from chatbot.utils.cctv_snapshot import get_cctv_snapshot
 
 
 class CCTVService:
@@ -16,6 +18,7 @@ class CCTVService:
     def __init__(self):
         """CCTVService 초기화"""
         self.api_client = CCTVApiClient()
+        self.tile_cache = CCTVTileCache(self.api_client)
 
     async def find_nearest_cctv_by_location(self, location_text: str) -> Optional[Dict]:
         """
@@ -39,13 +42,13 @@ class CCTVService:
         
         print(f"검색 대상 지역: {location_name} ({target_lat:.6f}, {target_lon:.6f})")
         
-        # 2. CCTV 목록 가져오기
-        cctvs = await self.api_client.fetch_cctv_list(target_lat, target_lon)
-        if not cctvs:
-            return None
-        
-        # 3. 가장 가까운 CCTV 찾기
-        nearest_cctv = GeoUtils.find_nearest_point(target_lat, target_lon, cctvs)
+        # 2. 가장 가까운 CCTV 찾기
+        # 전국 스냅샷이 있으면 로컬에서 바로 찾고, 없으면 타일 캐시를 사용한다. (캐시에 없는 타일만 ITS API로 조회)
+        snapshot = get_cctv_snapshot()
+        if snapshot is not None:
+            nearest_cctv = snapshot.find_nearest(target_lat, target_lon)
+        else:
+            nearest_cctv = await self.tile_cache.find_nearest(target_lat, target_lon)
         
         if nearest_cctv:
             nearest_cctv['target_location'] = location_name
@@ -65,9 +68,22 @@ class CCTVService:
         Returns:
             Optional[Dict]: 위치 정보 (name, lat, lon) 또는 None
         """
+        # 시도/시군구 이름은 지역명 별칭 색인에서 바로 찾는다.
+        alias_hit = resolve_place_alias(location_text)
+        if alias_hit:
+            print(f"지역명 색인으로 위치 조회 성공: {location_text} -> {alias_hit['sido']} {alias_hit['name']}")
+            return {
+                'name': location_text,
+                'lat': alias_hit['lat'],
+                'lon': alias_hit['lon']
+            }
+
         try:
             # 카카오 API로 좌표 조회
             coordinates = await get_coordinates_by_city(location_text)
+            if not coordinates:
+                print(f"카카오 API에서 위치를 찾을 수 없음: {location_text}")
+                return None
             print(f"카카오 API로 위치 조회 성공: {location_text}")
             return {
                 'name': location_text,
@@ -79,6 +95,23 @@ class CCTVService:
             return None
 
 
+_cctv_service: Optional[CCTVService] = None
+
+
+def get_cctv_service() -> CCTVService:
+    """CCTVService를 처음 사용할 때 한 번만 만들어 재사용합니다. (API 키 조회와 HTTP 연결을 요청마다 반복하지 않음)"""
+    global _cctv_service
+    if _cctv_service is None:
+        _cctv_service = CCTVService()
+    return _cctv_service
+
+
+async def close_cctv_service() -> None:
+    """공유 CCTVService의 HTTP 세션을 닫습니다. (서버 종료 시 호출)"""
+    if _cctv_service is not None:
+        await _cctv_service.api_client.close()
+
+
 # 하위 호환성을 위한 함수 (기존 코드에서 사용 중)
 async def find_nearest_cctv(location_text: str) -> Optional[Dict]:
     """
@@ -90,5 +123,4 @@ async def find_nearest_cctv(location_text: str) -> Optional[Dict]:
     Returns:
         Optional[Dict]: 가장 가까운 CCTV 정보 또는 None
     """
-    service = CCTVService()
-    return await service.find_nearest_cctv_by_location(location_text)
+    return await get_cctv_service().find_nearest_cctv_by_location(location_text)
@@ -0,0 +1,252 @@
+import os
+import re
+import sys
+import threading
+import time
+from collections import OrderedDict, deque
+from typing import Any, Deque, Dict, List, Optional, Tuple
+
+# 상위 디렉토리의 모듈들을 import하기 위해 경로 추가
+sys.path.append(os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__)))))
+
+from repositories.chat_message_repository import ChatMessageRepository
+
+# 채팅마다 메모리에 유지할 최근 메시지 수 (CONVERSATION_WINDOW_MESSAGES 환경 변수로 변경 가능)
+DEFAULT_CONVERSATION_WINDOW_MESSAGES = 12
+# 프롬프트에 넣을 대화 기록의 최대 토큰 수 (CONVERSATION_HISTORY_TOKENS). 넘치는 오래된 대화는 요약으로 옮긴다.
+DEFAULT_CONVERSATION_HISTORY_TOKENS = 250
+# 이전 대화 요약의 최대 토큰 수 (CONVERSATION_SUMMARY_TOKENS)
+DEFAULT_CONVERSATION_SUMMARY_TOKENS = 60
+# 메시지 하나의 최대 토큰 수 (CCTV 결과처럼 긴 메시지는 잘라서 넣는다)
+MAX_MESSAGE_TOKENS = 80
+# 요약에 남길 질문 하나의 최대 글자 수
+SUMMARY_QUESTION_CHARS = 30
+
+# 메모리에 유지할 최대 채팅 수 (CONVERSATION_CACHE_SIZE)와, 이 시간 동안 사용하지 않은 채팅은 지운다. (CONVERSATION_IDLE_SECONDS)
+DEFAULT_CONVERSATION_CACHE_SIZE = 1000
+DEFAULT_CONVERSATION_IDLE_SECONDS = 30 * 60
+
+# 한글/한자/가나는 대략 글자당 1토큰, 그 밖의 문자는 4글자당 1토큰으로 추정한다.
+WIDE_CHARACTER_PATTERN = re.compile(r"[\u1100-\u11ff\u3040-\u30ff\u3130-\u318f\u4e00-\u9fff\uac00-\ud7a3]")
+
+
+def _env_int(name: str, default: int) -> int:
+    """정수 환경 변수를 읽고, 없거나 잘못된 값이면 기본값을 반환합니다."""
+    try:
+        return int(os.getenv(name, default))
+    except ValueError:
+        return default
+
+
+def estimate_tokens(text: str) -> int:
+    """
+    LLM 토큰 수를 대략 추정합니다. (토크나이저 없이 프롬프트 크기를 제한하기 위한 값)
+
+    Args:
+        text (str): 문자열
+
+    Returns:
+        int: 추정 토큰 수
+    """
+    wide = len(WIDE_CHARACTER_PATTERN.findall(text))
+    return wide + (len(text) - wide + 3) // 4
+
+
+def _truncate(text: str, max_tokens: int) -> str:
+    """추정 토큰 수가 max_tokens를 넘지 않도록 문자열 뒤쪽을 자릅니다."""
+    if estimate_tokens(text) <= max_tokens:
+        return text
+    low, high = 0, len(text)
+    while low < high:
+        middle = (low + high + 1) // 2
+        if estimate_tokens(text[:middle]) + 1 <= max_tokens:
+            low = middle
+        else:
+            high = middle - 1
+    return text[:low] + "…"
+
+
+def render_message(role: str, content: str) -> str:
+    """대화 기록 한 줄을 만듭니다. ex) "사용자: 내일 비 와?" """
+    role_name = "사용자" if role == "user" else "챗봇"
+    return f"{role_name}: {_truncate(' '.join(content.split()), MAX_MESSAGE_TOKENS)}"
+
+
+class ConversationWindow:
+    """
+    채팅 하나의 최근 대화를 프롬프트에 넣을 형태로 들고 있는 링 버퍼.
+    메시지 수와 토큰 예산을 넘는 오래된 대화는 버퍼에서 빠지면서 이전 질문 요약으로 옮겨집니다.
+    """
+
+    def __init__(self, messages: List[Dict[str, Any]]):
+        """
+        Args:
+            messages (List[Dict[str, Any]]): DB에서 읽은 최근 메시지 (role, content, 오래된 순서)
+        """
+        # (렌더링한 한 줄, 추정 토큰 수, 역할, 원문)
+        self.lines: Deque[Tuple[str, int, str, str]] = deque()
+        self.line_tokens = 0
+        self.summary_questions: Deque[str] = deque()
+        self.summary = ""
+        self.last_used = time.monotonic()
+        for message in messages:
+            self.add(message["role"], message["content"])
+
+    def add(self, role: str, content: str) -> None:
+        line = render_message(role, content)
+        tokens = estimate_tokens(line)
+        self.lines.append((line, tokens, role, content))
+        self.line_tokens += tokens
+
+        max_messages = _env_int("CONVERSATION_WINDOW_MESSAGES", DEFAULT_CONVERSATION_WINDOW_MESSAGES)
+        budget = _env_int("CONVERSATION_HISTORY_TOKENS", DEFAULT_CONVERSATION_HISTORY_TOKENS)
+        # 가장 최근 메시지는 예산을 넘더라도 남긴다.
+        while len(self.lines) > 1 and (len(self.lines) > max_messages or self.line_tokens > budget):
+            _, old_tokens, old_role, old_content = self.lines.popleft()
+            self.line_tokens -= old_tokens
+            self._roll_into_summary(old_role, old_content)
+
+    def _roll_into_summary(self, role: str, content: str) -> None:
+        """버퍼에서 빠진 대화를 요약에 반영합니다. (지난 날씨 답변은 다시 쓸 일이 없으므로 사용자 질문만 남긴다)"""
+        if role != "user":
+            return
+        question = " ".join(content.split())
+        if len(question) > SUMMARY_QUESTION_CHARS:
+            question = question[:SUMMARY_QUESTION_CHARS] + "…"
+        self.summary_questions.append(question)
+
+        budget = _env_int("CONVERSATION_SUMMARY_TOKENS", DEFAULT_CONVERSATION_SUMMARY_TOKENS)
+        while True:
+            summary = "이전 대화 요약: 사용자가 앞서 물어본 내용 - " + " / ".join(self.summary_questions)
+            if estimate_tokens(summary) <= budget or len(self.summary_questions) == 1:
+                break
+            self.summary_questions.popleft()
+        self.summary = summary
+
+    def render(self, skip_last: int = 0) -> Tuple[str, int]:
+        """
+        프롬프트에 넣을 대화 기록을 만듭니다.
+
+        Args:
+            skip_last (int): 끝에서 제외할 메시지 수 (ex: 프롬프트에 따로 들어가는 현재 질문)
+
+        Returns:
+            Tuple[str, int]: (요약과 최근 대화를 합친 기록, 추정 토큰 수)
+        """
+        lines = list(self.lines)[:len(self.lines) - skip_last] if skip_last else list(self.lines)
+        parts = ([self.summary] if self.summary else []) + [line for line, _, _, _ in lines]
+        tokens = sum(tokens for _, tokens, _, _ in lines) + (estimate_tokens(self.summary) if self.summary else 0)
+        return "\n".join(parts), tokens
+
+
+class ConversationCache:
+    """
+    채팅별 ConversationWindow를 메모리에 두는 캐시.
+    메시지는 SQLite에 바로 저장하고(write-through) 메모리의 창에도 추가하므로, 대화 기록을 만들 때 DB를 다시 읽지 않습니다.
+    오래 사용하지 않았거나(LRU) 일정 시간 동안 대화가 없던 채팅은 메모리에서 지웁니다.
+    """
+
+    def __init__(self):
+        self._windows: "OrderedDict[int, ConversationWindow]" = OrderedDict()
+        self._lock = threading.Lock()
+        self._stats = {"hits": 0, "loads": 0, "db_reads": 0, "writes": 0, "evictions": 0, "history_requests": 0, "history_tokens": 0}
+
+    def _evict(self) -> None:
+        """최대 채팅 수를 넘거나 오래 사용하지 않은 창을 지웁니다. (lock을 잡은 상태에서 호출)"""
+        idle_deadline = time.monotonic() - _env_int("CONVERSATION_IDLE_SECONDS", DEFAULT_CONVERSATION_IDLE_SECONDS)
+        max_chats = _env_int("CONVERSATION_CACHE_SIZE", DEFAULT_CONVERSATION_CACHE_SIZE)
+        while self._windows:
+            oldest_chat_id, oldest = next(iter(self._windows.items()))
+            if len(self._windows) <= max_chats and oldest.last_used >= idle_deadline:
+                break
+            del self._windows[oldest_chat_id]
+            self._stats["evictions"] += 1
+
+    def _window(self, chat_id: int) -> ConversationWindow:
+        """채팅의 창을 반환합니다. 메모리에 없으면 DB에서 최근 메시지를 한 번 읽어 만듭니다."""
+        with self._lock:
+            window = self._windows.get(chat_id)
+            if window:
+                self._windows.move_to_end(chat_id)
+                self._stats["hits"] += 1
+                window.last_used = time.monotonic()
+                return window
+
+        messages = ChatMessageRepository.get_last_n_messages(
+            chat_id, _env_int("CONVERSATION_WINDOW_MESSAGES", DEFAULT_CONVERSATION_WINDOW_MESSAGES)
+        )
+        with self._lock:
+            self._stats["db_reads"] += 1
+            self._stats["loads"] += 1
+            # DB를 읽는 동안 다른 요청이 먼저 창을 만들었으면 그 창을 사용한다.
+            window = self._windows.get(chat_id) or ConversationWindow(messages)
+            self._windows[chat_id] = window
+            self._windows.move_to_end(chat_id)
+            self._evict()
+            return window
+
+    def append(self, chat_id: int, role: str, content: str) -> int:
+        """
+        메시지를 DB에 저장하고, 메모리에 있는 채팅이면 창에도 추가합니다.
+
+        Args:
+            chat_id (int): 채팅 ID
+            role (str): "user" 또는 "assistant"
+            content (str): 메시지 내용
+
+        Returns:
+            int: 저장한 메시지 ID
+        """
+        message_id = ChatMessageRepository.create(chat_id=chat_id, role=role, content=content)
+        with self._lock:
+            self._stats["writes"] += 1
+            # 메모리에 없는 채팅은 다음에 기록이 필요할 때 DB에서 읽으므로(방금 저장한 메시지 포함) 여기서는 만들지 않는다.
+            window = self._windows.get(chat_id)
+            if window:
+                window.add(role, content)
+                window.last_used = time.monotonic()
+                self._windows.move_to_end(chat_id)
+        return message_id
+
+    def history(self, chat_id: int, skip_last: int = 0) -> str:
+        """
+        프롬프트에 넣을 대화 기록(이전 대화 요약 + 토큰 예산 안의 최근 대화)을 반환합니다.
+
+        Args:
+            chat_id (int): 채팅 ID
+            skip_last (int): 끝에서 제외할 메시지 수 (ex: 방금 저장한 현재 질문)
+
+        Returns:
+            str: 대화 기록 (없으면 빈 문자열)
+        """
+        window = self._window(chat_id)
+        with self._lock:
+            history, tokens = window.render(skip_last)
+            self._stats["history_requests"] += 1
+            self._stats["history_tokens"] += tokens
+        return history
+
+    def stats(self) -> Dict[str, Any]:
+        """메모리에 있는 채팅 수, 적중/DB 읽기/저장/제거 횟수, 대화 기록의 평균 추정 토큰 수를 반환합니다."""
+        with self._lock:
+            stats = dict(self._stats)
+            chats = len(self._windows)
+        requests = stats.pop("history_requests")
+        history_tokens = stats.pop("history_tokens")
+        return {
+            "chats": chats,
+            **stats,
+            "history_requests": requests,
+            "avg_history_tokens": round(history_tokens / requests, 1) if requests else 0.0,
+        }
+
+
+_conversation_cache: Optional[ConversationCache] = None
+
+
+def get_conversation_cache() -> ConversationCache:
+    """챗봇 요청이 모두 함께 사용하는 대화 기록 캐시를 반환합니다."""
+    global _conversation_cache
+    if _conversation_cache is None:
+        _conversation_cache = ConversationCache()
+    return _conversation_cache
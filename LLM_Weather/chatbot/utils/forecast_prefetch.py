@@ -0,0 +1,136 @@
+import asyncio
+import os
+import sys
+import time
+from typing import Any, Dict, List, Optional
+
+# 상위 디렉토리의 모듈들을 import하기 위해 경로 추가
+sys.path.append(os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__)))))
+
+from forecast.utils.latlon_to_grid import latlon_to_grid
+
+# 좌표가 있는 요청은 함수 선택 LLM 호출과 동시에 초단기 예보를 미리 조회한다. (FORECAST_PREFETCH=0 으로 끌 수 있음)
+# 단기 예보까지 미리 조회하려면 FORECAST_PREFETCH_SHORT_TERM=1 (기상청 호출이 늘어나므로 기본값은 사용 안 함)
+PREFETCH_FUNCTIONS = {
+    "get_ultra_short_term_weather": "get_ultra_short_term_forecast",
+    "get_short_term_weather": "get_short_term_forecast",
+}
+
+# started: 미리 조회를 시작한 횟수, hits: 모델이 같은 함수/격자를 골라 결과를 사용한 횟수,
+# cancelled: 사용하지 않아 취소한 횟수 (wasted: 그중 이미 조회가 끝나 기상청 호출만 쓴 횟수), saved_ms: 줄어든 대기 시간 합계
+_stats = {"started": 0, "hits": 0, "cancelled": 0, "wasted": 0, "saved_ms": 0.0}
+
+
+def forecast_prefetch_enabled() -> bool:
+    return os.getenv("FORECAST_PREFETCH", "1") != "0"
+
+
+def prefetch_function_names() -> List[str]:
+    """미리 조회할 날씨 함수 목록을 반환합니다."""
+    if os.getenv("FORECAST_PREFETCH_SHORT_TERM", "0") != "0":
+        return ["get_ultra_short_term_weather", "get_short_term_weather"]
+    return ["get_ultra_short_term_weather"]
+
+
+class ForecastPrefetch:
+    """
+    한 턴 동안 사용자 좌표의 예보를 미리 조회해 두는 객체.
+    모델이 같은 격자의 날씨 함수를 고르면 조회 결과를 넘겨주고, 턴이 끝날 때 사용하지 않은 조회는 취소합니다.
+    """
+
+    def __init__(self, forecast_service, latitude: float, longitude: float, function_names: List[str]):
+        """
+        조회를 바로 시작합니다. (실행 중인 이벤트 루프 안에서 생성해야 합니다)
+
+        Args:
+            forecast_service: ForecastService 인스턴스
+            latitude (float): 사용자의 현재 위치 좌표 위도
+            longitude (float): 사용자의 현재 위치 좌표 경도
+            function_names (List[str]): 미리 조회할 날씨 함수명 목록
+        """
+        self.grid = latlon_to_grid(latitude, longitude)
+        self.started_at = time.perf_counter()
+        # 함수명 -> 조회 task. 조회가 끝난 시각은 finished_at에 기록한다.
+        self.tasks: Dict[str, asyncio.Task] = {}
+        self.finished_at: Dict[str, float] = {}
+        for function_name in function_names:
+            fetch = getattr(forecast_service, PREFETCH_FUNCTIONS[function_name])
+            self.tasks[function_name] = asyncio.ensure_future(self._fetch(function_name, fetch(latitude, longitude)))
+            _stats["started"] += 1
+
+    async def _fetch(self, function_name: str, request) -> Dict[str, Any]:
+        try:
+            return await request
+        finally:
+            self.finished_at[function_name] = time.perf_counter()
+
+    async def take(self, function_name: str, latitude: float, longitude: float) -> Optional[Dict[str, Any]]:
+        """
+        미리 조회한 예보가 요청과 같은 함수, 같은 기상청 격자이면 그 결과를 반환합니다. (한 번만 사용할 수 있음)
+
+        Args:
+            function_name (str): 실행할 날씨 함수명
+            latitude (float): 함수가 조회하려는 위치의 위도
+            longitude (float): 함수가 조회하려는 위치의 경도
+
+        Returns:
+            Optional[Dict[str, Any]]: 기상청 API 응답 데이터 또는 사용할 수 없으면 None
+        """
+        if function_name not in self.tasks or latlon_to_grid(latitude, longitude) != self.grid:
+            return None
+        task = self.tasks.pop(function_name)
+        claimed_at = time.perf_counter()
+        try:
+            weather_data = await task
+        except Exception as e:
+            # 미리 조회가 실패하면 평소처럼 다시 조회한다.
+            print(f"예보 미리 조회 실패 ({function_name}): {str(e)}")
+            return None
+        # LLM 호출과 겹친 만큼(조회가 이미 끝났으면 조회 시간 전체)을 줄인 시간으로 본다.
+        saved_ms = (min(claimed_at, self.finished_at.get(function_name, claimed_at)) - self.started_at) * 1000
+        _stats["hits"] += 1
+        _stats["saved_ms"] += saved_ms
+        print(f"Forecast prefetch hit: {function_name} {self.grid}, {saved_ms:.0f}ms saved")
+        return weather_data
+
+    def cancel(self) -> None:
+        """사용하지 않은 조회를 취소합니다. (턴이 끝날 때 호출)"""
+        for function_name, task in self.tasks.items():
+            _stats["cancelled"] += 1
+            if task.done():
+                _stats["wasted"] += 1
+                if not task.cancelled():
+                    task.exception()  # 조회 실패가 "never retrieved" 경고로 남지 않도록 확인만 한다.
+            else:
+                task.cancel()
+        self.tasks.clear()
+
+
+def start_forecast_prefetch(forecast_service, latitude: Optional[float], longitude: Optional[float]) -> Optional[ForecastPrefetch]:
+    """
+    좌표가 있으면 예보를 미리 조회하기 시작합니다.
+
+    Args:
+        forecast_service: ForecastService 인스턴스
+        latitude (float, optional): 사용자의 현재 위치 좌표 위도
+        longitude (float, optional): 사용자의 현재 위치 좌표 경도
+
+    Returns:
+        Optional[ForecastPrefetch]: 미리 조회 객체 또는 좌표가 없거나 꺼져 있으면 None
+    """
+    if not latitude or not longitude or not forecast_prefetch_enabled():
+        return None
+    return ForecastPrefetch(forecast_service, latitude, longitude, prefetch_function_names())
+
+
+def forecast_prefetch_stats() -> Dict[str, Any]:
+    """미리 조회 횟수, 적중률, 줄어든 대기 시간(합계, 적중당 평균)을 반환합니다."""
+    return {
+        "started": _stats["started"],
+        "hits": _stats["hits"],
+        "cancelled": _stats["cancelled"],
+        "wasted": _stats["wasted"],
+        "hit_rate": round(_stats["hits"] / _stats["started"], 3) if _stats["started"] else 0.0,
+        "saved_ms": round(_stats["saved_ms"]),
+        "avg_saved_ms": round(_stats["saved_ms"] / _stats["hits"], 1) if _stats["hits"] else 0.0,
+    }
@@ -1,13 +1,31 @@
+import asyncio
 import os
 import sys
-from typing import Dict, Any, Optional
+import time
+from typing import Dict, Any, List, Optional, Tuple
 
 # 상위 디렉토리의 모듈들을 import하기 위해 경로 추가
 sys.path.append(os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__)))))
 
 from chatbot.utils.cctv_utils import find_nearest_cctv
 from chatbot.utils.weather_formatter import format_weather_data
+from chatbot.utils.weather_renderer import render_weather_answer
 from chatbot.utils.location_handler import LocationHandler
+from chatbot.utils.forecast_prefetch import ForecastPrefetch
+from forecast.utils.latlon_to_grid import latlon_to_grid
+
+WEATHER_FUNCTIONS = ["get_ultra_short_term_weather", "get_short_term_weather"]
+
+# 한 턴에서 여러 함수를 함께 실행할 때 기다리는 최대 시간(초). (FUNCTION_CALL_DEADLINE_SECONDS 환경 변수로 변경 가능)
+DEFAULT_FUNCTION_CALL_DEADLINE_SECONDS = 8.0
+
+
+def _env_float(name: str, default: float) -> float:
+    """실수 환경 변수를 읽고, 없거나 잘못된 값이면 기본값을 반환합니다."""
+    try:
+        return float(os.getenv(name, default))
+    except ValueError:
+        return default
 
 
 class FunctionExecutor:
@@ -44,7 +62,7 @@ class FunctionExecutor:
         try:
             if function_name == "get_cctv_info":
                 return await self._execute_cctv_info(args)
-            elif function_name in ["get_ultra_short_term_weather", "get_short_term_weather"]:
+            elif function_name in WEATHER_FUNCTIONS:
                 return await self._execute_weather_function(function_name, args, latitude, longitude)
             else:
                 return f"지원하지 않는 함수입니다: {function_name}"
@@ -52,6 +70,58 @@ class FunctionExecutor:
         except Exception as e:
             return f"함수 실행 중 오류가 발생했습니다: {str(e)}"
     
+    async def execute_functions(
+        self, 
+        function_calls: List[Tuple[str, Dict[str, Any]]], 
+        latitude: Optional[float] = None, 
+        longitude: Optional[float] = None,
+        deadline_seconds: Optional[float] = None,
+        prefetch: Optional[ForecastPrefetch] = None
+    ) -> List[Dict[str, Any]]:
+        """
+        한 응답에 들어 있는 여러 function call을 동시에 실행합니다. (ex: "서울이랑 부산 날씨 비교해줘", "날씨랑 CCTV 보여줘")
+        모든 함수는 같은 마감 시간 안에서 실행되며, 마감 시간을 넘긴 함수는 취소하고 시간 초과 결과를 반환합니다.
+        
+        Args:
+            function_calls (List[Tuple[str, Dict[str, Any]]]): (함수명, 인자) 목록
+            latitude (float, optional): 사용자의 현재 위치 좌표 위도
+            longitude (float, optional): 사용자의 현재 위치 좌표 경도
+            deadline_seconds (float, optional): 턴 전체의 마감 시간(초). 생략하면 FUNCTION_CALL_DEADLINE_SECONDS
+            prefetch (ForecastPrefetch, optional): 함수 선택과 동시에 미리 조회한 예보
+            
+        Returns:
+            List[Dict[str, Any]]: function_calls와 같은 순서의 결과 목록.
+                각 항목은 name, args, result (함수 실행 결과), ok (정상 실행 여부), timed_out (마감 시간 초과 여부), elapsed_ms
+        """
+        if deadline_seconds is None:
+            deadline_seconds = _env_float("FUNCTION_CALL_DEADLINE_SECONDS", DEFAULT_FUNCTION_CALL_DEADLINE_SECONDS)
+        started_at = time.perf_counter()
+        
+        async def run(function_name: str, args: Dict[str, Any]) -> Dict[str, Any]:
+            outcome = {"name": function_name, "args": args, "ok": False, "timed_out": False}
+            try:
+                # 모든 함수가 동시에 시작하므로, 같은 timeout이 곧 턴 전체의 마감 시간이다.
+                outcome.update(await asyncio.wait_for(self._execute_one(function_name, args, latitude, longitude, prefetch), timeout=deadline_seconds))
+            except asyncio.TimeoutError:
+                print(f"함수 실행 시간 초과 ({deadline_seconds:g}초): {function_name} {args}")
+                outcome.update(result=f"시간 초과로 결과를 가져오지 못했습니다: {function_name}", timed_out=True)
+            except Exception as e:
+                outcome.update(result=f"함수 실행 중 오류가 발생했습니다: {str(e)}")
+            outcome["elapsed_ms"] = int((time.perf_counter() - started_at) * 1000)
+            return outcome
+        
+        return list(await asyncio.gather(*(run(function_name, args) for function_name, args in function_calls)))
+    
+    async def _execute_one(self, function_name: str, args: Dict[str, Any], latitude: Optional[float], longitude: Optional[float], prefetch: Optional[ForecastPrefetch] = None) -> Dict[str, Any]:
+        """execute_functions에서 함수 하나를 실행하고 {"result", "ok"}를 반환합니다."""
+        if function_name in WEATHER_FUNCTIONS:
+            weather = await self._execute_weather_function(function_name, args, latitude, longitude, detailed=True, template=False, prefetch=prefetch)
+            return {"result": weather["result"], "ok": weather["forecast_ok"]}
+        if function_name == "get_cctv_info":
+            result = await self._execute_cctv_info(args)
+            return {"result": result, "ok": result.startswith("cctv_data:")}
+        return {"result": f"지원하지 않는 함수입니다: {function_name}", "ok": False}
+    
     async def _execute_cctv_info(self, args: Dict[str, Any]) -> str:
         """CCTV 정보 조회 함수를 실행합니다."""
         location = args.get("location", "")
@@ -65,14 +135,72 @@ class FunctionExecutor:
         else:
             return "해당 지역에서 CCTV를 찾을 수 없습니다."
     
+    async def resolve_forecast_grid(
+        self, 
+        args: Dict[str, Any], 
+        latitude: Optional[float] = None, 
+        longitude: Optional[float] = None
+    ) -> Optional[Tuple[int, int]]:
+        """
+        날씨 함수 인자의 지역을 기상청 격자 좌표로 변환합니다. (예보를 조회하지 않음)
+        
+        Args:
+            args (dict): 함수 인자
+            latitude (float, optional): 사용자의 현재 위치 좌표 위도
+            longitude (float, optional): 사용자의 현재 위치 좌표 경도
+            
+        Returns:
+            Optional[Tuple[int, int]]: (nx, ny) 또는 지역을 찾지 못하면 None
+        """
+        try:
+            location_info = await LocationHandler.resolve_location(
+                args.get("location", ""), latitude, longitude, self.forecast_service
+            )
+        except Exception as e:
+            print(f"격자 좌표 변환 실패: {str(e)}")
+            return None
+        return latlon_to_grid(location_info["lat"], location_info["lon"])
+    
+    async def execute_weather_function_with_answer(
+        self, 
+        function_name: str, 
+        args: Dict[str, Any], 
+        latitude: Optional[float] = None, 
+        longitude: Optional[float] = None,
+        render_answer: bool = True,
+        prefetch: Optional[ForecastPrefetch] = None
+    ) -> Dict[str, Any]:
+        """
+        날씨 조회 함수를 실행하고, 함수 결과와 함께 템플릿 답변(render_weather_answer)을 만듭니다.
+        
+        Args:
+            function_name (str): 실행할 날씨 함수명
+            args (dict): 함수 인자
+            latitude (float, optional): 사용자의 현재 위치 좌표 위도
+            longitude (float, optional): 사용자의 현재 위치 좌표 경도
+            render_answer (bool): False이면 템플릿 답변을 만들지 않음
+            prefetch (ForecastPrefetch, optional): 함수 선택과 동시에 미리 조회한 예보 (같은 격자이면 다시 조회하지 않음)
+            
+        Returns:
+            dict: result (execute_function과 같은 함수 실행 결과), answer (템플릿 답변 또는 만들 수 없으면 None),
+                forecast_ok (예보를 정상적으로 받았는지 여부)
+        """
+        try:
+            return await self._execute_weather_function(function_name, args, latitude, longitude, detailed=True, template=render_answer, prefetch=prefetch)
+        except Exception as e:
+            return {"result": f"함수 실행 중 오류가 발생했습니다: {str(e)}", "answer": None, "forecast_ok": False}
+    
     async def _execute_weather_function(
         self, 
         function_name: str, 
         args: Dict[str, Any], 
         latitude: Optional[float] = None, 
-        longitude: Optional[float] = None
-    ) -> str:
-        """날씨 조회 함수를 실행합니다."""
+        longitude: Optional[float] = None,
+        detailed: bool = False,
+        template: bool = True,
+        prefetch: Optional[ForecastPrefetch] = None
+    ):
+        """날씨 조회 함수를 실행합니다. (detailed이면 {"result", "answer", "forecast_ok"}를 반환)"""
         location = args.get("location", "")
         hours = args.get("hours", 1 if function_name == "get_ultra_short_term_weather" else 24)
         
@@ -87,20 +215,34 @@ class FunctionExecutor:
             )
         except ValueError as e:
             print(f"location ValueError: {str(e)}")
-            return str(e)
+            return {"result": str(e), "answer": None, "forecast_ok": False} if detailed else str(e)
         except Exception as e:
             print(f"location 예상치 못한 오류: {str(e)}")
-            return f"위치 처리 중 오류가 발생했습니다: {str(e)}"
+            error = f"위치 처리 중 오류가 발생했습니다: {str(e)}"
+            return {"result": error, "answer": None, "forecast_ok": False} if detailed else error
         
         lat, lon = location_info["lat"], location_info["lon"]
 
+        # 미리 조회한 같은 격자의 예보가 있으면 그 결과를 사용
+        weather_data = await prefetch.take(function_name, lat, lon) if prefetch else None
+
         # Function calling에 따라 적절한 메서드 호출
         if function_name == "get_ultra_short_term_weather":
-            weather_data = await self.forecast_service.get_ultra_short_term_forecast(lat, lon)
-            formatted_data = format_weather_data(weather_data, location, "초단기", hours, full_day)
+            forecast_type = "초단기"
+            weather_data = weather_data or await self.forecast_service.get_ultra_short_term_forecast(lat, lon)
         else:
-            weather_data = await self.forecast_service.get_short_term_forecast(lat, lon)
-            formatted_data = format_weather_data(weather_data, location, "단기", hours, full_day) 
+            forecast_type = "단기"
+            weather_data = weather_data or await self.forecast_service.get_short_term_forecast(lat, lon)
+        formatted_data = format_weather_data(weather_data, location, forecast_type, hours, full_day)
 
         print(formatted_data)
-        return formatted_data
\ No newline at end of file
+        if not detailed:
+            return formatted_data
+        
+        answer = None
+        if template:
+            # 현재 위치 요청이면 좌표로 찾은 지역명을 답변에 사용
+            location_name = location or weather_data.get("location") or "현재 위치"
+            answer = render_weather_answer(weather_data, location_name, forecast_type, int(hours), full_day)
+        forecast_ok = weather_data.get("requestCode") == "200" and bool(weather_data.get("items"))
+        return {"result": formatted_data, "answer": answer, "forecast_ok": forecast_ok}
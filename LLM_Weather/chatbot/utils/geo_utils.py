@@ -1,14 +1,224 @@
 import math
-from typing import Dict, List, Optional
+import os
+import sys
+from typing import Dict, List, Optional, Sequence, Tuple, Union
+
+import numpy as np
+from scipy.spatial import cKDTree
+
+# 상위 디렉토리의 모듈들을 import하기 위해 경로 추가
+sys.path.append(os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__)))))
+
+from utils.geo_math import EARTH_RADIUS_KM, to_unit_vectors
+
+# 거리 계산 방식
+HAVERSINE = 'haversine'
+EQUIRECTANGULAR = 'equirectangular'
+DEGREES_TO_RADIANS = math.pi / 180
+
+ArrayLike = Union[float, Sequence[float], np.ndarray]
+
+
+class GeoSpatialIndex:
+    """
+    좌표 목록을 단위 구 위의 KD-tree로 한 번 색인해 두고, 가까운 지점을 빠르게 찾는 클래스.
+    조회 결과는 원본 목록의 인덱스와 거리(km)만 반환하므로, 지점 데이터를 복사하지 않습니다.
+    (단위 구 위의 직선 거리는 구면 거리와 순서가 같으므로, 가장 가까운 지점은 하버사인 기준과 같습니다.)
+    """
+
+    def __init__(self, latitudes: Sequence[float], longitudes: Sequence[float], positions: Optional[Sequence[int]] = None):
+        """
+        Args:
+            latitudes (Sequence[float]): 지점들의 위도
+            longitudes (Sequence[float]): 지점들의 경도
+            positions (Optional[Sequence[int]]): 각 지점의 원본 목록 인덱스 (생략하면 0부터 순서대로)
+        """
+        latitudes = np.asarray(latitudes, dtype=np.float64)
+        longitudes = np.asarray(longitudes, dtype=np.float64)
+        self.positions = np.arange(len(latitudes)) if positions is None else np.asarray(positions, dtype=np.int64)
+        self.tree = cKDTree(to_unit_vectors(latitudes, longitudes)) if len(latitudes) else None
+
+    @classmethod
+    def from_points(cls, points: List[Dict], lat_key: str = 'coordy', lon_key: str = 'coordx') -> "GeoSpatialIndex":
+        """
+        지점 딕셔너리 목록으로 색인을 만듭니다. 좌표가 없거나 잘못된 지점은 건너뜁니다.
+
+        Args:
+            points (List[Dict]): 지점 목록
+            lat_key (str): 위도 키
+            lon_key (str): 경도 키
+
+        Returns:
+            GeoSpatialIndex: 원본 목록의 인덱스를 반환하는 색인
+        """
+        latitudes, longitudes, positions = [], [], []
+        for position, point in enumerate(points):
+            try:
+                latitude, longitude = float(point[lat_key]), float(point[lon_key])
+            except (KeyError, ValueError, TypeError) as e:
+                print(f"지점 좌표 오류: {e}")
+                continue
+            latitudes.append(latitude)
+            longitudes.append(longitude)
+            positions.append(position)
+        return cls(latitudes, longitudes, positions)
+
+    def __len__(self) -> int:
+        return len(self.positions)
+
+    @staticmethod
+    def _chords_to_km(chords: np.ndarray) -> np.ndarray:
+        """단위 구 위의 직선 거리를 지표면 거리(km)로 변환합니다."""
+        return 2 * EARTH_RADIUS_KM * np.arcsin(np.minimum(1.0, np.asarray(chords) / 2))
+
+    @staticmethod
+    def _query_vector(latitude: float, longitude: float) -> np.ndarray:
+        """기준점을 단위 구 좌표로 변환합니다."""
+        return to_unit_vectors(np.array([latitude]), np.array([longitude]))[0]
+
+    def nearest(self, latitude: float, longitude: float) -> Optional[Tuple[int, float]]:
+        """
+        기준점에서 가장 가까운 지점을 찾습니다.
+
+        Args:
+            latitude (float): 기준점의 위도
+            longitude (float): 기준점의 경도
+
+        Returns:
+            Optional[Tuple[int, float]]: (원본 목록 인덱스, 거리 km) 또는 색인이 비어 있으면 None
+        """
+        if self.tree is None:
+            return None
+        chord, index = self.tree.query(self._query_vector(latitude, longitude))
+        return int(self.positions[index]), float(self._chords_to_km(chord))
+
+    def k_nearest(self, latitude: float, longitude: float, k: int) -> List[Tuple[int, float]]:
+        """
+        기준점에서 가까운 순서로 k개의 지점을 찾습니다.
+
+        Args:
+            latitude (float): 기준점의 위도
+            longitude (float): 기준점의 경도
+            k (int): 찾을 지점 수
+
+        Returns:
+            List[Tuple[int, float]]: 가까운 순서의 (원본 목록 인덱스, 거리 km) 리스트 (지점 수가 k보다 적으면 전체)
+        """
+        if self.tree is None or k <= 0:
+            return []
+        chords, indices = self.tree.query(self._query_vector(latitude, longitude), k=min(k, len(self)))
+        chords, indices = np.atleast_1d(chords), np.atleast_1d(indices)
+        return [(int(self.positions[index]), float(distance)) for index, distance in zip(indices, self._chords_to_km(chords))]
+
+    def within_radius(self, latitude: float, longitude: float, radius_km: float) -> List[Tuple[int, float]]:
+        """
+        기준점에서 radius_km 안에 있는 모든 지점을 찾습니다.
+
+        Args:
+            latitude (float): 기준점의 위도
+            longitude (float): 기준점의 경도
+            radius_km (float): 검색 반경 (km)
+
+        Returns:
+            List[Tuple[int, float]]: 가까운 순서의 (원본 목록 인덱스, 거리 km) 리스트
+        """
+        if self.tree is None or radius_km < 0:
+            return []
+        query = self._query_vector(latitude, longitude)
+        # 지표면 거리를 단위 구 위의 직선 거리로 바꿔 검색한다.
+        chord_radius = 2 * math.sin(min(radius_km / EARTH_RADIUS_KM, math.pi) / 2)
+        indices = np.array(self.tree.query_ball_point(query, chord_radius), dtype=np.int64)
+        if indices.size == 0:
+            return []
+        distances = self._chords_to_km(np.linalg.norm(self.tree.data[indices] - query, axis=1))
+        order = np.argsort(distances, kind='stable')
+        return [(int(self.positions[indices[i]]), float(distances[i])) for i in order]
 
 
 class GeoUtils:
     """지리적 계산을 위한 유틸리티 클래스"""
     
+    @staticmethod
+    def calculate_distances(
+        lat1: ArrayLike,
+        lon1: ArrayLike,
+        lat2: ArrayLike,
+        lon2: ArrayLike,
+        method: str = HAVERSINE,
+        dtype: type = np.float64
+    ) -> np.ndarray:
+        """
+        여러 좌표 쌍의 거리를 한 번에 계산합니다. 입력은 numpy 브로드캐스팅 규칙을 따르므로,
+        기준점 하나와 지점 배열(일대다)이나 (N, 1)과 (M,) 배열(다대다)을 그대로 넘길 수 있습니다.
+        
+        Args:
+            lat1 (ArrayLike): 첫 번째 지점(들)의 위도
+            lon1 (ArrayLike): 첫 번째 지점(들)의 경도
+            lat2 (ArrayLike): 두 번째 지점(들)의 위도
+            lon2 (ArrayLike): 두 번째 지점(들)의 경도
+            method (str): 'haversine'(하버사인 공식) 또는 'equirectangular'(수십 km 이내에서 오차가 작은 근사식, 더 빠름)
+            dtype (type): 삼각함수 계산에 사용할 자료형 (np.float64 또는 np.float32).
+                np.float32는 수 배 빠르며, 좌표 차이를 float64로 먼저 구하므로 오차는 수 cm 수준입니다.
+            
+        Returns:
+            np.ndarray: 브로드캐스팅한 모양의 거리 배열 (km)
+        """
+        # 좌표 차이는 float64로 먼저 계산한다. (float32로 계산해도 위도/경도 반올림 오차가 거리에 그대로 남지 않음)
+        lat1 = np.asarray(lat1, dtype=np.float64)
+        lat2 = np.asarray(lat2, dtype=np.float64)
+        dlat = ((lat2 - lat1) * DEGREES_TO_RADIANS).astype(dtype, copy=False)
+        dlon = ((np.asarray(lon2, dtype=np.float64) - np.asarray(lon1, dtype=np.float64)) * DEGREES_TO_RADIANS).astype(dtype, copy=False)
+        radius = dtype(EARTH_RADIUS_KM)
+        
+        if method == EQUIRECTANGULAR:
+            x = dlon * np.cos(((lat1 + lat2) * (DEGREES_TO_RADIANS / 2)).astype(dtype, copy=False))
+            return radius * np.sqrt(x * x + dlat * dlat)
+        
+        if method != HAVERSINE:
+            raise ValueError(f"지원하지 않는 거리 계산 방식입니다: {method}")
+        
+        # 하버사인 공식
+        sin_dlat = np.sin(dlat / 2)
+        sin_dlon = np.sin(dlon / 2)
+        cos_lat1 = np.cos((lat1 * DEGREES_TO_RADIANS).astype(dtype, copy=False))
+        cos_lat2 = np.cos((lat2 * DEGREES_TO_RADIANS).astype(dtype, copy=False))
+        a = sin_dlat * sin_dlat + cos_lat1 * cos_lat2 * (sin_dlon * sin_dlon)
+        return 2 * radius * np.arcsin(np.sqrt(np.minimum(a, 1)))
+    
+    @staticmethod
+    def distance_matrix(
+        lats_a: ArrayLike,
+        lons_a: ArrayLike,
+        lats_b: ArrayLike,
+        lons_b: ArrayLike,
+        method: str = HAVERSINE,
+        dtype: type = np.float64
+    ) -> np.ndarray:
+        """
+        두 지점 집합 사이의 모든 거리를 계산합니다. (ex: 사용자 x CCTV, 격자 x 관측소)
+        
+        Args:
+            lats_a (ArrayLike): 첫 번째 집합의 위도 (N개)
+            lons_a (ArrayLike): 첫 번째 집합의 경도 (N개)
+            lats_b (ArrayLike): 두 번째 집합의 위도 (M개)
+            lons_b (ArrayLike): 두 번째 집합의 경도 (M개)
+            method (str): 'haversine' 또는 'equirectangular'
+            dtype (type): 삼각함수 계산에 사용할 자료형 (np.float64 또는 np.float32)
+            
+        Returns:
+            np.ndarray: (N, M) 모양의 거리 배열 (km)
+        """
+        return GeoUtils.calculate_distances(
+            np.asarray(lats_a)[:, np.newaxis], np.asarray(lons_a)[:, np.newaxis],
+            np.asarray(lats_b)[np.newaxis, :], np.asarray(lons_b)[np.newaxis, :],
+            method, dtype
+        )
+    
     @staticmethod
     def calculate_distance(lat1: float, lon1: float, lat2: float, lon2: float) -> float:
         """
         두 좌표 간의 거리를 계산합니다 (하버사인 공식 사용).
+        여러 지점의 거리를 구할 때는 calculate_distances로 한 번에 계산합니다.
         
         Args:
             lat1 (float): 첫 번째 지점의 위도
@@ -19,22 +229,7 @@ class GeoUtils:
         Returns:
             float: 두 지점 간의 거리 (km)
         """
-        # 지구 반지름 (km)
-        R = 6371
-        
-        # 위도와 경도를 라디안으로 변환
-        dlat = math.radians(lat2 - lat1)
-        dlon = math.radians(lon2 - lon1)
-        
-        # 하버사인 공식
-        a = (math.sin(dlat/2) * math.sin(dlat/2) + 
-             math.cos(math.radians(lat1)) * math.cos(math.radians(lat2)) * 
-             math.sin(dlon/2) * math.sin(dlon/2))
-        
-        c = 2 * math.atan2(math.sqrt(a), math.sqrt(1-a))
-        distance = R * c
-        
-        return distance
+        return float(GeoUtils.calculate_distances(lat1, lon1, lat2, lon2))
     
     @staticmethod
     def find_nearest_point(
@@ -56,27 +251,38 @@ class GeoUtils:
         if not points:
             return None
         
-        nearest_point = None
-        min_distance = float('inf')
-        
-        for point in points:
+        latitudes, longitudes, positions = [], [], []
+        for position, point in enumerate(points):
             try:
-                point_lat = point['coordy']
-                point_lon = point['coordx']
-                
-                # 거리 계산
-                distance = GeoUtils.calculate_distance(target_lat, target_lon, point_lat, point_lon)
-                
-                if distance < min_distance:
-                    min_distance = distance
-                    nearest_point = point.copy()
-                    nearest_point['distance'] = distance
-                    
+                point_lat = float(point['coordy'])
+                point_lon = float(point['coordx'])
             except (KeyError, ValueError, TypeError) as e:
                 print(f"지점 거리 계산 오류: {e}")
                 continue
+            latitudes.append(point_lat)
+            longitudes.append(point_lon)
+            positions.append(position)
         
-        return nearest_point
+        if not positions:
+            return None
+        
+        # 모든 지점의 거리를 한 번에 계산하고, 가장 가까운 지점만 복사한다.
+        distances = GeoUtils.calculate_distances(target_lat, target_lon, latitudes, longitudes)
+        best = int(np.argmin(distances))
+        return {**points[positions[best]], 'distance': float(distances[best])}
+    
+    @staticmethod
+    def build_spatial_index(points: List[Dict]) -> GeoSpatialIndex:
+        """
+        지점 목록으로 공간 색인을 만듭니다. 같은 목록에서 여러 번 검색할 때는 find_nearest_point 대신 이 색인을 사용합니다.
+        
+        Args:
+            points (List[Dict]): 검색할 지점들의 목록 (각 지점은 coordx, coordy 키를 가져야 함)
+            
+        Returns:
+            GeoSpatialIndex: nearest, k_nearest, within_radius 조회를 지원하는 색인
+        """
+        return GeoSpatialIndex.from_points(points)
     
     @staticmethod
     def is_valid_coordinates(latitude: float, longitude: float) -> bool:
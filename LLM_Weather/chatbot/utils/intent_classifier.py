@@ -0,0 +1,358 @@
+import math
+import os
+import re
+import sys
+from datetime import datetime, timedelta
+from typing import Any, Dict, List, Optional, Tuple
+
+# 상위 디렉토리의 모듈들을 import하기 위해 경로 추가
+sys.path.append(os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__)))))
+
+from chatbot.utils.place_alias_index import resolve_place_alias
+
+# 이 값 이상의 확신도로 분류된 질문만 LLM 없이 바로 함수를 호출한다. (INTENT_CONFIDENCE_THRESHOLD 환경 변수로 변경 가능)
+DEFAULT_INTENT_CONFIDENCE_THRESHOLD = 0.8
+
+ULTRA_SHORT_TERM_FUNCTION = "get_ultra_short_term_weather"
+SHORT_TERM_FUNCTION = "get_short_term_weather"
+CCTV_FUNCTION = "get_cctv_info"
+
+# 초단기 예보가 다루는 최대 시간, 단기 예보가 다루는 최대 시간
+ULTRA_SHORT_TERM_MAX_HOURS = 6
+SHORT_TERM_MAX_HOURS = 120
+
+# 날씨 이외의 판단이 필요하거나, 함수가 제공하지 않는 정보를 묻는 표현 (LLM으로 넘긴다)
+OPEN_ENDED_PATTERN = re.compile(
+    r"왜|추천|뭐\s*입|입을|입고|옷|해도\s*(?:될|돼|되)|할까|갈까|가도|괜찮|비교|차이|어느|어디가|"
+    r"이랑|랑\s|하고\s|그리고|vs|미세\s*먼지|황사|자외선|꽃가루|일출|일몰|해\s*뜨|물때|파도|수온|세차|빨래|"
+    r"어제|그제|그저께|지난|주말|이번\s*주|다음\s*주|[월화수목금토일]요일|며칠|언제"
+)
+
+# CCTV / 도로 상황 질문
+CCTV_PATTERN = re.compile(r"cctv|씨씨티비|씨씨tv|교통\s*상황|도로\s*상황|길\s*상황|도로\s*영상|실시간\s*영상|막히")
+
+# 날씨 명사 (띄어쓰기 없이 붙어 있어도 지운다)
+WEATHER_NOUNS = [
+    "일기예보", "강수확률", "강수량", "날씨", "기온", "온도", "기상", "예보", "강수", "습도", "풍속", "바람", "우산", "우비",
+]
+# 날씨 서술어 토큰 (ex: 추워, 더울까, 맑아요, 흐려?)
+WEATHER_ADJECTIVE_PATTERN = re.compile(r"(?:더[워웠울운]|덥|추[워웠울운]|춥|쌀쌀|선선|따뜻|포근|맑|흐[려리릴림])[가-힣]{0,4}")
+# 비/눈 + 조사 + 동사 토큰 (ex: 비, 비가, 비와, 눈와요, 비가올까)
+PRECIPITATION_VERBS = (
+    "와|와요|오나|오나요|오니|올까|올까요|오려나|오는지|온대|온대요|온다|옴|오냐|"
+    "내려|내려요|내리나|내리나요|내리니|내릴까|내릴까요|내리는지|소식|예보"
+)
+PRECIPITATION_PATTERN = re.compile(rf"(?:비|눈|소나기)(?:가|는|도|이|은)?(?:{PRECIPITATION_VERBS})?")
+PRECIPITATION_VERB_PATTERN = re.compile(rf"(?:{PRECIPITATION_VERBS})")
+
+# 질문이 주로 묻는 날씨 요소. LLM 답변은 같은 예보라도 질문에 맞춰 달라지므로 답변 캐시 키에 함께 넣는다.
+# (요소가 없거나 여러 개이면 GENERAL_ASPECT)
+PRECIPITATION_ASPECT = "precipitation"
+TEMPERATURE_ASPECT = "temperature"
+SKY_ASPECT = "sky"
+WIND_ASPECT = "wind"
+HUMIDITY_ASPECT = "humidity"
+GENERAL_ASPECT = "general"
+ASPECT_NOUNS = {
+    "강수확률": PRECIPITATION_ASPECT, "강수량": PRECIPITATION_ASPECT, "강수": PRECIPITATION_ASPECT,
+    "우산": PRECIPITATION_ASPECT, "우비": PRECIPITATION_ASPECT,
+    "기온": TEMPERATURE_ASPECT, "온도": TEMPERATURE_ASPECT,
+    "바람": WIND_ASPECT, "풍속": WIND_ASPECT, "습도": HUMIDITY_ASPECT,
+}
+SKY_ADJECTIVE_PATTERN = re.compile(r"맑|흐[려리릴림]")
+
+# 질문 끝에 붙는 말 (위치 추출에서 제외)
+STOP_PHRASES = ["알려주세요", "알려줘요", "알려줄래", "알려줘", "보여줘", "어떤가요", "어때요", "어떄", "어때", "궁금해요", "궁금해"]
+STOP_TOKENS = {
+    "어떤지", "어떻게", "어떨까", "돼", "돼요", "될까", "알려", "줘", "좀", "확인", "확인해줘", "해줘", "정보", "있어", "있어요",
+    "있나", "있나요", "있을까", "있을까요", "필요해", "필요해요", "필요할까", "필요", "챙겨야", "챙겨야돼", "챙겨야해", "해",
+    "많이", "정도", "얼마나", "몇", "도", "야", "요", "는", "은", "이", "가", "에", "거야", "건가", "건가요", "나요", "니", "지",
+    "까", "봐줘", "말해줘", "어떻게돼", "부탁해", "아", "혹시", "그럼", "지금", "현재",
+}
+# 현재 위치를 뜻하는 표현
+CURRENT_LOCATION_PATTERN = re.compile(r"현재\s*위치|내\s*위치|우리\s*동네|이\s*동네|여기|이곳|이쪽|밖에|바깥")
+# 지역명 뒤에 붙을 수 있는 조사 (지역명이 색인에 없을 때만 떼어 보고 다시 찾는다)
+PLACE_PARTICLE_PATTERN = re.compile(r"(?:에서는|에서|에는|에도|은|는|이|가|에|의|도|쪽|지역|근처)$")
+
+# 시간 표현
+DAY_OFFSETS = {"내일모레": 2, "오늘": 0, "금일": 0, "내일": 1, "낼": 1, "명일": 1, "모레": 2, "글피": 3}
+DAY_PATTERN = re.compile("|".join(sorted(DAY_OFFSETS, key=len, reverse=True)))
+DAYS_LATER_PATTERN = re.compile(r"(\d+)\s*일\s*(?:후|뒤)")
+PART_OF_DAY_HOURS = {"새벽": 5, "아침": 8, "오전": 9, "점심": 12, "정오": 12, "낮": 12, "오후": 15, "저녁": 18, "밤": 21}
+PART_OF_DAY_PATTERN = re.compile(r"새벽|아침|오전|점심|정오|오후|저녁|(?<![가-힣])(?:낮|밤)(?=$|[^가-힣]|에|엔)")
+CLOCK_PATTERN = re.compile(r"(오전|오후|아침|저녁|밤|새벽)?\s*(\d{1,2})\s*시(?!간)\s*(?:(\d{1,2})\s*분|반)?")
+HOURS_LATER_PATTERN = re.compile(r"(\d{1,3})\s*시간\s*(?:후|뒤|이따|있다가)?")
+SOON_PATTERNS = [(re.compile(r"잠시\s*후|조금\s*있다가|곧"), 1), (re.compile(r"이따가?|나중에|좀\s*있다가"), 3)]
+NOW_PATTERN = re.compile(r"지금|현재|당장")
+FULL_DAY_PATTERN = re.compile(r"하루\s*종일|온\s*종일|종일|하루\s*전체|전체적으로|하루|24\s*시간")
+
+_stats = {"classified": 0, "fast_path": 0}
+
+
+def _env_float(name: str, default: float) -> float:
+    """실수 환경 변수를 읽고, 없거나 잘못된 값이면 기본값을 반환합니다."""
+    try:
+        return float(os.getenv(name, default))
+    except ValueError:
+        return default
+
+
+def _result(function_name: Optional[str], args: Dict[str, Any], confidence: float, reason: str, aspect: str = GENERAL_ASPECT) -> Dict[str, Any]:
+    """분류 결과 딕셔너리를 만듭니다."""
+    return {"function_name": function_name, "args": args, "confidence": confidence, "reason": reason, "aspect": aspect}
+
+
+def _weather_aspect(text: str) -> str:
+    """
+    날씨 질문이 주로 묻는 요소를 찾습니다. ex) "내일 비 와?" -> precipitation, "내일 기온 어때?" -> temperature
+
+    Args:
+        text (str): 소문자/공백 정리를 마친 질문
+
+    Returns:
+        str: PRECIPITATION_ASPECT 등 요소 이름. 요소가 없거나 여러 개이면 GENERAL_ASPECT
+    """
+    aspects = {aspect for noun, aspect in ASPECT_NOUNS.items() if noun in text}
+    for token in text.split():
+        if PRECIPITATION_PATTERN.fullmatch(token):
+            aspects.add(PRECIPITATION_ASPECT)
+        elif WEATHER_ADJECTIVE_PATTERN.fullmatch(token):
+            aspects.add(SKY_ASPECT if SKY_ADJECTIVE_PATTERN.match(token) else TEMPERATURE_ASPECT)
+    return aspects.pop() if len(aspects) == 1 else GENERAL_ASPECT
+
+
+def _remove(pattern: "re.Pattern[str]", text: str) -> str:
+    """패턴에 맞는 부분을 공백으로 바꿉니다."""
+    return pattern.sub(" ", text)
+
+
+def _parse_time(text: str, now: datetime) -> Tuple[Optional[Dict[str, Any]], str, Optional[str]]:
+    """
+    질문에서 시간 표현을 찾아 몇 시간 후의 예보인지 계산합니다.
+
+    Args:
+        text (str): 정규화한 질문
+        now (datetime): 현재 시각
+
+    Returns:
+        Tuple[Optional[Dict[str, Any]], str, Optional[str]]:
+            ({"hours", "full_day"} 또는 시간 표현이 없으면 None, 시간 표현을 지운 질문, 해석할 수 없을 때의 이유)
+            시각에 오전/오후가 없어 어느 쪽인지 분명하지 않으면 {"ambiguous": True}가 함께 들어갑니다.
+    """
+    day_offset = None
+    days_later = DAYS_LATER_PATTERN.search(text)
+    if days_later:
+        day_offset = int(days_later.group(1))
+        text = _remove(DAYS_LATER_PATTERN, text)
+    days = {DAY_OFFSETS[match] for match in DAY_PATTERN.findall(text)}
+    if len(days) > 1 or (days and day_offset is not None):
+        return None, text, "날짜 표현이 여러 개입니다"
+    if days:
+        day_offset = days.pop()
+        text = _remove(DAY_PATTERN, text)
+
+    hours_later = HOURS_LATER_PATTERN.search(text)
+    if hours_later:
+        if day_offset is not None:
+            return None, text, "날짜와 'N시간 후'가 함께 있습니다"
+        text = _remove(HOURS_LATER_PATTERN, text)
+        return {"hours": int(hours_later.group(1)), "full_day": False}, text, None
+
+    full_day = bool(FULL_DAY_PATTERN.search(text))
+    text = _remove(FULL_DAY_PATTERN, text)
+
+    hour = None
+    ambiguous = False
+    clock = CLOCK_PATTERN.search(text)
+    if clock:
+        part, hour = clock.group(1), int(clock.group(2))
+        if hour > 24 or (part and hour > 12):
+            return None, text, "시각을 해석할 수 없습니다"
+        if part in ("오후", "저녁", "밤") and hour < 12:
+            hour += 12
+        elif part in ("오전", "아침", "새벽") and hour == 12:
+            hour = 0
+        elif not part and hour <= 12 and day_offset is None:
+            # "3시"처럼 오전/오후가 없으면, 지금 이후의 가장 가까운 시각으로 본다.
+            if hour <= now.hour:
+                hour += 12 if hour < 12 else 0
+        elif not part and 0 < hour <= 12:
+            # "내일 3시"는 대화에서는 대부분 오후 3시를 뜻하지만 새벽일 수도 있으므로, 바로 처리하지 않고 LLM에 맡긴다.
+            ambiguous = True
+        text = _remove(CLOCK_PATTERN, text)
+        text = _remove(PART_OF_DAY_PATTERN, text)
+    else:
+        parts = set(PART_OF_DAY_PATTERN.findall(text))
+        if len(parts) > 1:
+            return None, text, "시간대 표현이 여러 개입니다"
+        if parts:
+            hour = PART_OF_DAY_HOURS[parts.pop()]
+            text = _remove(PART_OF_DAY_PATTERN, text)
+
+    if hour is None:
+        for pattern, soon_hours in SOON_PATTERNS:
+            if pattern.search(text):
+                if day_offset is not None:
+                    return None, text, "날짜와 '이따'가 함께 있습니다"
+                text = _remove(pattern, text)
+                return {"hours": soon_hours, "full_day": False}, text, None
+
+    has_now = bool(NOW_PATTERN.search(text))
+
+    if hour is not None:
+        target = now.replace(hour=0, minute=0, second=0, microsecond=0) + timedelta(days=day_offset or 0, hours=hour)
+        hours = math.ceil((target - now).total_seconds() / 3600)
+        if hours <= 0:
+            return None, text, "지나간 시각입니다"
+        if ambiguous:
+            return {"hours": hours, "full_day": full_day, "ambiguous": True}, text, None
+        return {"hours": hours, "full_day": full_day}, text, None
+
+    if day_offset is not None or full_day:
+        # "내일 날씨"처럼 날짜만 있으면 하루 전체 예보를 보여 준다.
+        # hours는 그 날짜 안의 시각을 가리키도록 한다. (오늘이면 오늘 23시까지 남은 시간)
+        hours = 24 * day_offset if day_offset else max(1, 23 - now.hour)
+        return {"hours": hours, "full_day": True}, text, None
+
+    if has_now:
+        return {"hours": 1, "full_day": False}, text, None
+
+    return None, text, None
+
+
+def _extract_location(text: str) -> Tuple[Optional[str], List[str]]:
+    """
+    시간/날씨 표현을 지운 질문에서 지역명을 찾습니다.
+
+    Args:
+        text (str): 시간/날씨 표현을 지운 질문
+
+    Returns:
+        Tuple[Optional[str], List[str]]: (지역명 또는 현재 위치이면 "", 지역명으로 해석하지 못한 토큰 목록)
+            지역명이 여러 개이면 지역명 대신 None을 반환합니다.
+    """
+    text = _remove(CURRENT_LOCATION_PATTERN, text)
+    for phrase in STOP_PHRASES:
+        text = text.replace(phrase, " ")
+
+    places, unknown = [], []
+    tokens = [token for token in text.split() if token not in STOP_TOKENS and not PRECIPITATION_VERB_PATTERN.fullmatch(token)]
+    position = 0
+    while position < len(tokens):
+        token = tokens[position]
+        # "부산 중구"처럼 뒤 토큰만으로는 찾을 수 없고 합쳐야 하나의 지역이 되는 경우를 먼저 확인한다.
+        if position + 1 < len(tokens):
+            second = PLACE_PARTICLE_PATTERN.sub("", tokens[position + 1]) or tokens[position + 1]
+            if not resolve_place_alias(second) and resolve_place_alias(f"{token} {second}"):
+                places.append(f"{token} {second}")
+                position += 2
+                continue
+        position += 1
+        if resolve_place_alias(token):
+            places.append(token)
+            continue
+        stripped = PLACE_PARTICLE_PATTERN.sub("", token)
+        if stripped and stripped != token and resolve_place_alias(stripped):
+            places.append(stripped)
+            continue
+        unknown.append(token)
+
+    if len(places) > 1:
+        # "서울 노원구"처럼 합쳐서 하나의 지역이면 합친다.
+        joined = " ".join(places)
+        return (joined if resolve_place_alias(joined) else None), unknown
+    return (places[0] if places else ""), unknown
+
+
+def classify_intent(message: str, now: Optional[datetime] = None) -> Dict[str, Any]:
+    """
+    패턴과 시간/지역 표현 사전으로 질문의 의도를 분류하고, 호출할 함수와 인자를 추정합니다.
+    LLM의 function calling과 같은 함수/인자를 만들며, 확신할 수 없는 질문은 낮은 확신도를 반환합니다.
+
+    Args:
+        message (str): 사용자 질문. ex) "날씨 어때?", "내일 비 와?", "춘천 날씨"
+        now (Optional[datetime]): 현재 시각 (생략하면 datetime.now())
+
+    Returns:
+        Dict[str, Any]: function_name (함수명 또는 None), args (함수 인자), confidence (0~1), reason (판단 근거),
+            aspect (날씨 질문이 주로 묻는 요소. ex) "precipitation", "temperature", "general")
+    """
+    now = now or datetime.now()
+    text = " ".join(message.lower().replace("?", " ").replace("!", " ").replace(".", " ").replace("~", " ").split())
+
+    if not text or len(text) > 40:
+        return _result(None, {}, 0.0, "질문이 비어 있거나 깁니다")
+    if OPEN_ENDED_PATTERN.search(text):
+        return _result(None, {}, 0.2, "날씨 조회 외의 판단이 필요한 질문입니다")
+
+    if CCTV_PATTERN.search(text):
+        location, unknown = _extract_location(_remove(CCTV_PATTERN, text))
+        if not location or unknown:
+            return _result(CCTV_FUNCTION, {"location": location or ""}, 0.4, "CCTV를 찾을 지역이 분명하지 않습니다")
+        return _result(CCTV_FUNCTION, {"location": location}, 0.9, "CCTV 질문")
+
+    tokens = text.split()
+    is_weather = (
+        any(noun in text for noun in WEATHER_NOUNS)
+        or any(WEATHER_ADJECTIVE_PATTERN.fullmatch(token) or PRECIPITATION_PATTERN.fullmatch(token) for token in tokens)
+    )
+    if not is_weather:
+        return _result(None, {}, 0.0, "날씨 질문이 아닙니다")
+    aspect = _weather_aspect(text)
+
+    time_info, text, time_error = _parse_time(text, now)
+    if time_error:
+        return _result(None, {}, 0.3, time_error)
+
+    for noun in WEATHER_NOUNS:
+        text = text.replace(noun, " ")
+    text = " ".join(
+        token for token in text.split()
+        if not (WEATHER_ADJECTIVE_PATTERN.fullmatch(token) or PRECIPITATION_PATTERN.fullmatch(token))
+    )
+
+    location, unknown = _extract_location(text)
+    if location is None:
+        return _result(None, {}, 0.3, "지역이 여러 곳입니다")
+    if unknown:
+        return _result(None, {}, 0.5, f"해석하지 못한 표현이 있습니다: {' '.join(unknown)}")
+
+    time_info = time_info or {"hours": 1, "full_day": False}
+    hours = time_info["hours"]
+    if hours > SHORT_TERM_MAX_HOURS:
+        return _result(None, {}, 0.3, "단기 예보 범위(5일)를 벗어납니다")
+
+    function_name = (
+        ULTRA_SHORT_TERM_FUNCTION
+        if hours <= ULTRA_SHORT_TERM_MAX_HOURS and not time_info["full_day"]
+        else SHORT_TERM_FUNCTION
+    )
+    args = {"location": location, "hours": hours, "full_day": time_info["full_day"]}
+    if time_info.get("ambiguous"):
+        return _result(function_name, args, 0.6, "오전/오후가 분명하지 않은 시각입니다", aspect)
+    return _result(function_name, args, 0.9, "날씨 질문", aspect)
+
+
+def match_fast_path_intent(message: str, now: Optional[datetime] = None) -> Optional[Dict[str, Any]]:
+    """
+    LLM 없이 바로 함수를 호출해도 될 만큼 확실한 질문이면 분류 결과를 반환합니다.
+
+    Args:
+        message (str): 사용자 질문
+        now (Optional[datetime]): 현재 시각 (생략하면 datetime.now())
+
+    Returns:
+        Optional[Dict[str, Any]]: classify_intent의 결과 또는 확신도가 기준보다 낮으면 None
+    """
+    intent = classify_intent(message, now)
+    _stats["classified"] += 1
+    if intent["function_name"] and intent["confidence"] >= _env_float("INTENT_CONFIDENCE_THRESHOLD", DEFAULT_INTENT_CONFIDENCE_THRESHOLD):
+        _stats["fast_path"] += 1
+        return intent
+    return None
+
+
+def intent_stats() -> Dict[str, Any]:
+    """분류한 질문 수와 LLM 없이 처리한 질문 수(적중률)를 반환합니다."""
+    classified = _stats["classified"]
+    return {**_stats, "hit_rate": round(_stats["fast_path"] / classified, 3) if classified else 0.0}
@@ -0,0 +1,178 @@
+import asyncio
+import os
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, AsyncIterator, Callable, Dict, Optional
+
+# Gemini 동기(REST) 호출을 동시에 실행할 최대 스레드 수 (GEMINI_MAX_CONCURRENCY 환경 변수로 변경 가능)
+DEFAULT_GEMINI_MAX_CONCURRENCY = 8
+
+
+def _env_int(name: str, default: int) -> int:
+    """정수 환경 변수를 읽고, 없거나 잘못된 값이면 기본값을 반환합니다."""
+    try:
+        return int(os.getenv(name, default))
+    except ValueError:
+        return default
+
+
+class LLMCallRunner:
+    """
+    동기 LLM SDK 호출(ex: GenerativeModel.generate_content)을 크기가 제한된 스레드 풀에서 실행하는 클래스.
+    호출을 기다리는 동안 이벤트 루프가 다른 요청을 처리할 수 있고, 동시에 실행되는 호출 수는 스레드 수로 제한됩니다.
+    실행 중인 호출 수와 스레드를 기다린 시간(queue wait)을 기록합니다.
+    """
+
+    def __init__(self, max_concurrency: int, name: str = "llm"):
+        """
+        Args:
+            max_concurrency (int): 동시에 실행할 최대 호출 수 (스레드 수)
+            name (str): 스레드 이름 접두사와 로그에 사용할 이름
+        """
+        self.name = name
+        self.max_concurrency = max_concurrency
+        self.executor = ThreadPoolExecutor(max_workers=max_concurrency, thread_name_prefix=name)
+        self._lock = threading.Lock()
+        self._stats = {
+            "calls": 0,
+            "errors": 0,
+            "queued": 0,
+            "in_flight": 0,
+            "peak_in_flight": 0,
+            "peak_queued": 0,
+            "queue_wait_seconds": 0.0,
+            "max_queue_wait_seconds": 0.0,
+            "call_seconds": 0.0,
+        }
+
+    def _run(self, submitted_at: float, function: Callable[..., Any], args: tuple, kwargs: Dict[str, Any]) -> Any:
+        """스레드 풀에서 호출을 실행하고 대기/실행 시간을 기록합니다."""
+        started_at = time.perf_counter()
+        queue_wait = started_at - submitted_at
+        with self._lock:
+            self._stats["queued"] -= 1
+            self._stats["in_flight"] += 1
+            self._stats["peak_in_flight"] = max(self._stats["peak_in_flight"], self._stats["in_flight"])
+            self._stats["queue_wait_seconds"] += queue_wait
+            self._stats["max_queue_wait_seconds"] = max(self._stats["max_queue_wait_seconds"], queue_wait)
+
+        failed = False
+        try:
+            return function(*args, **kwargs)
+        except Exception:
+            failed = True
+            raise
+        finally:
+            with self._lock:
+                self._stats["in_flight"] -= 1
+                self._stats["calls"] += 1
+                self._stats["errors"] += failed
+                self._stats["call_seconds"] += time.perf_counter() - started_at
+
+    async def run(self, function: Callable[..., Any], *args: Any, **kwargs: Any) -> Any:
+        """
+        동기 함수를 스레드 풀에서 실행하고 결과를 기다립니다.
+
+        Args:
+            function (Callable[..., Any]): 실행할 동기 함수
+            *args (Any): 함수의 위치 인자
+            **kwargs (Any): 함수의 키워드 인자
+
+        Returns:
+            Any: 함수의 반환값 (함수가 던진 예외는 그대로 전달됩니다)
+        """
+        with self._lock:
+            self._stats["queued"] += 1
+            self._stats["peak_queued"] = max(self._stats["peak_queued"], self._stats["queued"])
+
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(self.executor, self._run, time.perf_counter(), function, args, kwargs)
+
+    async def stream(self, function: Callable[..., Any], *args: Any, **kwargs: Any) -> AsyncIterator[Any]:
+        """
+        동기 함수가 반환한 이터러블(ex: generate_content(..., stream=True))을 스레드 풀에서 순회하며, 항목이 도착하는 즉시 하나씩 전달합니다.
+        순회가 끝날 때까지 스레드 하나를 사용하며(동시 실행 수 제한에 포함), 중간에 순회를 멈추면 다음 항목을 받은 뒤 스레드도 멈춥니다.
+
+        Args:
+            function (Callable[..., Any]): 이터러블을 반환하는 동기 함수
+            *args (Any): 함수의 위치 인자
+            **kwargs (Any): 함수의 키워드 인자
+
+        Yields:
+            Any: 이터러블의 항목 (함수나 순회 중 발생한 예외는 그대로 전달됩니다)
+        """
+        loop = asyncio.get_running_loop()
+        queue: "asyncio.Queue[tuple]" = asyncio.Queue()
+        stopped = threading.Event()
+
+        def put(kind: str, value: Any = None) -> None:
+            try:
+                loop.call_soon_threadsafe(queue.put_nowait, (kind, value))
+            except RuntimeError:
+                # 이벤트 루프가 이미 닫힌 경우
+                stopped.set()
+
+        def consume() -> None:
+            try:
+                for item in function(*args, **kwargs):
+                    if stopped.is_set():
+                        return
+                    put("item", item)
+            except Exception as e:
+                put("error", e)
+                raise
+            finally:
+                put("done")
+
+        task = asyncio.ensure_future(self.run(consume))
+        # 순회 중 발생한 예외는 큐로 전달하므로, 작업의 예외는 여기서 확인만 한다.
+        task.add_done_callback(lambda finished: finished.cancelled() or finished.exception())
+        try:
+            while True:
+                kind, value = await queue.get()
+                if kind == "error":
+                    raise value
+                if kind == "done":
+                    break
+                yield value
+        finally:
+            stopped.set()
+
+    def stats(self) -> Dict[str, Any]:
+        """
+        호출 지표를 반환합니다.
+
+        Returns:
+            Dict[str, Any]: 완료된 호출 수, 오류 수, 현재 실행/대기 중인 호출 수와 최댓값, 평균/최대 대기 시간(ms), 평균 실행 시간(ms)
+        """
+        with self._lock:
+            stats = dict(self._stats)
+        started = max(1, stats["calls"] + stats["in_flight"])
+        return {
+            "max_concurrency": self.max_concurrency,
+            "calls": stats["calls"],
+            "errors": stats["errors"],
+            "in_flight": stats["in_flight"],
+            "queued": stats["queued"],
+            "peak_in_flight": stats["peak_in_flight"],
+            "peak_queued": stats["peak_queued"],
+            "avg_queue_wait_ms": round(stats["queue_wait_seconds"] / started * 1000, 1),
+            "max_queue_wait_ms": round(stats["max_queue_wait_seconds"] * 1000, 1),
+            "avg_call_ms": round(stats["call_seconds"] / max(1, stats["calls"]) * 1000, 1),
+        }
+
+    def shutdown(self) -> None:
+        """스레드 풀을 종료합니다. (실행 중인 호출은 끝까지 실행)"""
+        self.executor.shutdown(wait=False, cancel_futures=True)
+
+
+_gemini_runner: Optional[LLMCallRunner] = None
+
+
+def get_gemini_runner() -> LLMCallRunner:
+    """Gemini 호출이 모두 함께 사용하는 스레드 풀 실행기를 반환합니다."""
+    global _gemini_runner
+    if _gemini_runner is None:
+        _gemini_runner = LLMCallRunner(_env_int("GEMINI_MAX_CONCURRENCY", DEFAULT_GEMINI_MAX_CONCURRENCY), name="gemini")
+    return _gemini_runner
@@ -7,6 +7,7 @@ sys.path.append(os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(
 
 from kakaoapi.get_city_from_coordinates import get_city_from_coordinates
 from kakaoapi.get_coordinates_by_city import get_coordinates_by_city
+from chatbot.utils.place_alias_index import resolve_place_alias
 
 
 class LocationHandler:
@@ -85,10 +86,19 @@ class LocationHandler:
                     }
             raise ValueError("위치 정보를 찾을 수 없습니다. 현재 위치를 허용하거나 구체적인 지역명을 입력해주세요.")
         else:
+            # 시도/시군구 이름은 지역명 별칭 색인에서 바로 찾는다.
+            alias_hit = resolve_place_alias(location)
+            if alias_hit:
+                return {
+                    "lat": alias_hit["lat"],
+                    "lon": alias_hit["lon"]
+                }
+
             # 지역명으로 좌표 검색
             region_hit = await get_coordinates_by_city(location)
             if region_hit:
                 return {
                     "lat": region_hit["latitude"],
                     "lon": region_hit["longitude"]
-                }
\ No newline at end of file
+                }
+            raise ValueError(f"'{location}' 지역을 찾을 수 없습니다. 구체적인 지역명을 입력해주세요.")
@@ -0,0 +1,195 @@
+import csv
+import os
+import re
+import sys
+from collections import defaultdict
+from typing import Any, Dict, List, Optional, Tuple
+
+# 상위 디렉토리의 모듈들을 import하기 위해 경로 추가
+sys.path.append(os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__)))))
+
+from kakaoapi.offline_reverse_geocoder import load_admin_areas
+
+SIDO_DATASET_PATH = os.path.join(
+    os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__)))), "kakaoapi", "data", "sido_v1.csv"
+)
+
+# 지역명 뒤에 붙을 수 있는 행정구역 접미사 (정규화된 형태: 공백/기호 제거, 소문자)
+PLACE_SUFFIXES = {
+    "", "특별시", "광역시", "특별자치시", "특별자치도", "특별자치", "시", "군", "구", "도",
+    "si", "gun", "gu", "do", "city", "county", "district", "province",
+    "metropolitancity", "specialcity", "specialselfgoverningcity", "specialselfgoverningprovince",
+}
+
+# 정규화할 때 지울 문자 (공백, 하이픈, 마침표 등)
+NON_NAME_CHARACTERS = re.compile(r"[\s\-_.,·()]+")
+
+# 같은 키가 시도와 시군구에 모두 있으면 시도를 우선한다. (ex: "광주" -> 광주광역시, "제주" -> 제주특별자치도)
+SIDO_LEVEL = 0
+SIGUNGU_LEVEL = 1
+
+
+class _TrieNode:
+    """지역명 trie의 노드"""
+
+    __slots__ = ("children", "areas")
+
+    def __init__(self):
+        self.children: Dict[str, "_TrieNode"] = {}
+        self.areas: List[Dict[str, Any]] = []
+
+
+class PlaceAliasIndex:
+    """
+    한국어/로마자 지역명 별칭을 정규화된 trie로 색인해, 카카오 API 호출 없이 지역 좌표를 찾는 클래스.
+    "서울", "서울시", "서울특별시", "Seoul", "Chuncheon-si", "노원", "부산 중구"처럼 시도/시군구 수준의 지역명을 처리하며,
+    동 이름("효자동")이나 여러 지역에 있는 이름("중구", "고성")처럼 찾을 수 없거나 모호한 경우 None을 반환합니다.
+    """
+
+    def __init__(self, sido_rows: List[Dict[str, Any]], sigungu_rows: List[Dict[str, Any]]):
+        """
+        Args:
+            sido_rows (List[Dict[str, Any]]): 시도 데이터 (kakaoapi/data/sido_v1.csv).
+            sigungu_rows (List[Dict[str, Any]]): 시군구 대표 좌표 데이터 (kakaoapi/data/admin_areas_v1.csv).
+        """
+        self.root = _TrieNode()
+
+        for row in sido_rows:
+            area = {
+                "name": row["name"],
+                "sido": row["sido"],
+                "lat": float(row["latitude"]),
+                "lon": float(row["longitude"]),
+                "level": SIDO_LEVEL,
+            }
+            aliases = [row["name"]] + [alias for alias in (row["aliases"] + "|" + row["name_en"]).split("|") if alias]
+            for alias in aliases:
+                self._insert(alias, area)
+
+        # 일반구가 있는 시처럼 대표 좌표가 여러 개인 지역은 평균 좌표를 사용한다.
+        points: Dict[Tuple[str, str], List[Dict[str, Any]]] = defaultdict(list)
+        for row in sigungu_rows:
+            # 세종특별자치시는 시군구가 없으므로 시도 데이터로 처리한다.
+            if row["sigungu"]:
+                points[(row["sido"], row["name"])].append(row)
+
+        for (sido, name), rows in points.items():
+            area = {
+                "name": name,
+                "sido": sido,
+                "lat": sum(row["latitude"] for row in rows) / len(rows),
+                "lon": sum(row["longitude"] for row in rows) / len(rows),
+                "level": SIGUNGU_LEVEL,
+            }
+            for alias in {name, rows[0]["name_en"]}:
+                self._insert(alias, area)
+
+    @staticmethod
+    def normalize(text: str) -> str:
+        """
+        지역명을 색인 키 형태로 정규화합니다. (공백/기호 제거, 영문 소문자)
+
+        Args:
+            text (str): 지역명
+
+        Returns:
+            str: 정규화된 지역명. ex) "Chuncheon-si" -> "chuncheonsi"
+        """
+        return NON_NAME_CHARACTERS.sub("", text or "").lower()
+
+    def _insert(self, alias: str, area: Dict[str, Any]) -> None:
+        """별칭을 trie에 추가합니다."""
+        node = self.root
+        for char in self.normalize(alias):
+            node = node.children.setdefault(char, _TrieNode())
+        if area not in node.areas:
+            node.areas.append(area)
+
+    def _prefix_matches(self, key: str, start: int = 0) -> List[Tuple[int, List[Dict[str, Any]]]]:
+        """key[start:]의 접두사 중 색인된 별칭을 (끝 위치, 지역 리스트)로 긴 것부터 반환합니다."""
+        matches = []
+        node = self.root
+        for position in range(start, len(key)):
+            node = node.children.get(key[position])
+            if node is None:
+                break
+            if node.areas:
+                matches.append((position + 1, node.areas))
+        return matches[::-1]
+
+    def _match_whole(self, key: str, start: int = 0) -> List[Dict[str, Any]]:
+        """key[start:]가 '별칭 + 행정구역 접미사' 형태이면 해당 지역들을 반환합니다."""
+        for end, areas in self._prefix_matches(key, start):
+            if key[end:] in PLACE_SUFFIXES:
+                return areas
+        return []
+
+    def resolve(self, location: str) -> Optional[Dict[str, Any]]:
+        """
+        지역명을 대표 지역과 좌표로 변환합니다.
+
+        Args:
+            location (str): 지역명. ex) "서울", "Seoul", "서울시", "노원", "부산 중구"
+
+        Returns:
+            Optional[Dict[str, Any]]: 지역 정보 (name, sido, lat, lon) 또는 찾을 수 없거나 모호하면 None
+        """
+        key = self.normalize(location)
+        if not key:
+            return None
+
+        candidates = self._match_whole(key)
+
+        # "부산 중구"처럼 시도 + 시군구로 된 경우, 시도 안의 시군구로 좁힌다.
+        if not candidates:
+            for end, sido_areas in self._prefix_matches(key):
+                sidos = {area["sido"] for area in sido_areas if area["level"] == SIDO_LEVEL}
+                # 시도 이름 뒤의 접미사("서울시 노원구", "부산광역시 중구")를 건너뛴다.
+                for suffix in sorted(PLACE_SUFFIXES, key=len, reverse=True):
+                    if sidos and key.startswith(suffix, end):
+                        candidates = [
+                            area for area in self._match_whole(key, end + len(suffix))
+                            if area["level"] == SIGUNGU_LEVEL and area["sido"] in sidos
+                        ]
+                        if candidates:
+                            break
+                if candidates:
+                    break
+
+        if not candidates:
+            return None
+
+        top_level = min(area["level"] for area in candidates)
+        candidates = [area for area in candidates if area["level"] == top_level]
+        if len(candidates) > 1:
+            print(f"지역명이 모호합니다: {location} -> {[area['sido'] + ' ' + area['name'] for area in candidates]}")
+            return None
+
+        area = candidates[0]
+        return {"name": area["name"], "sido": area["sido"], "lat": area["lat"], "lon": area["lon"]}
+
+
+_place_alias_index: Optional[PlaceAliasIndex] = None
+
+
+def get_place_alias_index() -> PlaceAliasIndex:
+    """지역명 별칭 색인을 처음 사용할 때 한 번만 만들어 재사용합니다."""
+    global _place_alias_index
+    if _place_alias_index is None:
+        with open(SIDO_DATASET_PATH, encoding="utf-8") as f:
+            sido_rows = list(csv.DictReader(f))
+        _place_alias_index = PlaceAliasIndex(sido_rows, load_admin_areas())
+    return _place_alias_index
+
+
+def resolve_place_alias(location: str) -> Optional[Dict[str, Any]]:
+    """
+    카카오 API를 호출하지 않고 지역명 별칭 색인에서 지역 좌표를 찾습니다.
+
+    Args:
+        location (str): 지역명
+
+    Returns:
+        Optional[Dict[str, Any]]: 지역 정보 (name, sido, lat, lon) 또는 None
+    """
+    return get_place_alias_index().resolve(location)
@@ -1,4 +1,6 @@
+import json
 from datetime import datetime
+from typing import Any, Dict, List
 
 class PromptBuilder:
     """챗봇용 프롬프트를 생성하는 클래스"""
@@ -97,4 +99,44 @@ Instructions:"""
 2. 간결하고 명확한 답변 (150자 이내)
 3. 친근한 말투
 4. 현재 시각을 고려하여 "오늘", "내일" 등의 표현을 정확히 해석
-""" 
\ No newline at end of file
+"""
+    
+    @staticmethod
+    def build_multi_function_response_prompt(user_message: str, function_results: List[Dict[str, Any]]) -> str:
+        """
+        한 턴에서 함께 실행한 여러 function call의 결과를 한 번에 전달해 최종 응답을 생성하기 위한 프롬프트를 생성합니다.
+        
+        Args:
+            user_message (str): 사용자 메시지
+            function_results (List[Dict[str, Any]]): FunctionExecutor.execute_functions의 결과 목록 (name, args, result)
+            
+        Returns:
+            str: 최종 응답 생성용 프롬프트
+        """
+        # 현재 날짜와 시간 정보 추가
+        current_time = datetime.now()
+        time_context = f"현재 시각: {current_time.strftime('%Y년 %m월 %d일 %H시 %M분')} ({current_time.strftime('%A')})"
+        
+        # CCTV 영상 정보(cctv_data)는 답변과 별도로 화면에 표시하므로 LLM에는 전달하지 않는다.
+        results = "\n".join(
+            f"{index}. {result['name']}({json.dumps(result['args'], ensure_ascii=False)}): "
+            f"{'CCTV 영상을 찾았습니다. (답변 아래에 영상이 따로 표시됨)' if result['result'].startswith('cctv_data:') else result['result']}"
+            for index, result in enumerate(function_results, start=1)
+        )
+        
+        return f"""
+{time_context}
+
+사용자 질문: "{user_message}"
+함수 실행 결과:
+{results}
+
+위 결과를 모두 바탕으로 사용자의 질문에 한 번에 친근하고 간결하게 답변해주세요.
+조건:
+1. 여러 지역이나 시간대의 날씨는 비교하기 쉽게 정리 (기온, 날씨상태, 강수확률 등 주요 정보 포함)
+2. CCTV 영상은 답변 아래에 따로 표시되므로 영상 주소는 쓰지 말고, 영상을 함께 보여준다는 것만 짧게 안내
+3. 결과를 가져오지 못한 항목은 짧게 안내
+4. 간결하고 명확한 답변 (250자 이내)
+5. 친근한 말투
+6. 현재 시각을 고려하여 "오늘", "내일" 등의 표현을 정확히 해석
+"""
@@ -24,12 +24,7 @@ def format_weather_data(weather_data: Dict[str, Any], location_name: str, foreca
         return f"{location_name}의 날씨 데이터가 없습니다."
     
     # 시간별로 데이터 그룹화
-    time_groups = {}
-    for item in items:
-        date_time = f"{item['fcstDate']}_{item['fcstTime']}"
-        if date_time not in time_groups:
-            time_groups[date_time] = {}
-        time_groups[date_time][item['category']] = item['fcstValue']
+    time_groups = group_forecast_by_time(items)
     
     if not time_groups:
         return f"{location_name}의 날씨 데이터를 처리할 수 없습니다."
@@ -40,32 +35,66 @@ def format_weather_data(weather_data: Dict[str, Any], location_name: str, foreca
         return _format_single_time_weather(time_groups, location_name, forecast_type, target_hours)
 
 
-def _format_single_time_weather(time_groups: Dict[str, Dict[str, str]], location_name: str, forecast_type: str, target_hours: int) -> str:
-    """특정 시간대의 날씨 정보를 포맷합니다."""
+def group_forecast_by_time(items: List[Dict[str, Any]]) -> Dict[str, Dict[str, str]]:
+    """
+    기상청 예보 항목들을 예보 시각별로 묶습니다.
+    
+    Args:
+        items (List[Dict[str, Any]]): fcstDate, fcstTime, category, fcstValue로 구성된 예보 항목 목록
+        
+    Returns:
+        Dict[str, Dict[str, str]]: {"YYYYMMDD_HHMM": {category: fcstValue}}
+    """
+    time_groups = {}
+    for item in items:
+        date_time = f"{item['fcstDate']}_{item['fcstTime']}"
+        if date_time not in time_groups:
+            time_groups[date_time] = {}
+        time_groups[date_time][item['category']] = item['fcstValue']
+    return time_groups
+
+
+def select_forecast_time(time_groups: Dict[str, Dict[str, str]], target_hours: int, now: datetime = None) -> str:
+    """
+    target_hours 후에 해당하는 예보 시각을 고릅니다.
+    
+    Args:
+        time_groups (Dict[str, Dict[str, str]]): group_forecast_by_time의 결과
+        target_hours (int): 몇 시간 후의 예보인지 (0이면 가장 가까운 시간)
+        now (datetime, optional): 현재 시각 (생략하면 datetime.now())
+        
+    Returns:
+        str: 선택한 예보 시각 ("YYYYMMDD_HHMM")
+    """
     sorted_times = sorted(time_groups.keys())
     
     if target_hours == 0:
         # 가장 가까운 시간대
-        selected_time = sorted_times[0]
-    else:
-        # 현재 시간 + target_hours에 해당하는 시간대 찾기
-        current_time = datetime.now()
-        target_time = current_time + timedelta(hours=target_hours)
-        target_date_str = target_time.strftime("%Y%m%d")
-        target_hour_str = target_time.strftime("%H00")
-        target_time_key = f"{target_date_str}_{target_hour_str}"
-        
-        # 정확한 시간이 있으면 사용, 없으면 가장 가까운 시간 사용
-        if target_time_key in time_groups:
-            selected_time = target_time_key
-        else:
-            # 가장 가까운 시간 찾기
-            selected_time = sorted_times[0]
-            for time_key in sorted_times:
-                if time_key >= target_time_key:
-                    selected_time = time_key
-                    break
+        return sorted_times[0]
+    
+    # 현재 시간 + target_hours에 해당하는 시간대 찾기
+    current_time = now or datetime.now()
+    target_time = current_time + timedelta(hours=target_hours)
+    target_date_str = target_time.strftime("%Y%m%d")
+    target_hour_str = target_time.strftime("%H00")
+    target_time_key = f"{target_date_str}_{target_hour_str}"
     
+    # 정확한 시간이 있으면 사용, 없으면 가장 가까운 시간 사용
+    if target_time_key in time_groups:
+        return target_time_key
+    
+    # 가장 가까운 시간 찾기
+    selected_time = sorted_times[0]
+    for time_key in sorted_times:
+        if time_key >= target_time_key:
+            selected_time = time_key
+            break
+    return selected_time
+
+
+def _format_single_time_weather(time_groups: Dict[str, Dict[str, str]], location_name: str, forecast_type: str, target_hours: int) -> str:
+    """특정 시간대의 날씨 정보를 포맷합니다."""
+    selected_time = select_forecast_time(time_groups, target_hours)
     forecast_data = time_groups[selected_time]
     
     # 시간 정보 파싱
@@ -0,0 +1,216 @@
+import os
+import sys
+from collections import Counter
+from datetime import datetime, timedelta
+from typing import Any, Dict, List, Optional
+
+# 상위 디렉토리의 모듈들을 import하기 위해 경로 추가
+sys.path.append(os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__)))))
+
+from chatbot.utils.weather_formatter import group_forecast_by_time, select_forecast_time
+
+# 최종 답변을 만드는 방식 (요청마다 고를 수 있고, 기본값은 WEATHER_ANSWER_RENDERER 환경 변수)
+TEMPLATE_RENDERER = "template"
+LLM_RENDERER = "llm"
+ANSWER_RENDERERS = (TEMPLATE_RENDERER, LLM_RENDERER)
+
+# LLM 최종 답변 프롬프트(build_final_response_prompt)와 같은 길이 제한
+MAX_ANSWER_LENGTH = 150
+
+# 고른 예보 시각이 요청한 시각과 이보다 많이 차이 나면(예보 범위 밖) 템플릿을 쓰지 않는다.
+MAX_TIME_MISMATCH_HOURS = 3
+
+# 하늘상태(SKY), 강수형태(PTY) 코드별 "~고" 형태의 문장 조각
+SKY_CLAUSES = {"1": "맑고", "3": "구름이 많고", "4": "흐리고"}
+PTY_CLAUSES = {
+    "1": "비가 오고",
+    "2": "비나 눈이 오고",
+    "3": "눈이 오고",
+    "4": "소나기가 오고",
+    "5": "빗방울이 떨어지고",
+    "6": "빗방울과 눈날림이 있고",
+    "7": "눈이 날리고",
+}
+PTY_NAMES = {"1": "비", "2": "비/눈", "3": "눈", "4": "소나기", "5": "빗방울", "6": "빗방울/눈날림", "7": "눈날림"}
+RELATIVE_DAY_NAMES = {0: "오늘", 1: "내일", 2: "모레", 3: "글피"}
+
+
+def resolve_answer_renderer(renderer: Optional[str], default: str) -> str:
+    """
+    요청에 지정한 답변 방식을 확인합니다.
+
+    Args:
+        renderer (Optional[str]): 요청에 지정한 방식 ("template" 또는 "llm", 생략하면 default)
+        default (str): 기본 방식
+
+    Returns:
+        str: 사용할 답변 방식
+    """
+    renderer = (renderer or default).lower()
+    if renderer not in ANSWER_RENDERERS:
+        raise ValueError(f"지원하지 않는 답변 방식입니다: {renderer} (template 또는 llm)")
+    return renderer
+
+
+def _topic_particle(word: str) -> str:
+    """단어의 받침에 맞는 보조사(은/는)를 반환합니다."""
+    last = word[-1] if word else ""
+    if "가" <= last <= "힣":
+        return "은" if (ord(last) - ord("가")) % 28 else "는"
+    return "은(는)"
+
+
+def _number(value: Optional[str]) -> Optional[float]:
+    try:
+        return float(value)
+    except (TypeError, ValueError):
+        return None
+
+
+def _temperature(forecast_data: Dict[str, str]) -> Optional[str]:
+    # 단기 예보는 TMP, 초단기 예보는 T1H 범주에 기온이 들어 있다.
+    return forecast_data.get("TMP") or forecast_data.get("T1H")
+
+
+def _day_name(date: datetime, now: datetime) -> str:
+    offset = (date.date() - now.date()).days
+    return RELATIVE_DAY_NAMES.get(offset, f"{date.month:02d}월 {date.day:02d}일")
+
+
+def _fit(sentences: List[str]) -> Optional[str]:
+    """필수 문장부터 길이 제한 안에 들어가는 만큼 이어 붙입니다. (마지막 문장들은 생략 가능)"""
+    answer = sentences[0]
+    if len(answer) > MAX_ANSWER_LENGTH:
+        return None
+    for sentence in sentences[1:]:
+        if len(answer) + 1 + len(sentence) > MAX_ANSWER_LENGTH:
+            break
+        answer = f"{answer} {sentence}"
+    return answer
+
+
+def _render_single_time(time_groups: Dict[str, Dict[str, str]], location_name: str, forecast_type: str, target_hours: int, now: datetime) -> Optional[str]:
+    """특정 시각의 예보를 한두 문장으로 만듭니다."""
+    selected_time = select_forecast_time(time_groups, target_hours, now)
+    selected_at = datetime.strptime(selected_time, "%Y%m%d_%H%M")
+    target_at = now + timedelta(hours=target_hours)
+    if abs((selected_at - target_at).total_seconds()) > MAX_TIME_MISMATCH_HOURS * 3600:
+        return None
+
+    forecast_data = time_groups[selected_time]
+    temperature = _temperature(forecast_data)
+    pty = forecast_data.get("PTY", "0")
+    clause = PTY_CLAUSES.get(pty) if pty != "0" else SKY_CLAUSES.get(forecast_data.get("SKY"))
+    if temperature is None or clause is None:
+        return None
+
+    if forecast_type == "초단기" and target_hours <= 1:
+        when = "지금"
+    else:
+        when = f"{_day_name(selected_at, now)} {selected_at.hour}시"
+
+    sentences = [f"{when} {location_name}{_topic_particle(location_name)} {clause} 기온은 {temperature}°C예요."]
+
+    details = []
+    if "POP" in forecast_data:
+        details.append(f"강수확률 {forecast_data['POP']}%")
+    if "REH" in forecast_data:
+        details.append(f"습도 {forecast_data['REH']}%")
+    if "WSD" in forecast_data:
+        details.append(f"바람 {forecast_data['WSD']}m/s")
+    if details:
+        sentences.append(f"{', '.join(details)}예요.")
+
+    pop, degrees = _number(forecast_data.get("POP")), _number(temperature)
+    if pty != "0":
+        sentences.append("우산 꼭 챙기세요! ☔")
+    elif pop is not None and pop >= 60:
+        sentences.append("비 소식이 있으니 우산을 챙기세요. ☔")
+    elif degrees is not None and degrees >= 30:
+        sentences.append("더위 조심하세요! 🥵")
+    elif degrees is not None and degrees <= 0:
+        sentences.append("따뜻하게 입으세요! 🧣")
+
+    return _fit(sentences)
+
+
+def _render_full_day(time_groups: Dict[str, Dict[str, str]], location_name: str, target_hours: int, now: datetime) -> Optional[str]:
+    """하루 동안의 예보를 최저/최고 기온, 대표 하늘상태, 강수 시간대로 요약합니다."""
+    target_day = (now + timedelta(hours=target_hours)).strftime("%Y%m%d")
+    current_key = now.strftime("%Y%m%d_%H00")
+    day_times = [
+        time_key for time_key in sorted(time_groups)
+        if time_key.startswith(target_day) and time_key >= current_key
+    ]
+    if not day_times:
+        return None
+
+    temperatures = [
+        value for value in (_number(_temperature(time_groups[time_key])) for time_key in day_times)
+        if value is not None
+    ]
+    # 단기 예보의 일 최저/최고 기온(TMN/TMX)이 있으면 함께 반영한다.
+    for time_key in day_times:
+        for category in ("TMN", "TMX"):
+            value = _number(time_groups[time_key].get(category))
+            if value is not None:
+                temperatures.append(value)
+    sky_counts = Counter(time_groups[time_key]["SKY"] for time_key in day_times if time_groups[time_key].get("SKY") in SKY_CLAUSES)
+    if not temperatures or not sky_counts:
+        return None
+
+    day = datetime.strptime(target_day, "%Y%m%d")
+    day_name = _day_name(day, now)
+    sky = sky_counts.most_common(1)[0][0]
+    low, high = min(temperatures), max(temperatures)
+    temperature_range = f"{low:g}°C" if low == high else f"{low:g}~{high:g}°C"
+    sentences = [
+        f"{day_name}({day.month:02d}월 {day.day:02d}일) {location_name}{_topic_particle(location_name)} "
+        f"대체로 {SKY_CLAUSES[sky]} 기온은 {temperature_range}예요."
+    ]
+
+    pops = [value for value in (_number(time_groups[time_key].get("POP")) for time_key in day_times) if value is not None]
+    rainy_times = [time_key for time_key in day_times if time_groups[time_key].get("PTY", "0") in PTY_NAMES]
+    if rainy_times:
+        pty = Counter(time_groups[time_key]["PTY"] for time_key in rainy_times).most_common(1)[0][0]
+        first, last = int(rainy_times[0][9:11]), int(rainy_times[-1][9:11])
+        hours = f"{first}시" if first == last else f"{first}시~{last}시"
+        pop_text = f"(강수확률 최대 {max(pops):g}%)" if pops else ""
+        sentences.append(f"{hours}에 {PTY_NAMES[pty]} 소식{pop_text}이 있으니 우산을 챙기세요. ☔")
+    elif pops:
+        sentences.append(f"강수확률은 최대 {max(pops):g}%로 비 소식은 없어요.")
+
+    return _fit(sentences)
+
+
+def render_weather_answer(
+    weather_data: Dict[str, Any],
+    location_name: str,
+    forecast_type: str = "단기",
+    target_hours: int = 0,
+    full_day: bool = False,
+    now: Optional[datetime] = None
+) -> Optional[str]:
+    """
+    기상청 예보 데이터로 LLM 없이 사용자에게 보낼 답변(150자 이내)을 만듭니다.
+    지금, N시간 후, 특정 날짜의 하루 전체처럼 정해진 형태의 질문에만 사용합니다.
+
+    Args:
+        weather_data (Dict[str, Any]): 기상청 API 응답 데이터
+        location_name (str): 답변에 쓸 지역명
+        forecast_type (str): 예보 타입 ("초단기" 또는 "단기")
+        target_hours (int): 몇 시간 후의 예보인지 (하루 전체이면 그 날짜를 가리키는 시간)
+        full_day (bool): True이면 하루 전체 날씨를 요약
+        now (Optional[datetime]): 현재 시각 (생략하면 datetime.now())
+
+    Returns:
+        Optional[str]: 답변 또는 템플릿으로 만들 수 없으면(데이터 없음, 예보 범위 밖 등) None
+    """
+    if weather_data.get("requestCode") != "200" or not weather_data.get("items"):
+        return None
+
+    now = now or datetime.now()
+    time_groups = group_forecast_by_time(weather_data["items"])
+    if full_day:
+        return _render_full_day(time_groups, location_name, target_hours, now)
+    return _render_single_time(time_groups, location_name, forecast_type, target_hours, now)
@@ -1,4 +1,8 @@
 import asyncio
+import contextlib
+import heapq
+import os
+import re
 import time
 from datetime import datetime, timedelta
 import aiohttp
@@ -9,17 +13,113 @@ import litellm
 import pytz
 
 from dotenv import load_dotenv
-from typing import List, Tuple, Optional
+from typing import Any, AsyncIterator, Dict, List, Tuple, Optional
 
+from crawler.utils.article_compactor import WEATHER_VALUE_PATTERN, compact_article, estimate_tokens
+from crawler.utils.simhash import NearDuplicateIndex, simhash
+from crawler.utils.stage_timer import record_stage
 from kakaoapi.get_city_from_coordinates import get_city_from_coordinates
 from repositories.news_repository import NewsRepository
 
+NAVER_NEWS_SEARCH_URL = "https://search.naver.com/search.naver"
+
+NAVER_HEADERS = {
+    'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/91.0.4472.124 Safari/537.36'
+}
+
+# 크롤링 세션 전체의 동시 요청 수와 언론사(호스트)별 동시 요청 수 제한
+MAX_CONCURRENT_REQUESTS = 20
+MAX_REQUESTS_PER_HOST = 2
+
+# 기사 요청 제한 시간(초). 연결, 읽기(청크 사이 대기), 전체 시간을 각각 제한한다.
+ARTICLE_TIMEOUT = aiohttp.ClientTimeout(total=10, sock_connect=3, sock_read=5)
+
+# 기사 HTML은 최대 이 크기까지만 받는다. (초과분은 버리고, 받은 부분만으로 본문을 추출한다.)
+MAX_ARTICLE_BYTES = 1024 * 1024
+ARTICLE_CHUNK_SIZE = 16 * 1024
+
+# 기사 본문 영역이 끝났음을 나타내는 HTML 표식.
+# 이 표식을 받은 뒤의 댓글, 추천 기사, 광고 스크립트 등은 더 이상 내려받지 않는다.
+ARTICLE_END_MARKERS = (b"</article>", b"</ARTICLE>")
+
+
+# 엔드포인트에서 반환하는 날씨 요약 기사 수
+NEWS_SUMMARY_LIMIT = 5
+
+# 필요한 요약 수보다 더 띄워 둘 LLM 요청 수 (LLM이 날씨 기사가 아니라고 거절하는 경우를 대비한 여유분)
+NEWS_LLM_SLACK = 2
+
+# 날씨 기사 여부를 판단하는 로컬 키워드 사전 (LLM 호출 전 사전 필터)
+WEATHER_KEYWORD_PATTERN = re.compile(
+    r"날씨|기온|기상|예보|강수|강우|호우|폭우|소나기|장마|장맛비|빗방울|빗줄기|비 소식|눈 소식|폭설|대설|적설|"
+    r"태풍|강풍|돌풍|바람|황사|미세먼지|폭염|무더위|더위|열대야|한파|추위|영하|체감온도|습도|안개|서리|"
+    r"우박|낙뢰|천둥|번개|건조|맑|흐림|구름|일교차|꽃샘추위|특보"
+)
+WEATHER_BODY_MIN_HITS = 3
+
+# LLM이 요약을 만들지 못했을 때 돌려주는 문자열
+UNDESIRED_SUMMARY_TEXT = "날씨 정보 없음"
+
+NEWS_SUMMARY_MODEL = "gemini/gemini-2.0-flash"
+
+# 묶음(batch) 요약 설정. NEWS_SUMMARY_MODE=batch 환경 변수로 켠다.
+# 한 번의 LLM 요청에 넣을 입력 토큰 예산과 최대 기사 수
+NEWS_BATCH_TOKEN_BUDGET = 12000
+NEWS_BATCH_MAX_ARTICLES = 5
+
+
+def create_news_session() -> aiohttp.ClientSession:
+    """
+    뉴스 크롤링에 사용할 aiohttp 세션을 생성합니다.
+    커넥터에서 전체/호스트별 동시 연결 수를 제한하여, 한 언론사에 요청이 몰리지 않도록 합니다.
+
+    Returns:
+        aiohttp.ClientSession: 동시 요청 수와 제한 시간이 설정된 클라이언트 세션입니다.
+    """
+    connector = aiohttp.TCPConnector(
+        limit=MAX_CONCURRENT_REQUESTS,
+        limit_per_host=MAX_REQUESTS_PER_HOST,
+        ttl_dns_cache=300
+    )
+    return aiohttp.ClientSession(headers=NAVER_HEADERS, connector=connector, timeout=ARTICLE_TIMEOUT)
+
+
+async def read_article_html(response: aiohttp.ClientResponse) -> bytes:
+    """
+    기사 응답 본문을 청크 단위로 스트리밍하여 읽습니다.
+    MAX_ARTICLE_BYTES를 넘거나 ARTICLE_END_MARKERS가 보이면 그 시점에서 읽기를 멈춥니다.
+
+    Args:
+        response (aiohttp.ClientResponse): 기사 페이지 응답 객체입니다.
+
+    Returns:
+        bytes: 지금까지 받은 기사 HTML 바이트열입니다.
+    """
+    buffer = bytearray()
+    # 청크 경계에 걸친 표식도 찾을 수 있도록, 이전 청크의 꼬리 부분부터 검색한다.
+    tail_size = max(len(marker) for marker in ARTICLE_END_MARKERS)
+
+    async for chunk in response.content.iter_chunked(ARTICLE_CHUNK_SIZE):
+        search_start = max(len(buffer) - tail_size, 0)
+        buffer.extend(chunk[:MAX_ARTICLE_BYTES - len(buffer)])
+
+        if any(buffer.find(marker, search_start) != -1 for marker in ARTICLE_END_MARKERS):
+            break
+        if len(buffer) >= MAX_ARTICLE_BYTES:
+            print(f"  -> 기사 크기 제한({MAX_ARTICLE_BYTES} bytes) 도달: {response.url}")
+            break
+
+    return bytes(buffer)
+
 
 async def fetch_and_extract_article(session: aiohttp.ClientSession, link: str) -> Optional[str]:
     """
     주어진 link의 뉴스 기사를 비동기적으로 크롤링하고, 본문을 추출하여 반환합니다.
     'trafilatura' 라이브러리의 extract 메소드를 사용하여 기사 본문을 추출합니다.
 
+    기사 HTML은 read_article_html로 크기 제한을 두고 스트리밍하며,
+    연결/읽기 제한 시간(ARTICLE_TIMEOUT)을 넘기면 해당 기사는 건너뜁니다.
+
     Args:
         session (aiohttp.ClientSession): HTTP 요청을 위한 aiohttp 클라이언트 세션입니다.
         link (str): 크롤링 및 본문 추출을 수행할 기사의 URL입니다.
@@ -29,16 +129,23 @@ async def fetch_and_extract_article(session: aiohttp.ClientSession, link: str) -
                        추출에 실패하거나 오류가 발생하면 None을 반환합니다. 
     """
     try:
-        async with session.get(link) as response:
-            # HTTP 오류 발생 시, 예외를 발생시킨다.
-            response.raise_for_status()
-            article_html = await response.text()
-        
-        news_body = trafilatura.extract(article_html)
+        with record_stage("fetch"):
+            async with session.get(link, timeout=ARTICLE_TIMEOUT) as response:
+                # HTTP 오류 발생 시, 예외를 발생시킨다.
+                response.raise_for_status()
+                article_html = await read_article_html(response)
+
+        # 본문 추출은 CPU 작업이므로 이벤트 루프를 막지 않도록 별도 스레드에서 수행한다.
+        # (bytes를 그대로 넘기면 trafilatura가 문자 인코딩을 직접 판별한다.)
+        with record_stage("extract"):
+            news_body = await asyncio.to_thread(trafilatura.extract, article_html)
 
         if not news_body:
             print(f" 링크: {link} -> 본문 추출 실패 (trafilatura 반환값 없음)")
 
+    except asyncio.TimeoutError:
+        print(f"  -> 기사 요청 제한 시간 초과: {link}")
+        return None
     except aiohttp.ClientError as e:
         print(f"  -> trafilatura 사용 중에 aiohttp 오류 발생: {link} 처리 중 문제 발생 ({e})")
         return None
@@ -49,6 +156,113 @@ async def fetch_and_extract_article(session: aiohttp.ClientSession, link: str) -
     return news_body
 
 
+async def iter_articles(session: aiohttp.ClientSession, link_list: List[str]) -> AsyncIterator[Tuple[int, Optional[str]]]:
+    """
+    여러 기사를 동시에 내려받아, 본문 추출이 끝나는 순서대로 (검색 순위, 본문)을 yield 합니다.
+    가장 느린 언론사를 기다리지 않고 먼저 끝난 기사부터 바로 다음 단계로 넘길 수 있습니다.
+
+    제너레이터가 중간에 닫히면(aclose), 아직 끝나지 않은 요청은 모두 취소됩니다.
+
+    Args:
+        session (aiohttp.ClientSession): create_news_session으로 생성한 세션입니다.
+        link_list (List[str]): 검색 순위 순서의 기사 URL 리스트입니다.
+
+    Yields:
+        Tuple[int, Optional[str]]: (link_list에서의 인덱스, 추출된 본문 또는 None)
+    """
+    async def fetch_with_index(index: int, link: str) -> Tuple[int, Optional[str]]:
+        return index, await fetch_and_extract_article(session, link)
+
+    tasks = [
+        asyncio.create_task(fetch_with_index(index, link))
+        for index, link in enumerate(link_list)
+    ]
+
+    try:
+        for next_done in asyncio.as_completed(tasks):
+            yield await next_done
+    finally:
+        for task in tasks:
+            task.cancel()
+
+
+def parse_naver_news_listing(response_text: str) -> Tuple[List[str], List[str]]:
+    """
+    네이버 뉴스 검색 결과 HTML에서 기사 링크와 제목을 검색 순위 순서대로 추출합니다.
+
+    Args:
+        response_text (str): 네이버 뉴스 검색 결과 페이지 HTML.
+
+    Returns:
+        Tuple[List[str], List[str]]: (기사 URL 리스트, 기사 제목 리스트). 두 리스트의 같은 인덱스는 같은 기사입니다.
+    """
+    soup = BeautifulSoup(response_text, 'html.parser')
+
+    title_list = []
+    link_list = []
+
+    # 1. 뉴스 기사 블록(div) 리스트 추출
+    news_item_divs = soup.select('div.group_news > ul > div > div > div > div')
+
+    if news_item_divs:
+        # 2. 각 뉴스 기사 블록에서 바로 아래 자식 div 리스트 추출
+        news_content_divs = [
+            child_div
+            for news_div in news_item_divs
+            for child_div in news_div.find_all('div', recursive=False)
+        ]
+        
+        if news_content_divs:
+            # 3. 각 기사 콘텐츠 div에서 두 번째 자식 div(기사 본문 정보 영역) 추출
+            article_info_divs = [
+                div.find_all('div', recursive=False)[1]
+                for div in news_content_divs
+                if len(div.find_all('div', recursive=False)) >= 2  # IndexError 방지
+            ]
+            
+            for article_div in article_info_divs:
+                # 4. 기사 정보 div에서 <a> 태그의 href 속성(기사 링크) 추출
+                a_tag = article_div.find('a')
+                # 5. 기사 정보 div에서 <span> 태그의 제목 추출
+                span_tag = article_div.find('span')
+
+                # 링크와 제목이 모두 있는 기사만 추가하여, 두 리스트의 순서가 어긋나지 않도록 한다.
+                if a_tag and 'href' in a_tag.attrs and span_tag:
+                    title = span_tag.get_text(strip=True)
+                    print(f"span_tag = {title}")
+                    link_list.append(a_tag['href'])
+                    title_list.append(title)
+
+    return link_list, title_list
+
+
+async def fetch_naver_news_listing(session: aiohttp.ClientSession, location: str) -> Tuple[List[str], List[str]]:
+    """
+    네이버 뉴스 검색 페이지에서 'location + 날씨' 키워드로 검색된 기사들의 링크와 제목을 검색 순위 순서대로 수집합니다.
+
+    Args:
+        session (aiohttp.ClientSession): create_news_session으로 생성한 세션입니다.
+        location (str): 날씨 뉴스를 검색할 지역 이름입니다. (예: "서울").
+
+    Returns:
+        Tuple[List[str], List[str]]: (기사 URL 리스트, 기사 제목 리스트). 두 리스트의 같은 인덱스는 같은 기사입니다.
+    """
+    params = {"where": "news", "query": f"{location} 날씨"}
+
+    with record_stage("listing_fetch"):
+        async with session.get(NAVER_NEWS_SEARCH_URL, params=params) as response:
+            print(f"네이버 뉴스 Response Status Code: {response.status}")
+            response_text = await response.text()
+
+    with record_stage("listing_parse"):
+        link_list, title_list = parse_naver_news_listing(response_text)
+    
+    print("\n--- 최종 추출된 링크 리스트 ---")
+    print(link_list)
+
+    return link_list, title_list
+
+
 async def get_naver_weather_news_crawler(location="서울") -> Tuple[List[str], List[str], List[Optional[str]]]:
     """
     지정된 지역의 날씨 관련 네이버 뉴스 기사 URL을 비동기적으로 크롤링하고,
@@ -67,90 +281,59 @@ async def get_naver_weather_news_crawler(location="서울") -> Tuple[List[str],
     Returns:
         Tuple[List[str], List[str], List[Optional[str]]]:
             다음 세 개의 리스트를 순서대로 담고 있는 튜플입니다:
-            1. titles (List[str]): 추출된 뉴스 기사 제목들의 리스트.
-            2. links (List[str]): 추출된 뉴스 기사 URL들의 리스트.
+            1. links (List[str]): 추출된 뉴스 기사 URL들의 리스트.
+            2. titles (List[str]): 추출된 뉴스 기사 제목들의 리스트.
             3. news_list (List[Optional[str]]): 추출된 뉴스 기사 본문(텍스트)들의 리스트.
     """
 
-    url = f"https://search.naver.com/search.naver?where=news&query={location} 날씨"
-    headers = {
-        'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/91.0.4472.124 Safari/537.36'
-    }
-
-    async with aiohttp.ClientSession(headers=headers) as session:
-        async with session.get(url) as response:
-            print(f"네이버 뉴스 Response Status Code: {response.status}")
-            response_text = await response.text()
-        soup = BeautifulSoup(response_text, 'html.parser')
-
-        title_list = []
-        link_list = []
-    
-        # 1. 뉴스 기사 블록(div) 리스트 추출
-        news_item_divs = soup.select('div.group_news > ul > div > div > div > div')
-
-        if news_item_divs:
-            # 2. 각 뉴스 기사 블록에서 바로 아래 자식 div 리스트 추출
-            news_content_divs = [
-                child_div
-                for news_div in news_item_divs
-                for child_div in news_div.find_all('div', recursive=False)
-            ]
-            
-            if news_content_divs:
-                # 3. 각 기사 콘텐츠 div에서 두 번째 자식 div(기사 본문 정보 영역) 추출
-                article_info_divs = [
-                    div.find_all('div', recursive=False)[1]
-                    for div in news_content_divs
-                    if len(div.find_all('div', recursive=False)) >= 2  # IndexError 방지
-                ]
-                
-                if article_info_divs:
-                    for article_div in article_info_divs:
-                        # 4. 기사 정보 div에서 <a> 태그의 href 속성(기사 링크) 추출
-                        a_tag = article_div.find('a')
-                        if a_tag and 'href' in a_tag.attrs:
-                            link_list.append(a_tag['href'])
-
-                        # 5. 기사 정보 div에서 <span> 태그의 제목 추출
-                        span_tag = article_div.find('span')
-                        if span_tag:
-                            title = span_tag.get_text(strip=True)
-                            print(f"span_tag = {title}")
-                            title_list.append(title)
-        
-        print("\n--- 최종 추출된 링크 리스트 ---")
-        print(link_list)
-
-        # 각 URL에 대해 본문을 저장할 리스트 (루프 시작 전에 선언)
-        news_list = []
+    async with create_news_session() as session:
+        link_list, title_list = await fetch_naver_news_listing(session, location)
 
-        tasks = [
-            fetch_and_extract_article(session, link)
-            for link in link_list
-        ]
+        # 각 URL에 대해 본문을 저장할 리스트 (검색 순위 순서를 유지한다)
+        news_list = [None] * len(link_list)
 
-        news_list = await asyncio.gather(*tasks)
+        async for index, news_body in iter_articles(session, link_list):
+            news_list[index] = news_body
 
 
     print(f"\n총 {len(news_list)}개의 뉴스 본문을 추출했습니다.")
     return link_list, title_list, news_list
 
 
-def news_to_prompt(title_list: list, news_list: list, location: str) -> list:
+def is_weather_relevant(title: str, news_body: Optional[str] = None) -> bool:
     """
-    주어진 뉴스 기사 내용들을 각각의 prompt으로 만든 후, 하나의 리스트로 반환합니다.
+    제목과 본문에 등장하는 날씨 키워드로, LLM을 호출하기 전에 날씨와 명백히 무관한 기사를 걸러냅니다.
+    제목에 날씨 키워드가 있으면 통과시키고, 없으면 본문에서 날씨 키워드/수치 표현이
+    WEATHER_BODY_MIN_HITS번 이상 나오는 경우에만 통과시킵니다.
 
     Args:
-        title_list (list): 날씨 기사 제목이 들어있는 리스트
-        news_list (list): 날씨 기사 내용이 들어있는 리스트
-        location (str): 검색할 지역 (ex: "서울).
-    
+        title (str): 기사 제목입니다.
+        news_body (Optional[str]): 기사 본문입니다. 아직 받지 않았다면 None입니다.
+
     Returns:
-        list: gemini API에 question으로 전달할 prompt들이 담긴 리스트
+        bool: 날씨 기사일 가능성이 있으면 True, 명백히 무관하면 False.
     """
+    if title and WEATHER_KEYWORD_PATTERN.search(title):
+        return True
 
-    # 3. system prompt, user prompt 세팅
+    if not news_body:
+        return False
+
+    hits = len(WEATHER_KEYWORD_PATTERN.findall(news_body)) + len(WEATHER_VALUE_PATTERN.findall(news_body))
+    return hits >= WEATHER_BODY_MIN_HITS
+
+
+def build_news_system_prompt(location: str) -> dict:
+    """
+    날씨 기사 요약 규칙을 담은 system prompt 메시지를 생성합니다.
+    단일 기사 요약(news_to_prompt)과 묶음 요약(news_to_batch_prompt)이 같은 규칙을 사용합니다.
+
+    Args:
+        location (str): 검색할 지역 (ex: "서울").
+
+    Returns:
+        dict: {"role": "system", "content": ...} 형식의 메시지
+    """
     system_prompt = {
         "role": "system",
         "content": f"""당신은 전문 날씨 뉴스 요약 AI입니다. 당신의 임무는 매번 제공되는 단일 '기사 제목'과 '기사 내용'에만 엄격하게 근거하여 날씨 정보를 요약하는 것입니다. **'{location}' 지역의 날씨 정보를 우선적으로 다루되, 기사에 중요한 전국적인 날씨 정보나 전반적인 날씨 패턴에 대한 내용이 있다면 이 또한 요약에 포함합니다.** 다른 기사의 정보나 당신의 외부 지식을 절대 사용해서는 안 됩니다. 요약 결과에 원본 기사의 제목이나 다른 기사의 제목을 포함하는 등, 날씨 요약과 직접 관련 없는 추가 정보는 절대 응답에 포함시키지 마십시오.
@@ -173,6 +356,25 @@ def news_to_prompt(title_list: list, news_list: list, location: str) -> list:
         """
     }
 
+    return system_prompt
+
+
+def news_to_prompt(title_list: list, news_list: list, location: str) -> list:
+    """
+    주어진 뉴스 기사 내용들을 각각의 prompt으로 만든 후, 하나의 리스트로 반환합니다.
+
+    Args:
+        title_list (list): 날씨 기사 제목이 들어있는 리스트
+        news_list (list): 날씨 기사 내용이 들어있는 리스트
+        location (str): 검색할 지역 (ex: "서울).
+    
+    Returns:
+        list: gemini API에 question으로 전달할 prompt들이 담긴 리스트
+    """
+
+    # 3. system prompt, user prompt 세팅
+    system_prompt = build_news_system_prompt(location)
+
     user_prompt = """다음은 '{location}' 지역과 관련된 내용이 포함될 수 있는 기사입니다. 위에 제시된 시스템 프롬프트의 규칙에 따라 기사를 분석하고 요약해주세요.
 
     기사 제목:
@@ -222,103 +424,579 @@ async def llm_summarize_news(prompt: list) -> dict:
     }
 
     try:
-        response = await litellm.acompletion(
-            model="gemini/gemini-2.0-flash",
-            messages=prompt,
-            response_format= {
-                "type": "json_object",
-                "response_schema": response_schema
-            }
-        )
+        with record_stage("summarize"):
+            response = await litellm.acompletion(
+                model=NEWS_SUMMARY_MODEL,
+                messages=prompt,
+                response_format= {
+                    "type": "json_object",
+                    "response_schema": response_schema
+                }
+            )
 
         if response and response.choices and response.choices[0].message:
             response_json = json.loads(response.choices[0].message.content)
             if response_json.get("requestCode") == 200:
                 return response_json.get("news_content")
         else:
-            return "날씨 정보 없음"
+            return UNDESIRED_SUMMARY_TEXT
         
     except Exception as e:
-        return "날씨 정보 없음"
+        return UNDESIRED_SUMMARY_TEXT
+
+
+def news_to_batch_prompt(items: List[Tuple[int, str, str]], location: str) -> list:
+    """
+    여러 기사를 하나의 LLM 요청으로 묶은 prompt(메시지 리스트)를 만듭니다.
+    system prompt는 한 번만 포함하고, 각 기사에는 0부터 시작하는 묶음 내 번호(index)를 붙입니다.
+
+    Args:
+        items (List[Tuple[int, str, str]]): (식별자, 기사 제목, 기사 본문) 리스트. 식별자는 prompt에 쓰이지 않습니다.
+        location (str): 검색할 지역 (ex: "서울").
+
+    Returns:
+        list: gemini API에 전달할 메시지 리스트
+    """
+    articles = "\n\n".join(
+        f"[기사 {index}]\n기사 제목:\n{title}\n\n기사 내용:\n{news}"
+        for index, (_, title, news) in enumerate(items)
+    )
+
+    user_prompt = f"""다음은 '{location}' 지역과 관련된 내용이 포함될 수 있는 기사 {len(items)}개입니다. 각 기사를 서로 독립적으로, 위에 제시된 시스템 프롬프트의 규칙에 따라 분석하고 요약해주세요. 한 기사의 요약에 다른 기사의 내용을 섞어서는 안 됩니다.
+
+    응답은 반드시 아래 형식의 JSON 배열 하나로만 작성하고, 입력된 모든 기사의 index(0 ~ {len(items) - 1})를 정확히 한 번씩 포함해야 합니다.
+    [{{"index": 기사 번호(int), "requestCode": 200 또는 400(int), "news_content": 요약 문자열(str)}}]
+
+    {articles}
+    """
+
+    return [
+        build_news_system_prompt(location),
+        {"role": "user", "content": user_prompt}
+    ]
+
+
+def plan_summary_batches(
+    items: List[Tuple[int, str, str]],
+    location: str,
+    token_budget: int = NEWS_BATCH_TOKEN_BUDGET,
+    max_articles: int = NEWS_BATCH_MAX_ARTICLES
+) -> List[List[Tuple[int, str, str]]]:
+    """
+    기사들을 입력 순서대로, 토큰 예산과 최대 기사 수를 넘지 않도록 묶음으로 나눕니다.
+    예산보다 큰 기사는 단독 묶음이 됩니다.
+
+    Args:
+        items (List[Tuple[int, str, str]]): (식별자, 기사 제목, 기사 본문) 리스트.
+        location (str): 검색할 지역 (system prompt 토큰 수 계산용).
+        token_budget (int): 묶음 하나의 입력 토큰 예산.
+        max_articles (int): 묶음 하나에 넣을 최대 기사 수.
+
+    Returns:
+        List[List[Tuple[int, str, str]]]: 기사 묶음 리스트.
+    """
+    prompt_tokens = estimate_tokens(build_news_system_prompt(location)["content"]) + estimate_tokens(news_to_batch_prompt([], location)[1]["content"])
+
+    batches = []
+    current, current_tokens = [], prompt_tokens
+    for item in items:
+        item_tokens = estimate_tokens(item[1]) + estimate_tokens(item[2])
+        if current and (current_tokens + item_tokens > token_budget or len(current) >= max_articles):
+            batches.append(current)
+            current, current_tokens = [], prompt_tokens
+        current.append(item)
+        current_tokens += item_tokens
+
+    if current:
+        batches.append(current)
+    return batches
+
+
+def parse_batch_summary_response(content: str, count: int) -> Dict[int, str]:
+    """
+    묶음 요약 응답(JSON 배열)을 검증하고, 묶음 내 번호별 요약 결과를 반환합니다.
+    형식이 잘못되었거나, 범위를 벗어나거나, 중복된 index의 항목은 결과에서 제외합니다.
+
+    Args:
+        content (str): LLM 응답 문자열.
+        count (int): 묶음에 포함된 기사 수.
+
+    Returns:
+        Dict[int, str]: 묶음 내 번호 -> 요약문 (요약할 내용이 없으면 UNDESIRED_SUMMARY_TEXT).
+    """
+    parsed = json.loads(content)
+
+    # {"results": [...]} 처럼 객체로 감싸서 응답한 경우도 허용한다.
+    if isinstance(parsed, dict):
+        parsed = next((value for value in parsed.values() if isinstance(value, list)), [])
+    if not isinstance(parsed, list):
+        return {}
+
+    results: Dict[int, str] = {}
+    duplicated = set()
+    for entry in parsed:
+        if not isinstance(entry, dict):
+            continue
+        index, request_code, news_content = entry.get("index"), entry.get("requestCode"), entry.get("news_content")
+        if not isinstance(index, int) or not 0 <= index < count:
+            continue
+        if not isinstance(request_code, int) or not isinstance(news_content, str):
+            continue
+        if index in results:
+            duplicated.add(index)
+            continue
+
+        results[index] = news_content if request_code == 200 and news_content.strip() else UNDESIRED_SUMMARY_TEXT
+
+    for index in duplicated:
+        del results[index]
+
+    return results
+
+
+async def llm_summarize_news_batch(items: List[Tuple[int, str, str]], location: str) -> Dict[int, Optional[str]]:
+    """
+    여러 기사를 한 번의 gemini API 요청으로 요약합니다.
+    응답 검증에 실패한 기사만 llm_summarize_news로 개별 재요청합니다.
+
+    Args:
+        items (List[Tuple[int, str, str]]): (식별자, 기사 제목, 기사 본문) 리스트.
+        location (str): 검색할 지역 (ex: "서울").
+
+    Returns:
+        Dict[int, Optional[str]]: 식별자 -> 요약문 (llm_summarize_news와 같은 형식의 값).
+    """
+    results: Dict[int, str] = {}
+
+    if len(items) > 1:
+        try:
+            with record_stage("prompt_build"):
+                messages = news_to_batch_prompt(items, location)
+            with record_stage("summarize"):
+                response = await litellm.acompletion(
+                    model=NEWS_SUMMARY_MODEL,
+                    messages=messages,
+                    response_format={"type": "json_object"}
+                )
+            if response and response.choices and response.choices[0].message:
+                results = parse_batch_summary_response(response.choices[0].message.content, len(items))
+        except Exception as e:
+            print(f"묶음 요약 실패, 개별 요약으로 재시도합니다: {e}")
+
+    failed = [index for index in range(len(items)) if index not in results]
+    if failed and len(items) > 1:
+        print(f"묶음 요약 {len(items)}개 중 {len(failed)}개 검증 실패, 개별 요약으로 재시도합니다.")
+
+    retried = await asyncio.gather(*[
+        llm_summarize_news(news_to_prompt([items[index][1]], [items[index][2]], location)[0])
+        for index in failed
+    ])
+    results.update(zip(failed, retried))
+
+    return {items[index][0]: summary for index, summary in results.items()}
+
+
+def is_acceptable_summary(summary: Optional[str]) -> bool:
+    """LLM 요약 결과가 사용자에게 보여줄 수 있는 날씨 요약인지 확인합니다."""
+    return bool(summary) and summary.strip() not in ("", UNDESIRED_SUMMARY_TEXT, "입력 프롬프트 오류")
+
+
+def collect_ranked_summaries(outcomes: Dict[int, Optional[str]], total: int, limit: int) -> Tuple[List[int], bool]:
+    """
+    검색 순위 순서로 확정된 요약을 모읍니다.
+    앞 순위 기사의 결과가 아직 나오지 않았다면 그 뒤의 기사는 확정하지 않습니다.
+
+    Args:
+        outcomes (Dict[int, Optional[str]]): 처리가 끝난 기사의 (검색 순위 -> 요약 또는 None).
+        total (int): 전체 기사 수.
+        limit (int): 필요한 요약 수.
+
+    Returns:
+        Tuple[List[int], bool]: (채택된 기사의 검색 순위 리스트, 파이프라인을 끝내도 되는지 여부)
+    """
+    accepted = []
+    for rank in range(total):
+        if rank not in outcomes:
+            return accepted, False
+        if is_acceptable_summary(outcomes[rank]):
+            accepted.append(rank)
+            if len(accepted) >= limit:
+                return accepted, True
+    return accepted, True
+
+
+async def iter_weather_news_summaries(
+    session: aiohttp.ClientSession,
+    location: str,
+    link_list: List[str],
+    title_list: List[str],
+    limit: int = NEWS_SUMMARY_LIMIT,
+    batch: Optional[bool] = None,
+    ordered: bool = True
+) -> AsyncIterator[Tuple[int, str]]:
+    """
+    기사 수집, 날씨 기사 사전 필터, LLM 요약을 하나의 스트림으로 처리하여 채택된 요약을 yield 하고,
+    limit개의 요약이 확정되는 즉시 남은 요청을 모두 취소합니다.
+
+    1. iter_articles로 본문 추출이 끝나는 기사부터 받습니다.
+    2. is_weather_relevant로 날씨와 무관한 기사는 LLM을 호출하지 않고 버리고,
+       남은 기사는 compact_article로 지역/날씨 문단 위주로 토큰 예산 안까지 줄입니다.
+       이어서 SimHash 지문으로 이미 받은 기사와 거의 같은 기사(전재 기사)를 찾아, 군집마다 대표 기사 하나만 요약합니다.
+       나머지 기사는 미뤄 두었다가, 대표 기사의 요약이 실패하면 그중 검색 순위가 가장 높은 기사를 다시 요약합니다.
+    3. 남은 기사는 검색 순위가 높은 순서대로, 필요한 요약 수(+ NEWS_LLM_SLACK)만큼만 동시에 LLM에 요청합니다.
+    4. limit개의 요약이 확정되면 진행 중인 기사 요청과 LLM 요청을 취소합니다.
+
+    batch 모드에서는 요약할 기사를 plan_summary_batches로 묶어 llm_summarize_news_batch로 요청합니다.
+    아직 수집 중인 기사가 있고 다른 요약이 진행 중이면, 덜 찬 묶음은 기사가 더 모일 때까지 기다립니다.
+
+    Args:
+        session (aiohttp.ClientSession): create_news_session으로 생성한 세션입니다.
+        location (str): 검색한 지역 이름입니다.
+        link_list (List[str]): 검색 순위 순서의 기사 URL 리스트입니다.
+        title_list (List[str]): link_list와 같은 순서의 기사 제목 리스트입니다.
+        limit (int): 채택할 요약 기사 수입니다.
+        batch (Optional[bool]): 묶음 요약 사용 여부. None이면 NEWS_SUMMARY_MODE 환경 변수("single"/"batch")를 따릅니다.
+        ordered (bool): True이면 검색 순위 순서로 앞에서부터 limit개를 확정하여 순서대로 yield 합니다.
+                        False이면 LLM 응답이 오는 순서대로 먼저 채택된 limit개를 바로 yield 합니다.
+
+    Yields:
+        Tuple[int, str]: (검색 순위, 요약문)
+    """
+    if batch is None:
+        batch = os.getenv("NEWS_SUMMARY_MODE", "single") == "batch"
+
+    total = len(link_list)
+    outcomes: Dict[int, Optional[str]] = {}
+    # LLM 요청을 기다리는 기사 (검색 순위, 본문) 힙
+    waiting_articles: List[Tuple[int, str]] = []
+    # LLM 요청 태스크 -> 해당 요청에 포함된 기사들의 검색 순위
+    llm_tasks: Dict[asyncio.Task, List[int]] = {}
+    # 요약 대상 기사(군집 대표)의 SimHash 지문
+    duplicates = NearDuplicateIndex()
+    # 대표 기사 검색 순위 -> 요약을 미뤄 둔 같은 군집의 기사 (검색 순위, 지문, 본문) 리스트.
+    # 대표 기사의 요약이 실패하면 이 중 검색 순위가 가장 높은 기사를 새 대표로 요약한다.
+    parked: Dict[int, List[Tuple[int, int, str]]] = {}
+    emitted = 0
+
+    articles = iter_articles(session, link_list)
+    fetch_task: Optional[asyncio.Future] = asyncio.ensure_future(anext(articles)) if total else None
+
+    try:
+        while fetch_task or llm_tasks or waiting_articles:
+            # 검색 순위가 높은 기사부터 LLM 요청을 띄우되, 그 기사보다 앞 순위에 채택됐거나 아직 처리 중인
+            # (수집/요약 대기/요약 중) 기사가 limit + NEWS_LLM_SLACK개 이상이면 더 이상 띄우지 않는다.
+            launchable: List[Tuple[int, str]] = []
+            parked_ranks = {parked_rank for cluster in parked.values() for parked_rank, _, _ in cluster}
+            while waiting_articles:
+                top_rank = waiting_articles[0][0]
+                ahead = sum(
+                    1 for rank in range(top_rank)
+                    if rank not in parked_ranks and (rank not in outcomes or is_acceptable_summary(outcomes[rank]))
+                )
+                if ahead >= limit + NEWS_LLM_SLACK:
+                    break
+
+                launchable.append(heapq.heappop(waiting_articles))
+
+            if batch:
+                groups = plan_summary_batches([(rank, title_list[rank], news_body) for rank, news_body in launchable], location)
+                # 덜 찬 마지막 묶음은, 기사가 더 들어올 예정이고 진행 중인 요약이 있다면 다음 차례로 미룬다.
+                if groups and len(groups[-1]) < NEWS_BATCH_MAX_ARTICLES and fetch_task and llm_tasks:
+                    for rank, _, news_body in groups.pop():
+                        heapq.heappush(waiting_articles, (rank, news_body))
+                for group in groups:
+                    llm_tasks[asyncio.create_task(llm_summarize_news_batch(group, location))] = [rank for rank, _, _ in group]
+            else:
+                for rank, news_body in launchable:
+                    with record_stage("prompt_build"):
+                        prompt = news_to_prompt([title_list[rank]], [news_body], location)[0]
+                    llm_tasks[asyncio.create_task(llm_summarize_news(prompt))] = [rank]
+
+            pending = set(llm_tasks)
+            if fetch_task:
+                pending.add(fetch_task)
+            if not pending:
+                break
+
+            done, _ = await asyncio.wait(pending, return_when=asyncio.FIRST_COMPLETED)
+
+            newly_summarized: List[int] = []
+            for task in done:
+                if task is fetch_task:
+                    try:
+                        rank, news_body = task.result()
+                    except StopAsyncIteration:
+                        fetch_task = None
+                        continue
+                    fetch_task = asyncio.ensure_future(anext(articles))
+
+                    if news_body and is_weather_relevant(title_list[rank], news_body):
+                        # 지역/날씨 문단 위주로 본문을 토큰 예산 안으로 줄인 뒤 LLM에 넘긴다.
+                        with record_stage("compact"):
+                            news_body, original_tokens, compacted_tokens = compact_article(news_body, location)
+                        print(f"  -> 기사 압축 ({title_list[rank]}): {original_tokens} -> {compacted_tokens} 토큰 ({original_tokens - compacted_tokens} 절감)")
+
+                        # 같은 기사를 여러 언론사가 전재한 경우, 군집마다 대표 기사 하나만 요약한다.
+                        with record_stage("dedup"):
+                            fingerprint = simhash(news_body)
+                            duplicate_of = duplicates.find(fingerprint)
+                        if duplicate_of is None:
+                            duplicates.add(rank, fingerprint)
+                            heapq.heappush(waiting_articles, (rank, news_body))
+                        elif duplicate_of > rank and any(waiting_rank == duplicate_of for waiting_rank, _ in waiting_articles):
+                            # 아직 요약하지 않은 대표 기사보다 검색 순위가 높으면 대표 기사를 교체하고, 이전 대표 기사는 미뤄 둔다.
+                            previous_body = next(body for waiting_rank, body in waiting_articles if waiting_rank == duplicate_of)
+                            waiting_articles = [article for article in waiting_articles if article[0] != duplicate_of]
+                            heapq.heapify(waiting_articles)
+                            heapq.heappush(waiting_articles, (rank, news_body))
+                            parked[rank] = parked.pop(duplicate_of, []) + [(duplicate_of, duplicates.representatives[duplicate_of], previous_body)]
+                            duplicates.replace(duplicate_of, rank, fingerprint)
+                            print(f"  -> 중복 기사, LLM 요약 보류: {title_list[duplicate_of]} (대표: {title_list[rank]})")
+                        elif duplicate_of in outcomes:
+                            # 대표 기사가 이미 요약됐다. (요약이 실패한 대표 기사는 군집에서 지우므로 여기에 오지 않는다)
+                            outcomes[rank] = None
+                            print(f"  -> 중복 기사, LLM 요약 생략: {title_list[rank]} (대표: {title_list[duplicate_of]})")
+                        else:
+                            parked.setdefault(duplicate_of, []).append((rank, fingerprint, news_body))
+                            print(f"  -> 중복 기사, LLM 요약 보류: {title_list[rank]} (대표: {title_list[duplicate_of]})")
+                    else:
+                        print(f"  -> 날씨 기사 아님/본문 없음, LLM 요약 생략: {title_list[rank]}")
+                        outcomes[rank] = None
+                else:
+                    ranks = llm_tasks.pop(task)
+                    summaries = task.result()
+                    if isinstance(summaries, dict):
+                        outcomes.update({rank: summaries.get(rank) for rank in ranks})
+                    else:
+                        outcomes[ranks[0]] = summaries
+                    newly_summarized.extend(ranks)
+
+                    for rank in ranks:
+                        cluster = sorted(parked.pop(rank, []))
+                        if is_acceptable_summary(outcomes[rank]):
+                            # 대표 기사가 요약되면 같은 군집의 기사는 요약하지 않는다.
+                            outcomes.update({parked_rank: None for parked_rank, _, _ in cluster})
+                        elif cluster:
+                            # 대표 기사의 요약이 실패하면 검색 순위가 가장 높은 중복 기사를 새 대표로 다시 요약한다.
+                            (next_rank, fingerprint, news_body), rest = cluster[0], cluster[1:]
+                            duplicates.replace(rank, next_rank, fingerprint)
+                            heapq.heappush(waiting_articles, (next_rank, news_body))
+                            if rest:
+                                parked[next_rank] = rest
+                            print(f"  -> 대표 기사 요약 실패, 중복 기사로 다시 요약: {title_list[next_rank]}")
+                        else:
+                            duplicates.remove(rank)
+
+            if ordered:
+                accepted, finished = collect_ranked_summaries(outcomes, total, limit)
+                ready = accepted[emitted:]
+            else:
+                ready = [rank for rank in sorted(newly_summarized) if is_acceptable_summary(outcomes[rank])][:limit - emitted]
+                finished = emitted + len(ready) >= limit
+
+            for rank in ready:
+                emitted += 1
+                yield rank, outcomes[rank]
+
+            if finished:
+                break
+    finally:
+        # 요약이 모두 모였거나 호출한 쪽에서 스트림을 닫으면, 남은 기사 요청과 LLM 요청은 취소한다.
+        if fetch_task:
+            fetch_task.cancel()
+            # 진행 중인 anext가 끝나야 제너레이터를 닫을 수 있다.
+            with contextlib.suppress(asyncio.CancelledError, StopAsyncIteration):
+                await fetch_task
+        for task in llm_tasks:
+            task.cancel()
+        await articles.aclose()
+
+        skipped = total - len(outcomes)
+        if skipped:
+            print(f"요약 {emitted}개 확보, 남은 기사 {skipped}개는 처리하지 않고 종료합니다.")
+
+
+async def summarize_weather_news(
+    session: aiohttp.ClientSession,
+    location: str,
+    link_list: List[str],
+    title_list: List[str],
+    limit: int = NEWS_SUMMARY_LIMIT,
+    batch: Optional[bool] = None
+) -> List[Dict[str, str]]:
+    """
+    iter_weather_news_summaries로 검색 순위 순서의 날씨 요약 기사를 limit개까지 모아 반환합니다.
+
+    Args:
+        session (aiohttp.ClientSession): create_news_session으로 생성한 세션입니다.
+        location (str): 검색한 지역 이름입니다.
+        link_list (List[str]): 검색 순위 순서의 기사 URL 리스트입니다.
+        title_list (List[str]): link_list와 같은 순서의 기사 제목 리스트입니다.
+        limit (int): 반환할 요약 기사 수입니다.
+        batch (Optional[bool]): 묶음 요약 사용 여부. None이면 NEWS_SUMMARY_MODE 환경 변수를 따릅니다.
+
+    Returns:
+        List[Dict[str, str]]: 'title', 'summary', 'link_url'을 담은 딕셔너리 리스트 (검색 순위 순서).
+    """
+    return [
+        {
+            "title": title_list[rank],
+            "summary": summary,
+            "link_url": link_list[rank],
+        }
+        async for rank, summary in iter_weather_news_summaries(session, location, link_list, title_list, limit, batch)
+    ]
+
+
+def get_recent_news(location: str, now_epoch: float) -> List[Dict[str, Any]]:
+    """
+    뉴스 데이터베이스에서 최근 1시간 이내에 저장된 해당 지역의 요약 기사를 조회합니다.
 
+    Args:
+        location (str): 지역 이름.
+        now_epoch (float): 기준 시각 (epoch seconds).
+
+    Returns:
+        List[Dict[str, Any]]: 저장된 뉴스 리스트. 없으면 빈 리스트.
+    """
+    # UTC 변환 및 포맷팅 
+    end_time_utc = datetime.fromtimestamp(now_epoch, pytz.UTC).strftime("%Y-%m-%d %H:%M:%S")
+    one_hour_ago = datetime.fromtimestamp(now_epoch, pytz.UTC) - timedelta(hours=1)
+    start_time_utc = one_hour_ago.strftime("%Y-%m-%d %H:%M:%S")
+
+    return NewsRepository.get_by_location_and_time_range(location, start_time_utc, end_time_utc)
 
-async def export_news_summaries_json(latitude: float, longitude: float) -> dict:
+
+async def export_news_summaries_json(latitude: float, longitude: float) -> List[Dict[str, Any]]:
 
     """
-    좌표 기반 지역 날씨 뉴스를 Gemini로 요약 후, 관련 정보를 dict로 반환합니다.
+    좌표 기반 지역 날씨 뉴스를 Gemini로 요약 후, 관련 정보를 리스트로 반환합니다.
 
     세부적으로는 좌표를 행정구역(시)으로 변환, 해당 지역의 날씨 뉴스 크롤링, Gemini API를 통한 기사 요약 과정이 포함됩니다.
+    기사 수집과 요약은 summarize_weather_news에서 하나의 스트림으로 처리되며,
+    요약이 NEWS_SUMMARY_LIMIT개 모이면 나머지 기사는 내려받거나 요약하지 않습니다.
 
     Args:
         latitude (float): 위도.
         longitude (float): 경도.
 
     Returns:
-        dict: 뉴스의 'title', 'summary', 'url'을 포함하는 딕셔너리.
+        List[Dict[str, Any]]: 뉴스의 'title', 'summary', 'link_url'을 포함하는 딕셔너리 리스트.
+                              (JSON 문자열로 변환하지 않은 객체 그대로 반환합니다.)
     """
 
 
     start_time_epoch = time.time()
-    location = await get_city_from_coordinates(latitude, longitude)
+    with record_stage("geocode"):
+        location = await get_city_from_coordinates(latitude, longitude)
     print(f"카카오맵에서 반환한 행정구역(시) 이름: {location}")
     end_time_epoch = time.time()
     print(f"좌표 -> 행정구역(시) 변환 시간: {end_time_epoch - start_time_epoch}")
 
-    # UTC 변환 및 포맷팅 
-    end_time_utc = datetime.fromtimestamp(end_time_epoch, pytz.UTC).strftime("%Y-%m-%d %H:%M:%S")
-    one_hour_ago = datetime.fromtimestamp(end_time_epoch, pytz.UTC) - timedelta(hours=1)
-    start_time_utc = one_hour_ago.strftime("%Y-%m-%d %H:%M:%S")
+    # 행정구역을 찾을 수 없는 좌표(바다 위 등)는 검색할 지역이 없으므로 빈 리스트를 반환한다.
+    if not location:
+        return []
 
-    news_list = NewsRepository.get_by_location_and_time_range(location, start_time_utc, end_time_utc)
+    news_list = get_recent_news(location, end_time_epoch)
 
     # 뉴스 데이터베이스에 저장된 뉴스가 있다면, 그 뉴스를 반환한다.
     if len(news_list) > 0:
         print(f"뉴스 데이터베이스에 저장된 뉴스가 있습니다. 뉴스 데이터베이스에 저장된 뉴스를 반환합니다.")
-        return json.dumps(news_list, ensure_ascii=False, indent=2)
+        return news_list
 
-    start_time = time.time()
-    link_list, title_list, news_list = await get_naver_weather_news_crawler(location)
-    end_time = time.time()
-    print(f"뉴스 크롤링 시간: {end_time - start_time}")
+    async with create_news_session() as session:
+        start_time = time.time()
+        link_list, title_list = await fetch_naver_news_listing(session, location)
+        end_time = time.time()
+        print(f"뉴스 검색 목록 수집 시간: {end_time - start_time}")
 
-    start_time = time.time()
-    prompts = news_to_prompt(title_list, news_list, location)
-    end_time = time.time()
-    print(f"프롬프트화에 걸리는 시간: {end_time - start_time}")
+        start_time = time.time()
+        export_list = await summarize_weather_news(session, location, link_list, title_list)
+        end_time = time.time()
+        print(f"뉴스 수집 및 LLM 요약에 걸리는 시간: {end_time - start_time}")
 
-    start_time = time.time()
-    tasks = [
-        llm_summarize_news(prompt)
-        for prompt in prompts
-    ]
+    # 뉴스 데이터베이스에 저장
+    with record_stage("persist"):
+        for news in export_list:
+            NewsRepository.create(location, news["title"], news["summary"], news["link_url"])
 
-    response_list = await asyncio.gather(*tasks)
-    end_time = time.time()
-    print(f"LLM 뉴스 요약에 걸리는 시간: {end_time - start_time}")
+    return export_list
 
-    # 제외하고 싶은 LLM 답변 문자열
-    undesired_summary_text = "날씨 정보 없음"
 
-    export_list = [
-        {
-            "title": title,
-            "summary": summary,
-            "link_url": link,
-        }
-        for title, summary, link in zip(title_list, response_list, link_list)
-        if title and summary and link and (summary.strip() != undesired_summary_text)
-    ]
+async def stream_news_summaries(latitude: float, longitude: float) -> AsyncIterator[Dict[str, Any]]:
+    """
+    좌표 기반 지역 날씨 뉴스 요약을, LLM 요약이 끝나는 즉시 하나씩 이벤트로 yield 합니다.
+    (스트리밍 뉴스 엔드포인트용. 요약은 LLM 응답 순서대로 나오며, 각 이벤트의 rank로 검색 순위를 알 수 있습니다.)
 
-    # 날씨 요약 기사는 최대 5개까지만 반환
-    export_list = export_list[:5]
+    이벤트 형식:
+        - {"event": "summary", "rank", "title", "summary", "link_url", "elapsed_ms"}: 요약 기사 하나
+        - {"event": "done", "location", "count", "cached", "elapsed_ms", "time_to_first_summary_ms"}: 스트림 종료
 
-    # 뉴스 데이터베이스에 저장
-    for news in export_list:
-        NewsRepository.create(location, news["title"], news["summary"], news["link_url"])
+    Args:
+        latitude (float): 위도.
+        longitude (float): 경도.
 
-    return json.dumps(export_list, ensure_ascii=False, indent=2)
+    Yields:
+        Dict[str, Any]: 위 형식의 이벤트 딕셔너리.
+    """
+    start_time = time.time()
+    first_summary_ms: Optional[int] = None
+    count = 0
+
+    def elapsed_ms() -> int:
+        return int((time.time() - start_time) * 1000)
+
+    with record_stage("geocode"):
+        location = await get_city_from_coordinates(latitude, longitude)
+    news_list = get_recent_news(location, time.time()) if location else []
+    cached = len(news_list) > 0
+
+    if cached:
+        for rank, news in enumerate(news_list[:NEWS_SUMMARY_LIMIT]):
+            count += 1
+            first_summary_ms = first_summary_ms if first_summary_ms is not None else elapsed_ms()
+            yield {"event": "summary", "rank": rank, **news, "elapsed_ms": elapsed_ms()}
+    elif location:
+        # 행정구역을 찾은 경우에만 기사를 검색한다. (바다 위 등 행정구역이 없는 좌표는 done 이벤트만 보냄)
+        async with create_news_session() as session:
+            link_list, title_list = await fetch_naver_news_listing(session, location)
+
+            summaries = iter_weather_news_summaries(session, location, link_list, title_list, ordered=False)
+            completed: Dict[int, str] = {}
+            try:
+                async for rank, summary in summaries:
+                    completed[rank] = summary
+                    count += 1
+                    first_summary_ms = first_summary_ms if first_summary_ms is not None else elapsed_ms()
+                    yield {
+                        "event": "summary",
+                        "rank": rank,
+                        "title": title_list[rank],
+                        "summary": summary,
+                        "link_url": link_list[rank],
+                        "elapsed_ms": elapsed_ms(),
+                    }
+            finally:
+                await summaries.aclose()
+
+            # 1시간 DB 캐시는 저장된 뉴스가 있으면 적중으로 보므로, 클라이언트가 중간에 연결을 끊어 일부만 요약된 경우에는 저장하지 않는다.
+            # (연결이 끊기면 이 generator가 닫히면서 여기까지 오지 않는다)
+            with record_stage("persist"):
+                for rank in sorted(completed):
+                    NewsRepository.create(location, title_list[rank], completed[rank], link_list[rank])
+
+    print(f"뉴스 스트리밍 완료: {location}, 요약 {count}개, 첫 요약까지 {first_summary_ms}ms, 전체 {elapsed_ms()}ms")
+    yield {
+        "event": "done",
+        "location": location,
+        "count": count,
+        "cached": cached,
+        "elapsed_ms": elapsed_ms(),
+        "time_to_first_summary_ms": first_summary_ms,
+    }
     
 
 if __name__ == "__main__":
+    load_dotenv()
     asyncio.run(export_news_summaries_json(33.25235, 126.5125556))
     # asyncio.run(get_naver_weather_news_crawler())
\ No newline at end of file
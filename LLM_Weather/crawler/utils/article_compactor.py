@@ -0,0 +1,137 @@
+import os
+import re
+from typing import List, Tuple
+
+# 토큰 수 추정에 사용할 토큰당 글자 수 (한국어 기사 기준 대략 1토큰 ≈ 2글자)
+CHARS_PER_TOKEN = 2
+
+# 기사 한 건을 LLM에 넣기 전에 줄일 기본 토큰 예산 (NEWS_ARTICLE_TOKEN_BUDGET 환경 변수로 변경 가능)
+DEFAULT_ARTICLE_TOKEN_BUDGET = 1200
+
+# 기온/강수량/확률 등 날씨 수치 표현 (예: 25℃, 영하 3도, 30mm, 60%). 뉴스 크롤러의 날씨 기사 판별에도 사용한다.
+WEATHER_VALUE_PATTERN = re.compile(r"-?\d+(?:\.\d+)?\s*(?:℃|도|mm|㎜|cm|㎝|%|m/s|㎧)")
+# "비"/"눈"은 한 단어(+조사)일 때만 센다. ("준비", "비용", "눈치" 등에 포함된 글자는 제외)
+WEATHER_TERM_PATTERN = re.compile(
+    r"(?<![가-힣])(?:비|눈)(?:가|는|도|이|은|을|를|와|과|소식|예보)?(?![가-힣])|"
+    r"바람|날씨|기온|기상|예보|강수|호우|소나기|장마|폭설|대설|태풍|강풍|황사|미세먼지|"
+    r"폭염|더위|열대야|한파|추위|영하|체감|습도|안개|서리|맑|흐림|구름|일교차|특보"
+)
+
+# 기자 이름/이메일/저작권 문구 등 요약과 무관한 줄
+BYLINE_LINE_PATTERN = re.compile(
+    r"^[가-힣]{2,4}\s*(?:기자|특파원|통신원|인턴기자)\s*(?:\S+@\S+)?$|"
+    r"\S+@\S+\.\S+|ⓒ|©|저작권자|무단\s*전재|재배포\s*금지|Copyright|All rights reserved|"
+    r"^\[?사진\s*=|^<?(?:저작권|제보)",
+    re.IGNORECASE
+)
+# 문단 앞에 붙는 "(춘천=연합뉴스) 홍길동 기자 = " 형식의 머리말
+BYLINE_PREFIX_PATTERN = re.compile(r"^\s*[\[(【][^\])】]{1,30}=[^\])】]{1,20}[\])】]\s*(?:[가-힣]{2,4}\s*(?:기자|특파원)\s*=?\s*)?")
+
+
+def estimate_tokens(text: str) -> int:
+    """
+    텍스트의 LLM 입력 토큰 수를 글자 수로 대략 추정합니다. (토크나이저 호출 없이 빠르게 계산하기 위함)
+
+    Args:
+        text (str): 토큰 수를 추정할 텍스트.
+
+    Returns:
+        int: 추정 토큰 수.
+    """
+    return -(-len(text or "") // CHARS_PER_TOKEN)
+
+
+def clean_article_lines(news_body: str) -> List[str]:
+    """
+    기사 본문을 문단(줄) 단위로 나누고, 바이라인/저작권 문구와 중복된 줄을 제거합니다.
+
+    Args:
+        news_body (str): trafilatura로 추출한 기사 본문.
+
+    Returns:
+        List[str]: 정리된 문단 리스트 (원래 순서 유지).
+    """
+    lines = []
+    seen = set()
+
+    for line in news_body.splitlines():
+        line = BYLINE_PREFIX_PATTERN.sub("", line).strip()
+        if not line or BYLINE_LINE_PATTERN.search(line):
+            continue
+
+        # 공백/문장부호 차이만 있는 줄은 같은 줄로 본다.
+        key = re.sub(r"[\W_]+", "", line)
+        if not key or key in seen:
+            continue
+        seen.add(key)
+        lines.append(line)
+
+    return lines
+
+
+def score_paragraph(paragraph: str, location: str) -> int:
+    """
+    문단이 요약에 필요한 정도를 점수로 계산합니다. (지역명 언급, 날씨 수치, 날씨 단어)
+
+    Args:
+        paragraph (str): 문단.
+        location (str): 요약 대상 지역명.
+
+    Returns:
+        int: 점수 (0이면 지역/날씨와 무관한 문단).
+    """
+    score = 0
+    if location and location in paragraph:
+        score += 3
+    score += 2 * len(WEATHER_VALUE_PATTERN.findall(paragraph))
+    score += len(WEATHER_TERM_PATTERN.findall(paragraph))
+    return score
+
+
+def compact_article(news_body: str, location: str, token_budget: int = None) -> Tuple[str, int, int]:
+    """
+    기사 본문을 토큰 예산 안으로 줄입니다.
+
+    바이라인과 중복 줄을 제거한 뒤에도 예산을 넘으면, 지역명이나 날씨 표현(기온, mm, %, 비/눈/바람 등)이
+    많이 등장하는 문단부터 예산이 찰 때까지 고르고, 고른 문단은 원래 순서대로 이어 붙입니다.
+    첫 문단(리드)은 기사 전체를 요약하는 경우가 많으므로 우선적으로 남깁니다.
+
+    Args:
+        news_body (str): trafilatura로 추출한 기사 본문.
+        location (str): 요약 대상 지역명.
+        token_budget (int, optional): 토큰 예산. None이면 NEWS_ARTICLE_TOKEN_BUDGET 환경 변수 또는 기본값을 사용합니다.
+
+    Returns:
+        Tuple[str, int, int]: (줄인 본문, 원래 추정 토큰 수, 줄인 뒤 추정 토큰 수)
+    """
+    if token_budget is None:
+        token_budget = int(os.getenv("NEWS_ARTICLE_TOKEN_BUDGET", DEFAULT_ARTICLE_TOKEN_BUDGET))
+
+    original_tokens = estimate_tokens(news_body)
+    paragraphs = clean_article_lines(news_body)
+    paragraph_tokens = [estimate_tokens(paragraph) for paragraph in paragraphs]
+
+    if sum(paragraph_tokens) <= token_budget:
+        compacted = "\n".join(paragraphs)
+        return compacted, original_tokens, estimate_tokens(compacted)
+
+    # 점수가 높은 문단부터, 같은 점수면 앞 문단부터 고른다. (리드 문단은 가산점)
+    order = sorted(
+        range(len(paragraphs)),
+        key=lambda index: (-(score_paragraph(paragraphs[index], location) + (2 if index == 0 else 0)), index)
+    )
+
+    selected = []
+    used_tokens = 0
+    for index in order:
+        if used_tokens + paragraph_tokens[index] <= token_budget:
+            selected.append(index)
+            used_tokens += paragraph_tokens[index]
+
+    # 첫 문단 하나만으로도 예산을 넘는 경우, 가장 중요한 문단을 예산 길이만큼 잘라서 사용한다.
+    if not selected and paragraphs:
+        compacted = paragraphs[order[0]][:token_budget * CHARS_PER_TOKEN]
+    else:
+        compacted = "\n".join(paragraphs[index] for index in sorted(selected))
+
+    return compacted, original_tokens, estimate_tokens(compacted)
@@ -0,0 +1,97 @@
+import hashlib
+import re
+from collections import Counter
+from typing import Dict, Optional
+
+# SimHash 지문 비트 수와 문자 shingle 길이
+SIMHASH_BITS = 64
+SHINGLE_SIZE = 4
+
+# 지문 간 해밍 거리가 이 값 이하이면 같은 기사(전재/재송고 기사)로 본다.
+# (서로 무관한 기사끼리는 평균 32, 대부분 20 이상 차이가 난다.)
+SIMHASH_MAX_DISTANCE = 10
+
+
+def _shingles(text: str, size: int = SHINGLE_SIZE) -> Counter:
+    """공백/문장부호를 제거한 텍스트에서 길이 size의 문자 shingle 빈도를 셉니다."""
+    normalized = re.sub(r"[\W_]+", "", text or "").lower()
+    if len(normalized) <= size:
+        return Counter([normalized]) if normalized else Counter()
+    return Counter(normalized[i:i + size] for i in range(len(normalized) - size + 1))
+
+
+def simhash(text: str, size: int = SHINGLE_SIZE) -> int:
+    """
+    텍스트의 SimHash 지문을 계산합니다.
+    한국어는 띄어쓰기와 조사 변화가 많으므로, 단어 대신 문자 shingle을 특징으로 사용합니다.
+
+    Args:
+        text (str): 지문을 계산할 텍스트 (기사 본문).
+        size (int): 문자 shingle 길이.
+
+    Returns:
+        int: SIMHASH_BITS 비트 정수 지문.
+    """
+    weights = [0] * SIMHASH_BITS
+
+    for shingle, count in _shingles(text, size).items():
+        digest = int.from_bytes(hashlib.blake2b(shingle.encode("utf-8"), digest_size=SIMHASH_BITS // 8).digest(), "big")
+        for bit in range(SIMHASH_BITS):
+            weights[bit] += count if digest >> bit & 1 else -count
+
+    fingerprint = 0
+    for bit, weight in enumerate(weights):
+        if weight > 0:
+            fingerprint |= 1 << bit
+    return fingerprint
+
+
+def hamming_distance(a: int, b: int) -> int:
+    """두 지문의 해밍 거리(서로 다른 비트 수)를 반환합니다."""
+    return (a ^ b).bit_count()
+
+
+class NearDuplicateIndex:
+    """
+    기사 지문을 모아 두고, 새 기사가 이미 본 기사와 거의 같은지 찾는 색인.
+    각 군집(cluster)마다 대표 기사 하나의 지문만 저장합니다.
+    """
+
+    def __init__(self, max_distance: int = SIMHASH_MAX_DISTANCE):
+        """
+        NearDuplicateIndex 초기화
+
+        Args:
+            max_distance (int): 같은 기사로 판단할 최대 해밍 거리
+        """
+        self.max_distance = max_distance
+        self.representatives: Dict[int, int] = {}  # 대표 기사 key -> 지문
+
+    def find(self, fingerprint: int) -> Optional[int]:
+        """
+        지문과 거의 같은 대표 기사를 찾습니다.
+
+        Args:
+            fingerprint (int): 찾을 기사의 지문
+
+        Returns:
+            Optional[int]: 같은 군집 대표 기사의 key. 없으면 None.
+        """
+        for key, representative in self.representatives.items():
+            if hamming_distance(fingerprint, representative) <= self.max_distance:
+                return key
+        return None
+
+    def add(self, key: int, fingerprint: int) -> None:
+        """새 군집의 대표 기사를 등록합니다."""
+        self.representatives[key] = fingerprint
+
+    def replace(self, old_key: int, new_key: int, fingerprint: int) -> None:
+        """군집의 대표 기사를 바꿉니다. (더 높은 검색 순위의 기사가 뒤늦게 도착했거나, 대표 기사의 요약이 실패한 경우)"""
+        self.representatives.pop(old_key, None)
+        self.representatives[new_key] = fingerprint
+
+    def remove(self, key: int) -> None:
+        """군집을 지웁니다. (대표 기사의 요약이 실패해 이후에 오는 같은 기사를 새 대표로 삼아야 하는 경우)"""
+        self.representatives.pop(key, None)
+
@@ -0,0 +1,55 @@
+import time
+from collections import defaultdict
+from contextlib import contextmanager
+from contextvars import ContextVar
+from typing import Dict, Iterator, Optional
+
+# 현재 활성화된 StageTimer. (asyncio 태스크는 생성 시점의 컨텍스트를 물려받으므로, 파이프라인 안의 태스크도 같은 타이머에 기록된다.)
+_current_timer: ContextVar[Optional["StageTimer"]] = ContextVar("stage_timer", default=None)
+
+
+class StageTimer:
+    """
+    뉴스 파이프라인의 단계별(지오코딩, 목록 파싱, 기사 수집, 본문 추출, 프롬프트 생성, 요약, 저장 등) 소요 시간을 모으는 클래스.
+    단계들이 동시에 실행되므로, 각 단계의 값은 해당 단계가 실행된 시간의 합계입니다.
+    """
+
+    def __init__(self):
+        """StageTimer 초기화"""
+        self.totals: Dict[str, float] = defaultdict(float)
+        self.counts: Dict[str, int] = defaultdict(int)
+
+    def add(self, stage: str, seconds: float) -> None:
+        """단계 소요 시간을 기록합니다."""
+        self.totals[stage] += seconds
+        self.counts[stage] += 1
+
+    @contextmanager
+    def activate(self) -> Iterator["StageTimer"]:
+        """with 블록 안에서 실행되는 record_stage 호출이 이 타이머에 기록되도록 합니다."""
+        token = _current_timer.set(self)
+        try:
+            yield self
+        finally:
+            _current_timer.reset(token)
+
+
+@contextmanager
+def record_stage(stage: str) -> Iterator[None]:
+    """
+    with 블록의 실행 시간을 현재 활성화된 StageTimer에 기록합니다.
+    활성화된 타이머가 없으면 아무 것도 하지 않습니다. (서버 실행 시에는 기록하지 않음)
+
+    Args:
+        stage (str): 단계 이름
+    """
+    timer = _current_timer.get()
+    if timer is None:
+        yield
+        return
+
+    start = time.perf_counter()
+    try:
+        yield
+    finally:
+        timer.add(stage, time.perf_counter() - start)
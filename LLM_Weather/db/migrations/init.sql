@@ -48,3 +48,13 @@ CREATE TABLE IF NOT EXISTS notifications (
     created_at DATETIME DEFAULT (strftime('%Y-%m-%d %H:%M:%f', 'now'))
 );
 CREATE INDEX idx_notifications_user_id ON notifications(user_id);
+
+
+CREATE TABLE IF NOT EXISTS geocode_cache (
+    kind TEXT NOT NULL,
+    cache_key TEXT NOT NULL,
+    value TEXT,
+    expires_at REAL NOT NULL,
+    created_at DATETIME DEFAULT (strftime('%Y-%m-%d %H:%M:%f', 'now')),
+    PRIMARY KEY (kind, cache_key)
+);
@@ -8,7 +8,7 @@ import aiohttp
 sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
 
 from forecast.check_weather import check_weather
-from kakaoapi.get_coordinates_by_city import get_coordinates_by_city
+from kakaoapi.batch_geocode import geocode_many
 from repositories.user_repository import UserRepository
 from repositories.notification_repository import NotificationRepository
 
@@ -27,11 +27,15 @@ async def push_weather_notification() -> None:
     # 지역별로 지역별로 사람들을 분류한 dictionary. (예: {"서울": [user1, user2], "부산": [user3]})
     grouped_people_by_city = UserRepository.get_all()
 
+    # 지역명 → 좌표(위도, 경도) 변환 (모든 지역을 한 번에 동시 조회)
+    coordinates_list = await geocode_many(list(grouped_people_by_city.keys()))
+
     # 각 지역을 순회하며 해당 지역에 속한 사용자들에게 날씨 알림 전송
-    for city_name, user_list in grouped_people_by_city.items():
+    for (city_name, user_list), coordinates in zip(grouped_people_by_city.items(), coordinates_list):
 
-        # 지역명 → 좌표(위도, 경도) 변환
-        coordinates = await get_coordinates_by_city(city_name)
+        if not coordinates:
+            print(f"'{city_name}' 지역의 좌표를 찾을 수 없어 알림을 건너뜁니다.")
+            continue
         latitude, longitude = coordinates['latitude'], coordinates['longitude']
 
         # 해당 좌표에 대해 6시간 이내 기상 예보 요약 메시지 생성
@@ -0,0 +1,42 @@
+import asyncio
+from typing import Dict, List, Optional, Sequence
+
+from kakaoapi.geocode_cache import FORWARD, get_cached, normalize_city_name
+from kakaoapi.get_coordinates_by_city import get_coordinates_by_city
+
+
+async def geocode_many(city_names: Sequence[str]) -> List[Optional[dict]]:
+    """
+    여러 지역명을 한 번에 좌표로 변환합니다.
+    지역명을 정규화해 중복을 없앤 뒤, 캐시에 있는 지역은 바로 사용하고 나머지만 동시에 조회합니다.
+    (카카오 API 호출 속도는 kakaoapi/rate_limiter.py의 속도 제한기가 조절합니다.)
+
+    Args:
+        city_names (Sequence[str]): 지역명 리스트. ex) ["서울", "부산", " 서울 "]
+
+    Returns:
+        List[Optional[dict]]: 입력과 같은 순서의 {"latitude": float, "longitude": float} 리스트.
+                              찾을 수 없거나 조회에 실패한 지역은 None입니다.
+    """
+    keys = [normalize_city_name(name) for name in city_names]
+    unique_keys = [key for key in dict.fromkeys(keys) if key]
+
+    results: Dict[str, Optional[dict]] = {}
+    missing = []
+    for key in unique_keys:
+        hit, value = get_cached(FORWARD, key)
+        if hit:
+            results[key] = value
+        else:
+            missing.append(key)
+
+    resolved = await asyncio.gather(*[get_coordinates_by_city(key) for key in missing], return_exceptions=True)
+    for key, value in zip(missing, resolved):
+        if isinstance(value, Exception):
+            print(f"지역 좌표 조회 실패 ({key}): {value}")
+            value = None
+        results[key] = value
+
+    print(f"일괄 좌표 변환: 입력 {len(keys)}개, 중복 제거 후 {len(unique_keys)}개, 캐시 {len(unique_keys) - len(missing)}개, 조회 {len(missing)}개")
+    return [results.get(key) for key in keys]
+
@@ -0,0 +1,177 @@
+import asyncio
+import json
+import os
+import sys
+import time
+from collections import OrderedDict
+from typing import Any, Awaitable, Callable, Dict, Tuple
+
+# 상위 디렉토리의 모듈들을 import하기 위해 경로 추가
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from repositories.geocode_cache_repository import GeocodeCacheRepository
+
+# 캐시 종류: 지역명 -> 좌표(forward), 좌표 -> 지역명(reverse)
+FORWARD = "forward"
+REVERSE = "reverse"
+
+# 행정구역 이름/좌표는 거의 바뀌지 않으므로 기본 30일 동안 재사용한다. (GEOCODE_CACHE_TTL_SECONDS 환경 변수로 변경 가능)
+DEFAULT_GEOCODE_TTL_SECONDS = 30 * 24 * 60 * 60
+# 카카오가 결과를 찾지 못한 지역명/좌표는 기본 1일 동안 다시 묻지 않는다. (GEOCODE_NEGATIVE_TTL_SECONDS)
+DEFAULT_GEOCODE_NEGATIVE_TTL_SECONDS = 24 * 60 * 60
+# 메모리 캐시에 유지할 최대 항목 수 (GEOCODE_MEMORY_CACHE_SIZE)
+DEFAULT_GEOCODE_MEMORY_CACHE_SIZE = 10000
+
+# (종류, 키) -> (값, 만료 시각). 오래 사용하지 않은 항목부터 밀려나도록 OrderedDict를 LRU로 사용한다.
+_memory_cache: "OrderedDict[Tuple[str, str], Tuple[Any, float]]" = OrderedDict()
+# 같은 키를 동시에 조회할 때 카카오 API를 한 번만 호출하도록, 진행 중인 조회 task를 공유한다.
+_in_flight: Dict[Tuple[str, str], "asyncio.Task[Any]"] = {}
+
+_stats = {"memory_hits": 0, "db_hits": 0, "misses": 0, "kakao_calls": 0}
+
+
+def _env_int(name: str, default: int) -> int:
+    """정수 환경 변수를 읽고, 없거나 잘못된 값이면 기본값을 반환합니다."""
+    try:
+        return int(os.getenv(name, default))
+    except ValueError:
+        return default
+
+
+def normalize_city_name(city_name: str) -> str:
+    """
+    지역명 캐시 키를 만들기 위해 앞뒤 공백을 없애고 연속된 공백을 하나로 합칩니다.
+
+    Args:
+        city_name (str): 지역명. ex) " 서울  강남구 "
+
+    Returns:
+        str: 정규화된 지역명. ex) "서울 강남구"
+    """
+    return " ".join((city_name or "").split())
+
+
+def coordinates_cache_key(latitude: float, longitude: float) -> str:
+    """좌표 -> 지역명 캐시 키를 만듭니다."""
+    return f"{float(latitude)!r},{float(longitude)!r}"
+
+
+def _remember(kind: str, key: str, value: Any, expires_at: float) -> None:
+    """메모리 캐시에 항목을 저장하고, 최대 크기를 넘으면 가장 오래된 항목을 지웁니다."""
+    _memory_cache[(kind, key)] = (value, expires_at)
+    _memory_cache.move_to_end((kind, key))
+    while len(_memory_cache) > _env_int("GEOCODE_MEMORY_CACHE_SIZE", DEFAULT_GEOCODE_MEMORY_CACHE_SIZE):
+        _memory_cache.popitem(last=False)
+
+
+def get_cached(kind: str, key: str) -> Tuple[bool, Any]:
+    """
+    메모리 캐시, SQLite 캐시 순서로 만료되지 않은 항목을 찾습니다.
+
+    Args:
+        kind (str): FORWARD 또는 REVERSE.
+        key (str): 캐시 키.
+
+    Returns:
+        Tuple[bool, Any]: (캐시 적중 여부, 값). negative 캐시 항목은 (True, None)입니다.
+    """
+    now = time.time()
+
+    entry = _memory_cache.get((kind, key))
+    if entry and entry[1] > now:
+        _memory_cache.move_to_end((kind, key))
+        _stats["memory_hits"] += 1
+        return True, entry[0]
+
+    try:
+        row = GeocodeCacheRepository.get(kind, key)
+    except Exception as e:
+        # DB 캐시를 사용할 수 없어도 카카오 API 조회는 계속되어야 한다.
+        print(f"지오코딩 DB 캐시 조회 실패: {e}")
+        row = None
+
+    if row and row["expires_at"] > now:
+        value = json.loads(row["value"]) if row["value"] is not None else None
+        _remember(kind, key, value, row["expires_at"])
+        _stats["db_hits"] += 1
+        return True, value
+
+    _stats["misses"] += 1
+    return False, None
+
+
+def set_cached(kind: str, key: str, value: Any) -> None:
+    """
+    조회 결과를 메모리와 SQLite 캐시에 저장합니다. value가 None이면 negative TTL로 저장합니다.
+
+    Args:
+        kind (str): FORWARD 또는 REVERSE.
+        key (str): 캐시 키.
+        value (Any): JSON으로 저장할 수 있는 조회 결과 또는 None.
+    """
+    if value is None:
+        ttl = _env_int("GEOCODE_NEGATIVE_TTL_SECONDS", DEFAULT_GEOCODE_NEGATIVE_TTL_SECONDS)
+    else:
+        ttl = _env_int("GEOCODE_CACHE_TTL_SECONDS", DEFAULT_GEOCODE_TTL_SECONDS)
+    expires_at = time.time() + ttl
+
+    _remember(kind, key, value, expires_at)
+    try:
+        GeocodeCacheRepository.upsert(kind, key, json.dumps(value, ensure_ascii=False) if value is not None else None, expires_at)
+    except Exception as e:
+        print(f"지오코딩 DB 캐시 저장 실패: {e}")
+
+
+async def cached_lookup(kind: str, key: str, fetch: Callable[[], Awaitable[Any]]) -> Any:
+    """
+    캐시에 있으면 캐시 값을, 없으면 fetch로 카카오 API를 호출해 결과를 캐시에 저장한 뒤 반환합니다.
+    같은 키에 대한 동시 조회는 한 번의 fetch 결과를 함께 사용합니다.
+    fetch에서 예외가 발생하면(네트워크 오류 등) 캐시에 저장하지 않고 예외를 그대로 전달합니다.
+
+    Args:
+        kind (str): FORWARD 또는 REVERSE.
+        key (str): 캐시 키.
+        fetch (Callable[[], Awaitable[Any]]): 캐시 미스일 때 호출할 비동기 함수. 결과가 없으면 None을 반환해야 합니다.
+
+    Returns:
+        Any: 조회 결과 또는 None.
+    """
+    hit, value = get_cached(kind, key)
+    if hit:
+        return value
+
+    task = _in_flight.get((kind, key))
+    if task is None:
+        task = asyncio.ensure_future(_fetch_and_store(kind, key, fetch))
+        _in_flight[(kind, key)] = task
+        task.add_done_callback(lambda done: _finish_in_flight(kind, key, done))
+
+    # 조회는 요청과 분리된 task에서 실행하므로, 기다리던 요청 하나가 취소되어도 같은 키를 기다리는 다른 요청은 결과를 받는다.
+    return await asyncio.shield(task)
+
+
+async def _fetch_and_store(kind: str, key: str, fetch: Callable[[], Awaitable[Any]]) -> Any:
+    """fetch로 카카오 API를 호출하고 결과를 캐시에 저장합니다."""
+    _stats["kakao_calls"] += 1
+    value = await fetch()
+    set_cached(kind, key, value)
+    return value
+
+
+def _finish_in_flight(kind: str, key: str, task: "asyncio.Task[Any]") -> None:
+    """끝난 조회를 진행 중 목록에서 지웁니다."""
+    if _in_flight.get((kind, key)) is task:
+        del _in_flight[(kind, key)]
+    # 기다리는 쪽이 모두 취소된 경우 "exception was never retrieved" 경고가 나지 않도록 예외를 소비해 둔다.
+    if not task.cancelled():
+        task.exception()
+
+
+def geocode_cache_stats() -> Dict[str, int]:
+    """캐시 적중/미스 횟수와 카카오 API 호출 횟수를 반환합니다."""
+    return {**_stats, "memory_entries": len(_memory_cache)}
+
+
+def clear_memory_cache() -> None:
+    """메모리 캐시를 비웁니다. (SQLite 캐시는 유지)"""
+    _memory_cache.clear()
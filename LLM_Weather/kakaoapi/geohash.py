@@ -0,0 +1,70 @@
+from typing import Tuple
+
+# geohash에서 사용하는 base32 문자 (a, i, l, o 제외)
+GEOHASH_BASE32 = "0123456789bcdefghjkmnpqrstuvwxyz"
+
+
+def encode(latitude: float, longitude: float, precision: int) -> str:
+    """
+    좌표를 지정한 길이의 geohash 문자열로 변환합니다.
+    (길이 5 ≈ 4.9km x 4.9km, 6 ≈ 1.2km x 0.6km, 7 ≈ 153m x 153m 크기의 칸)
+
+    Args:
+        latitude (float): 위도.
+        longitude (float): 경도.
+        precision (int): geohash 문자열 길이.
+
+    Returns:
+        str: geohash 문자열. ex) encode(37.5665, 126.9780, 6) -> "wydm9q"
+    """
+    lat_range = [-90.0, 90.0]
+    lon_range = [-180.0, 180.0]
+
+    chars = []
+    bits, bit_count, even = 0, 0, True
+    while len(chars) < precision:
+        # 경도, 위도 순서로 번갈아 가며 구간을 반으로 나눈다.
+        value_range, value = (lon_range, longitude) if even else (lat_range, latitude)
+        mid = (value_range[0] + value_range[1]) / 2
+        if value >= mid:
+            bits = (bits << 1) | 1
+            value_range[0] = mid
+        else:
+            bits <<= 1
+            value_range[1] = mid
+        even = not even
+
+        bit_count += 1
+        if bit_count == 5:
+            chars.append(GEOHASH_BASE32[bits])
+            bits, bit_count = 0, 0
+
+    return "".join(chars)
+
+
+def bounds(geohash: str) -> Tuple[float, float, float, float]:
+    """
+    geohash 칸의 경계 좌표를 반환합니다.
+
+    Args:
+        geohash (str): geohash 문자열.
+
+    Returns:
+        Tuple[float, float, float, float]: (남쪽 위도, 서쪽 경도, 북쪽 위도, 동쪽 경도)
+    """
+    lat_range = [-90.0, 90.0]
+    lon_range = [-180.0, 180.0]
+
+    even = True
+    for char in geohash:
+        bits = GEOHASH_BASE32.index(char)
+        for shift in range(4, -1, -1):
+            value_range = lon_range if even else lat_range
+            mid = (value_range[0] + value_range[1]) / 2
+            if (bits >> shift) & 1:
+                value_range[0] = mid
+            else:
+                value_range[1] = mid
+            even = not even
+
+    return lat_range[0], lon_range[0], lat_range[1], lon_range[1]
@@ -1,23 +1,120 @@
-from dotenv import load_dotenv
-
 import os
 import aiohttp
+from typing import Optional
+
+from kakaoapi import geohash
+from kakaoapi.geocode_cache import REVERSE, cached_lookup, coordinates_cache_key
+from kakaoapi.offline_reverse_geocoder import OFFLINE_MAX_DISTANCE_KM, admin_area_names_in_bounds, canonical_city_name, reverse_geocode_offline
+from kakaoapi.rate_limiter import get_kakao_rate_limiter
+
+# 역지오코딩 캐시 키로 사용할 geohash 칸 길이 (기본 6 ≈ 1.2km x 0.6km). 0 이하이면 칸을 사용하지 않는다. (GEOCODE_GEOHASH_PRECISION)
+DEFAULT_GEOHASH_PRECISION = 6
+# 칸이 행정구역 경계에 걸쳐 있으면, 한 행정구역 안에 들어가는 더 작은 칸(geohash 길이 +1, 약 1/32 크기)을 이 단계까지 찾는다.
+GEOHASH_REFINE_LEVELS = 2
+# 행정구역 경계에 걸친 칸 안에서는 좌표를 이 소수점 자릿수(기본 4 ≈ 11m)로 반올림해 좌표마다 조회한다. (GEOCODE_COORDINATE_DECIMALS)
+DEFAULT_COORDINATE_DECIMALS = 4
+
+
+def _env_int(name: str, default: int) -> int:
+    """정수 환경 변수를 읽고, 없거나 잘못된 값이면 기본값을 반환합니다."""
+    try:
+        return int(os.getenv(name, default))
+    except ValueError:
+        return default
+
+
+def reverse_geocode_cache_key(latitude: float, longitude: float) -> str:
+    """
+    좌표 -> 지역명 캐시 키를 만듭니다.
+    좌표가 속한 geohash 칸 전체가 (함께 배포한 행정구역 데이터 기준) 한 행정구역 안에 있으면 칸 단위 키를 사용합니다.
+    칸이 행정구역 경계에 걸쳐 있으면(mixed) GEOHASH_REFINE_LEVELS단계까지 더 작은 칸을 확인하고,
+    그래도 경계에 걸쳐 있으면 소수점 GEOCODE_COORDINATE_DECIMALS자리로 반올림한 좌표 키를 사용합니다.
+    (칸 판단은 네트워크 호출 없이 행정구역 데이터로만 하므로, 카카오 API 호출은 키마다 한 번입니다.)
+
+    Args:
+        latitude (float): 위도 값.
+        longitude (float): 경도 값.
+
+    Returns:
+        str: 캐시 키. ex) "geohash6:wydm9q", "geohash8:wydm9qxy", "37.5665,126.978"
+    """
+    precision = _env_int("GEOCODE_GEOHASH_PRECISION", DEFAULT_GEOHASH_PRECISION)
+    if precision > 0:
+        bucket = geohash.encode(latitude, longitude, precision + GEOHASH_REFINE_LEVELS)
+        for length in range(precision, precision + GEOHASH_REFINE_LEVELS + 1):
+            if len(admin_area_names_in_bounds(*geohash.bounds(bucket[:length]))) == 1:
+                return f"geohash{length}:{bucket[:length]}"
+
+    decimals = _env_int("GEOCODE_COORDINATE_DECIMALS", DEFAULT_COORDINATE_DECIMALS)
+    if decimals >= 0:
+        latitude, longitude = round(latitude, decimals), round(longitude, decimals)
+    return coordinates_cache_key(latitude, longitude)
+
+
+def offline_geocoder_enabled() -> bool:
+    """OFFLINE_REVERSE_GEOCODER 환경 변수로 오프라인 역지오코딩 사용 여부를 읽습니다. (기본 사용)"""
+    return os.getenv("OFFLINE_REVERSE_GEOCODER", "1").lower() not in ("0", "false", "no")
+
+
+async def get_city_from_coordinates(latitude: float, longitude: float) -> Optional[str]:
+    """
+    좌표로부터 행정구역(시) 이름을 가져옵니다.
+    먼저 함께 배포한 행정구역 데이터(kakaoapi/offline_reverse_geocoder.py)로 네트워크 호출 없이 찾고,
+    행정구역 경계 근처라 결과를 신뢰하기 어려울 때만 카카오맵 REST API로 확인합니다.
+    카카오맵 API 호출이 실패하면 (바다 위 등 행정구역 밖이 아닌 한) 오프라인 결과를 그대로 사용합니다.
 
-async def get_city_from_coordinates(latitude: float, longitude: float) -> str:
+    Args:
+        latitude (float): 위도 값.
+        longitude (float): 경도 값.
+
+    Returns:
+        Optional[str]: 변환된 행정구역(시)의 이름입니다. 해당 좌표의 행정구역 정보를 찾을 수 없는 경우 None을 반환합니다.
+    """
+    offline = reverse_geocode_offline(latitude, longitude) if offline_geocoder_enabled() else None
+    if offline and offline["confident"]:
+        return offline["name"]
+
+    try:
+        return await get_city_from_kakao(latitude, longitude)
+    except Exception as e:
+        if offline is None or offline["distance_km"] > OFFLINE_MAX_DISTANCE_KM:
+            raise
+        print(f"카카오맵 행정구역 조회 실패, 오프라인 결과({offline['name']})를 사용합니다: {e}")
+        return offline["name"]
+
+
+async def get_city_from_kakao(latitude: float, longitude: float) -> Optional[str]:
     """
     카카오맵 REST API를 사용하여 좌표로부터 행정구역(시) 이름을 가져옵니다.
+    GPS 좌표는 매번 조금씩 다르므로, reverse_geocode_cache_key로 만든 geohash 칸 단위로 캐시합니다.
+    칸의 첫 조회 결과를 칸 전체에 사용하고, 행정구역 경계에 걸친 칸에서만 좌표마다 조회합니다.
+    (KAKAO_REST_API_KEY 환경 변수는 서버 시작 시 load_dotenv로 읽어 둡니다.)
 
     Args:
         latitude (float): 위도 값.
         longitude (float): 경도 값.
 
     Returns:
-        str: 변환된 행정구역(시)의 이름입니다. API 호출에 실패하거나 해당 좌표의
-             행정구역 정보를 찾을 수 없는 경우, 빈 문자열("")이나 None을 반환할 수 있습니다.
+        Optional[str]: 변환된 행정구역(시)의 이름입니다. 해당 좌표의 행정구역 정보를 찾을 수 없는 경우 None을 반환합니다.
     """
+    return await cached_lookup(
+        REVERSE,
+        reverse_geocode_cache_key(latitude, longitude),
+        lambda: request_city_from_coordinates(latitude, longitude)
+    )
 
-    load_dotenv()
 
+async def request_city_from_coordinates(latitude: float, longitude: float) -> Optional[str]:
+    """
+    캐시를 거치지 않고 카카오맵 좌표 -> 행정구역 변환 API로 행정구역(시) 이름을 조회합니다.
+
+    Args:
+        latitude (float): 위도 값.
+        longitude (float): 경도 값.
+
+    Returns:
+        Optional[str]: canonical_city_name으로 만든 행정구역 이름 또는 결과가 없으면 None.
+    """
     url = "https://dapi.kakao.com/v2/local/geo/coord2regioncode"
     params = {
         "x": str(longitude),
@@ -28,32 +125,27 @@ async def get_city_from_coordinates(latitude: float, longitude: float) -> str:
         "Authorization": f"KakaoAK {os.environ.get('KAKAO_REST_API_KEY')}"
     }
 
+    # 모든 카카오 API 호출이 하나의 속도 제한기를 함께 사용한다.
+    await get_kakao_rate_limiter().acquire()
+
     async with aiohttp.ClientSession() as session:
         async with session.get(url, params=params, headers=headers) as response:
 
             print(f"KakaoMap Response Status Code(행정구역명으로 변환): {response.status}")
             
+            # 일시적인 오류는 '결과 없음'으로 캐시되지 않도록 예외를 발생시킨다.
+            response.raise_for_status()
             json_response = await response.json()
 
-            print(json_response.get('documents')[0])
+            documents = json_response.get('documents') or []
+            if not documents:
+                return None
 
-            document = json_response.get('documents')[0]
+            print(documents[0])
 
-            location = document.get('region_2depth_name')
+            document = documents[0]
 
-            # 'region_2depth_name'(구 단위)이 비어있을 경우, 'region_1depth_name'(시도 단위)로 대체한다. ex) 세종특별자치시
-            if location == '':
-                location = document.get('region_1depth_name')
-            
-
-            # 시로 끝나는 경우 시를 제거한다.
-            if location.endswith("시"):
-                location = location.removesuffix("시")
-            # 군으로 끝나는 경우 군을 제거한다.
-            elif location.endswith("군"):
-                location = location.removesuffix("군")
-            # 구로 끝나는 경우 구를 제거한다.
-            elif location.endswith("구"):
-                location = location.removesuffix("구")
-            
-            return location
\ No newline at end of file
+            # 일반구가 있는 시("수원시 장안구")는 시 단위로 합치고, 'region_2depth_name'(구 단위)이 비어있을 경우 'region_1depth_name'(시도 단위)을 사용한다. ex) 세종특별자치시
+            # 함께 배포한 행정구역 데이터와 같은 규칙이므로, 오프라인으로 찾든 카카오로 찾든 같은 이름이 된다.
+            location = canonical_city_name(document.get('region_1depth_name', ''), document.get('region_2depth_name', ''))
+            return location
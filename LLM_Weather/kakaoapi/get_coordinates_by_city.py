@@ -3,22 +3,44 @@ from dotenv import load_dotenv
 import os
 import aiohttp
 import asyncio
+from typing import Optional
 
-async def get_coordinates_by_city(city_name: str) -> dict:
+from kakaoapi.geocode_cache import FORWARD, cached_lookup, normalize_city_name
+from kakaoapi.rate_limiter import get_kakao_rate_limiter
+
+async def get_coordinates_by_city(city_name: str) -> Optional[dict]:
     """
     카카오맵 REST API를 사용하여 시 이름으로 좌표(위도, 경도값)를 가져옵니다.
+    조회 결과(결과 없음 포함)는 지오코딩 캐시(kakaoapi/geocode_cache.py)에 저장되어, 같은 지역명은 다시 API를 호출하지 않습니다.
 
     Args:
         city_name (str): 시 이름. ex) 원주, 춘천, 서울, 부산, 여수
 
     Returns:
-        dict: 좌표 정보를 담은 딕셔너리로, 다음과 같은 형식입니다:
+        Optional[dict]: 좌표 정보를 담은 딕셔너리로, 다음과 같은 형식입니다:
               {
                   "latitude": float,   # 위도
                   "longitude": float   # 경도
               }
+              카카오맵에서 해당 지역을 찾을 수 없으면 None을 반환합니다.
+    """
+    city_name = normalize_city_name(city_name)
+    if not city_name:
+        return None
+
+    return await cached_lookup(FORWARD, city_name, lambda: request_coordinates_by_city(city_name))
+
+
+async def request_coordinates_by_city(city_name: str) -> Optional[dict]:
     """
+    캐시를 거치지 않고 카카오맵 주소 검색 API로 좌표를 조회합니다.
 
+    Args:
+        city_name (str): 시 이름.
+
+    Returns:
+        Optional[dict]: {"latitude": float, "longitude": float} 또는 검색 결과가 없으면 None.
+    """
     url = "https://dapi.kakao.com/v2/local/search/address.json"
     params = {
         'query': city_name
@@ -28,13 +50,21 @@ async def get_coordinates_by_city(city_name: str) -> dict:
         'Authorization': f"KakaoAK {os.environ.get('KAKAO_REST_API_KEY')}"
     }
 
+    # 모든 카카오 API 호출이 하나의 속도 제한기를 함께 사용한다.
+    await get_kakao_rate_limiter().acquire()
+
     async with aiohttp.ClientSession() as session:
         async with session.get(url=url, params=params, headers=headers) as response:
             print(f"KakaoMap Response Status Code(좌표로 변환): {response.status}")
 
+            # 일시적인 오류는 '결과 없음'으로 캐시되지 않도록 예외를 발생시킨다.
+            response.raise_for_status()
             json_response = await response.json()
             
-            document = json_response.get('documents')[0]
+            documents = json_response.get('documents') or []
+            if not documents:
+                return None
+            document = documents[0]
 
             # Y 좌표값 (=위도, latitude)
             latitude = float(document['y'])
@@ -48,4 +78,3 @@ async def get_coordinates_by_city(city_name: str) -> dict:
 if __name__ == "__main__":
     load_dotenv()
     print(asyncio.run(get_coordinates_by_city("원주")))
-
@@ -0,0 +1,191 @@
+import csv
+import os
+import sys
+from typing import Any, Dict, List, Optional, Set
+
+import numpy as np
+from scipy.spatial import cKDTree
+
+# 상위 디렉토리의 모듈들을 import하기 위해 경로 추가
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from utils.geo_math import chord_to_km, to_unit_vectors
+
+# 함께 배포하는 행정구역 대표 좌표 데이터 (시군구청 위치 기준, 일반구가 있는 시는 구마다 한 줄)
+# 행정구역이 바뀌면 새 버전 파일을 추가하고 이 값을 바꾼다.
+ADMIN_AREA_DATASET_VERSION = "v1"
+ADMIN_AREA_DATASET_PATH = os.path.join(os.path.dirname(os.path.abspath(__file__)), "data", f"admin_areas_{ADMIN_AREA_DATASET_VERSION}.csv")
+
+# 가장 가까운 대표 좌표가 이 거리보다 멀면 (바다, 국외 등) 신뢰하지 않는다.
+OFFLINE_MAX_DISTANCE_KM = 20.0
+# 대표 좌표(시군구청) 하나로는 행정구역 경계를 알 수 없으므로, 경계에서 충분히 먼 좌표만 신뢰한다. (나머지는 카카오 API로 확인)
+# - 가장 가까운 대표 좌표에서 이 거리(km) 안이어야 하고
+OFFLINE_CONFIDENT_RADIUS_KM = 2.5
+# - 다른 지역의 가장 가까운 대표 좌표까지의 거리가 이 배수 이상이고, 이 거리(km) 이상 더 멀어야 한다.
+# ex) 화성시 봉담(수원 권선구청 4.9km, 화성 쪽 대표 좌표 10.6km)은 거리 조건에서 걸러져 카카오 API로 확인한다.
+OFFLINE_MIN_DISTANCE_RATIO = 3.0
+OFFLINE_MIN_MARGIN_KM = 5.0
+# 다른 지역의 대표 좌표를 찾기 위해 조회할 이웃 수 (같은 시의 일반구 좌표가 여러 개이므로 넉넉히 조회)
+OFFLINE_NEIGHBOR_COUNT = 8
+
+
+def canonical_city_name(sido: str, sigungu: str) -> str:
+    """
+    행정구역 이름을 챗봇/뉴스 캐시에서 사용하는 하나의 이름으로 만듭니다.
+    카카오맵 API 결과(region_1depth_name, region_2depth_name)와 함께 배포한 데이터(sido, sigungu)에 같은 규칙을 사용해,
+    같은 곳은 어느 경로로 찾든 같은 이름이 됩니다.
+
+    Args:
+        sido (str): 시도 이름. ex) "경기도", "세종특별자치시"
+        sigungu (str): 시군구 이름 (일반구가 있는 시는 "수원시 장안구"처럼 시와 구를 함께 씀, 없으면 빈 문자열).
+
+    Returns:
+        str: 일반구를 빼고 시/군/구 접미사를 제거한 이름. ex) "수원시 장안구" -> "수원", "종로구" -> "종로"
+    """
+    # 일반구가 있는 시는 시 단위로 합친다.
+    name = (sigungu or "").split(" ")[0] or sido
+    for suffix in ("시", "군", "구"):
+        if name.endswith(suffix):
+            return name.removesuffix(suffix)
+    return name
+
+
+def load_admin_areas(path: str = ADMIN_AREA_DATASET_PATH) -> List[Dict[str, Any]]:
+    """
+    행정구역 대표 좌표 CSV를 읽습니다.
+
+    Args:
+        path (str): CSV 파일 경로.
+
+    Returns:
+        List[Dict[str, Any]]: 'sido', 'sigungu', 'name', 'name_en', 'latitude', 'longitude'를 담은 딕셔너리 리스트.
+                              name은 canonical_city_name으로 만든 이름입니다. (카카오맵 API 결과와 같은 형식)
+    """
+    with open(path, encoding="utf-8") as f:
+        return [
+            {
+                **row,
+                "name": canonical_city_name(row["sido"], row["sigungu"]),
+                "latitude": float(row["latitude"]),
+                "longitude": float(row["longitude"]),
+            }
+            for row in csv.DictReader(f)
+        ]
+
+
+class AdminAreaIndex:
+    """행정구역 대표 좌표를 KD-tree로 색인해, 좌표에서 가장 가까운 행정구역을 찾는 클래스"""
+
+    def __init__(self, areas: List[Dict[str, Any]]):
+        """
+        Args:
+            areas (List[Dict[str, Any]]): load_admin_areas가 반환한 행정구역 리스트.
+        """
+        self.areas = areas
+        self.tree = cKDTree(to_unit_vectors(
+            np.array([area["latitude"] for area in areas]),
+            np.array([area["longitude"] for area in areas])
+        ))
+
+    def lookup(self, latitude: float, longitude: float) -> Optional[Dict[str, Any]]:
+        """
+        좌표에서 가장 가까운 행정구역과, 그 결과를 신뢰할 수 있는지를 반환합니다.
+        가장 가까운 대표 좌표까지의 거리(distance_km)와 다른 지역의 가장 가까운 대표 좌표까지의 거리(runner_up_km)를 비교해,
+        대표 좌표에 가깝고 다른 지역과는 충분히 멀어 경계 근처가 아닐 때만 confident를 True로 표시합니다.
+
+        Args:
+            latitude (float): 위도.
+            longitude (float): 경도.
+
+        Returns:
+            Optional[Dict[str, Any]]: 'name', 'name_en', 'sido', 'sigungu', 'distance_km', 'runner_up_km', 'confident'
+                                      또는 색인이 비어 있으면 None.
+        """
+        if not self.areas:
+            return None
+
+        count = min(OFFLINE_NEIGHBOR_COUNT, len(self.areas))
+        chords, indices = self.tree.query(to_unit_vectors(np.array([latitude]), np.array([longitude]))[0], k=count)
+        chords, indices = np.atleast_1d(chords), np.atleast_1d(indices)
+
+        nearest = self.areas[indices[0]]
+        distance_km = chord_to_km(chords[0])
+
+        # 같은 이름(같은 시의 다른 일반구)은 건너뛰고, 다른 지역 중 가장 가까운 좌표를 찾는다.
+        runner_up_km = next(
+            (chord_to_km(chord) for chord, index in zip(chords[1:], indices[1:]) if self.areas[index]["name"] != nearest["name"]),
+            float("inf")
+        )
+
+        confident = (
+            distance_km <= OFFLINE_CONFIDENT_RADIUS_KM
+            and runner_up_km >= distance_km * OFFLINE_MIN_DISTANCE_RATIO
+            and runner_up_km - distance_km >= OFFLINE_MIN_MARGIN_KM
+        )
+
+        return {
+            "name": nearest["name"],
+            "name_en": nearest["name_en"],
+            "sido": nearest["sido"],
+            "sigungu": nearest["sigungu"],
+            "distance_km": distance_km,
+            "runner_up_km": runner_up_km,
+            "confident": confident,
+        }
+
+    def names_in_bounds(self, south: float, west: float, north: float, east: float) -> Set[str]:
+        """
+        위도/경도 사각형 안의 좌표에 대해 lookup이 돌려줄 수 있는 행정구역 이름을 모두 반환합니다.
+        사각형 중심에서 가장 가까운 대표 좌표까지의 거리를 d, 중심에서 가장 먼 꼭짓점까지의 거리를 r이라 하면,
+        사각형 안의 어느 좌표에서든 가장 가까운 대표 좌표는 중심에서 d + 2r 안에 있습니다.
+
+        Args:
+            south (float): 남쪽 위도.
+            west (float): 서쪽 경도.
+            north (float): 북쪽 위도.
+            east (float): 동쪽 경도.
+
+        Returns:
+            Set[str]: 행정구역 이름 집합. 두 개 이상이면 사각형이 (대표 좌표 기준) 행정구역 경계에 걸쳐 있습니다.
+        """
+        if not self.areas:
+            return set()
+
+        center = to_unit_vectors(np.array([(south + north) / 2]), np.array([(west + east) / 2]))[0]
+        corners = to_unit_vectors(np.array([south, south, north, north]), np.array([west, east, west, east]))
+        radius_chord = float(np.max(np.linalg.norm(corners - center, axis=1)))
+
+        nearest_chord, _ = self.tree.query(center)
+        # 현 거리도 삼각 부등식을 만족하므로, 지표면 거리 대신 현 거리로 같은 범위를 구할 수 있다.
+        indices = self.tree.query_ball_point(center, nearest_chord + 2 * radius_chord + 1e-12)
+        return {self.areas[index]["name"] for index in indices}
+
+
+_admin_area_index: Optional[AdminAreaIndex] = None
+
+
+def get_admin_area_index() -> AdminAreaIndex:
+    """행정구역 색인을 처음 사용할 때 한 번만 만들어 재사용합니다."""
+    global _admin_area_index
+    if _admin_area_index is None:
+        _admin_area_index = AdminAreaIndex(load_admin_areas())
+    return _admin_area_index
+
+
+def reverse_geocode_offline(latitude: float, longitude: float) -> Optional[Dict[str, Any]]:
+    """
+    네트워크 호출 없이, 함께 배포한 행정구역 데이터로 좌표의 행정구역을 추정합니다.
+
+    Args:
+        latitude (float): 위도.
+        longitude (float): 경도.
+
+    Returns:
+        Optional[Dict[str, Any]]: AdminAreaIndex.lookup의 결과.
+    """
+    return get_admin_area_index().lookup(latitude, longitude)
+
+
+def admin_area_names_in_bounds(south: float, west: float, north: float, east: float) -> Set[str]:
+    """함께 배포한 행정구역 데이터로, 위도/경도 사각형이 걸쳐 있는 행정구역 이름을 모두 찾습니다. (AdminAreaIndex.names_in_bounds)"""
+    return get_admin_area_index().names_in_bounds(south, west, north, east)
@@ -0,0 +1,72 @@
+import asyncio
+import os
+import threading
+import time
+from typing import Optional
+
+# 카카오 로컬 API에 보낼 초당 요청 수와 순간 최대 요청 수 (KAKAO_RATE_LIMIT_PER_SECOND, KAKAO_RATE_LIMIT_BURST 환경 변수로 변경 가능)
+# KAKAO_RATE_LIMIT_PER_SECOND가 0 이하이면 속도를 제한하지 않는다.
+DEFAULT_KAKAO_RATE_PER_SECOND = 10.0
+DEFAULT_KAKAO_BURST = 10
+
+
+class TokenBucket:
+    """
+    토큰 버킷 방식의 비동기 요청 속도 제한기.
+    토큰이 부족하면 음수로 '예약'해 두고 그만큼 기다리므로, 먼저 요청한 쪽이 먼저 실행됩니다.
+    (await 없이 예약하므로 이벤트 루프나 스레드가 달라도 같은 버킷을 함께 사용할 수 있습니다.)
+    """
+
+    def __init__(self, rate_per_second: float, burst: int):
+        """
+        Args:
+            rate_per_second (float): 초당 채워지는 토큰 수. 0 이하이면 속도를 제한하지 않습니다.
+            burst (int): 버킷 최대 크기 (한 번에 보낼 수 있는 최대 요청 수).
+        """
+        self.rate = rate_per_second
+        self.capacity = burst
+        self.tokens = float(burst)
+        self.updated = time.monotonic()
+        self._lock = threading.Lock()
+
+    def reserve(self) -> float:
+        """토큰 하나를 예약하고, 사용할 수 있을 때까지 기다려야 하는 시간(초)을 반환합니다."""
+        if self.rate <= 0:
+            return 0.0
+        with self._lock:
+            now = time.monotonic()
+            self.tokens = min(self.capacity, self.tokens + (now - self.updated) * self.rate)
+            self.updated = now
+            self.tokens -= 1
+            return 0.0 if self.tokens >= 0 else -self.tokens / self.rate
+
+    async def acquire(self) -> None:
+        """토큰을 사용할 수 있을 때까지 기다립니다."""
+        delay = self.reserve()
+        if delay > 0:
+            await asyncio.sleep(delay)
+
+
+_kakao_rate_limiter: Optional[TokenBucket] = None
+
+
+def _env_number(name: str, default, cast):
+    """숫자 환경 변수를 읽고, 없거나 잘못된 값이면 기본값을 반환합니다."""
+    try:
+        return cast(os.getenv(name, default))
+    except ValueError:
+        return default
+
+
+def get_kakao_rate_limiter() -> TokenBucket:
+    """카카오 API 호출이 모두 함께 사용하는 속도 제한기를 반환합니다."""
+    global _kakao_rate_limiter
+    if _kakao_rate_limiter is None:
+        rate = _env_number("KAKAO_RATE_LIMIT_PER_SECOND", DEFAULT_KAKAO_RATE_PER_SECOND, float)
+        if not rate > 0:
+            # 0, 음수, nan은 모두 '제한 없음'으로 처리한다.
+            print(f"KAKAO_RATE_LIMIT_PER_SECOND={rate}: 카카오 API 속도 제한을 사용하지 않습니다.")
+            rate = 0.0
+        burst = max(1, _env_number("KAKAO_RATE_LIMIT_BURST", DEFAULT_KAKAO_BURST, int))
+        _kakao_rate_limiter = TokenBucket(rate, burst)
+    return _kakao_rate_limiter
@@ -4,11 +4,13 @@ from .news_repository import NewsRepository
 from .chat_repository import ChatRepository
 from .chat_message_repository import ChatMessageRepository
 from .notification_repository import NotificationRepository
+from .geocode_cache_repository import GeocodeCacheRepository
 
 __all__ = [
     'UserRepository',
     'NewsRepository', 
     'ChatRepository',
     'ChatMessageRepository',
-    'NotificationRepository'
+    'NotificationRepository',
+    'GeocodeCacheRepository'
 ] 
\ No newline at end of file
@@ -0,0 +1,63 @@
+import time
+from typing import Dict, Optional
+from db.db_connection import get_db_cursor
+
+# init.sql이 적용되기 전에 만들어진 DB에서도 동작하도록, 처음 사용할 때 테이블을 생성한다.
+CREATE_GEOCODE_CACHE_TABLE = """
+CREATE TABLE IF NOT EXISTS geocode_cache (
+    kind TEXT NOT NULL,
+    cache_key TEXT NOT NULL,
+    value TEXT,
+    expires_at REAL NOT NULL,
+    created_at DATETIME DEFAULT (strftime('%Y-%m-%d %H:%M:%f', 'now')),
+    PRIMARY KEY (kind, cache_key)
+)
+"""
+
+class GeocodeCacheRepository:
+    """카카오 지오코딩 결과 캐시 작업을 위한 저장소"""
+
+    _table_ready = False
+
+    @staticmethod
+    def ensure_table() -> None:
+        """geocode_cache 테이블이 없으면 생성하고, 프로세스 시작 후 처음 사용할 때 만료된 항목을 정리"""
+        if GeocodeCacheRepository._table_ready:
+            return
+        with get_db_cursor() as cursor:
+            cursor.execute(CREATE_GEOCODE_CACHE_TABLE)
+        GeocodeCacheRepository._table_ready = True
+        # 만료된 항목과 negative 캐시가 계속 쌓이지 않도록 시작할 때 한 번 정리한다.
+        deleted = GeocodeCacheRepository.delete_expired(time.time())
+        if deleted:
+            print(f"만료된 지오코딩 캐시 {deleted}건 삭제")
+
+    @staticmethod
+    def get(kind: str, cache_key: str) -> Optional[Dict[str, any]]:
+        """종류(forward/reverse)와 키로 캐시 항목 조회 (만료 여부는 호출하는 쪽에서 판단)"""
+        GeocodeCacheRepository.ensure_table()
+        with get_db_cursor() as cursor:
+            cursor.execute(
+                "SELECT kind, cache_key, value, expires_at FROM geocode_cache WHERE kind = ? AND cache_key = ?",
+                (kind, cache_key)
+            )
+            row = cursor.fetchone()
+            return dict(row) if row else None
+
+    @staticmethod
+    def upsert(kind: str, cache_key: str, value: Optional[str], expires_at: float) -> None:
+        """캐시 항목 저장 (value가 None이면 '결과 없음'을 저장하는 negative 캐시)"""
+        GeocodeCacheRepository.ensure_table()
+        with get_db_cursor() as cursor:
+            cursor.execute(
+                "INSERT OR REPLACE INTO geocode_cache (kind, cache_key, value, expires_at) VALUES (?, ?, ?, ?)",
+                (kind, cache_key, value, expires_at)
+            )
+
+    @staticmethod
+    def delete_expired(now_epoch: float) -> int:
+        """만료된 캐시 항목 삭제"""
+        GeocodeCacheRepository.ensure_table()
+        with get_db_cursor() as cursor:
+            cursor.execute("DELETE FROM geocode_cache WHERE expires_at < ?", (now_epoch,))
+            return cursor.rowcount
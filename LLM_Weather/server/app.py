@@ -1,21 +1,31 @@
 from contextlib import asynccontextmanager
-from crawler.naver_news_crawler import export_news_summaries_json
+from crawler.naver_news_crawler import export_news_summaries_json, stream_news_summaries
 from fastapi import FastAPI
 from fastapi.middleware.cors import CORSMiddleware
 from fastapi import FastAPI, HTTPException
+from fastapi.responses import StreamingResponse
 from pydantic import BaseModel
 from dotenv import load_dotenv
 from apscheduler.schedulers.background import BackgroundScheduler
 
 import os
 import json
+import asyncio
 import warnings
+from typing import List
 
 from repositories.user_repository import UserRepository
 from repositories.notification_repository import NotificationRepository
 from repositories.user_repository import UserRepository
 
 from chatbot.chatbot_service import ChatbotService
+from chatbot.utils.cctv_utils import close_cctv_service
+from chatbot.utils.cctv_snapshot import run_cctv_snapshot_scheduler
+from chatbot.utils.llm_runner import get_gemini_runner
+from chatbot.utils.intent_classifier import intent_stats
+from chatbot.utils.answer_cache import answer_cache_stats
+from chatbot.utils.conversation_cache import get_conversation_cache
+from chatbot.utils.forecast_prefetch import forecast_prefetch_stats
 from forecast.forecast_service import ForecastService
 from forecast.push_weather_notification import push_weather_notification
 
@@ -33,10 +43,14 @@ class ChatRequest(BaseModel):
     chat_id: int = None
     latitude: float = None
     longitude: float = None
+    renderer: str = None  # 날씨 최종 답변 방식 ("template" 또는 "llm"), A/B 테스트용
 
 class ChatResponse(BaseModel):
     reply: str
     chat_id: int
+    renderer: str = None  # 최종 답변을 만든 방식 (함수 결과를 그대로 반환하면 None)
+    cached: bool = False  # 답변 캐시에서 가져온 답변인지 여부
+    cctv: List[str] = []  # 답변과 별도로 표시할 CCTV 영상 정보 ("cctv_data:" 형식, 여러 함수를 함께 호출한 경우)
 
 class CreateUserRequest(BaseModel):
     location: str
@@ -67,9 +81,19 @@ async def lifespan(app: FastAPI):
         minutes=30,
         id='weather_notification_job'
     )
+
+    # 전국 CCTV 스냅샷 갱신 작업 (없거나 하루가 지났으면 새로 받는다). 사용자 조회의 연결 풀을 막지 않도록 전용 세션을 사용한다.
+    cctv_snapshot_task = asyncio.create_task(run_cctv_snapshot_scheduler())
     
     yield
 
+    # 서버를 종료할 때, CCTV 스냅샷 작업을 멈추고 CCTV API의 HTTP 세션과 Gemini 호출 스레드 풀을 닫는다.
+    cctv_snapshot_task.cancel()
+    # 스냅샷 작업이 전용 세션을 닫을 때까지 기다린다.
+    await asyncio.gather(cctv_snapshot_task, return_exceptions=True)
+    await close_cctv_service()
+    get_gemini_runner().shutdown()
+
 app = FastAPI(
     title="🌤️📹 날씨 & CCTV 챗봇 API",
     description="기상청 공식 API와 ITS CCTV API 기반 통합 챗봇",
@@ -96,9 +120,37 @@ async def get_weather_news_summaries(latitude: float, longitude: float):
         longitude (float): 경도.
 
     Returns:
-        dict: 해당 지역과 관련된 뉴스 요약 정보를 기록한 dictionary.
+        list: 해당 지역과 관련된 뉴스 요약 정보를 기록한 dictionary의 리스트.
+    """
+    return await export_news_summaries_json(latitude, longitude)
+
+@app.get("/weather/news/stream")
+async def stream_weather_news_summaries(latitude: float, longitude: float, format: str = "ndjson"):
+    """
+    주어진 좌표의 지역과 관련된 뉴스 요약을, 요약이 끝나는 즉시 하나씩 스트리밍한다.
+    마지막에는 요약 개수와 첫 요약까지 걸린 시간(time_to_first_summary_ms)을 담은 done 이벤트를 보낸다.
+
+    Args:
+        latitude (float): 위도.
+        longitude (float): 경도.
+        format (str): "ndjson"(기본값, 한 줄에 JSON 이벤트 하나) 또는 "sse"(Server-Sent Events).
+
+    Returns:
+        StreamingResponse: summary 이벤트들과 done 이벤트로 이루어진 스트림.
     """
-    return json.loads(await export_news_summaries_json(latitude, longitude))
+    if format not in ("ndjson", "sse"):
+        raise HTTPException(status_code=400, detail="format은 ndjson 또는 sse만 지원합니다.")
+
+    async def event_stream():
+        async for event in stream_news_summaries(latitude, longitude):
+            data = json.dumps(event, ensure_ascii=False)
+            if format == "sse":
+                yield f"event: {event['event']}\ndata: {data}\n\n"
+            else:
+                yield f"{data}\n"
+
+    media_type = "text/event-stream" if format == "sse" else "application/x-ndjson"
+    return StreamingResponse(event_stream(), media_type=media_type, headers={"Cache-Control": "no-cache"})
 
 @app.get("/weather/ultra_short_term")
 async def get_ultra_short_term_weather_forecast(latitude: float, longitude: float):
@@ -145,10 +197,11 @@ async def chat(request: ChatRequest) -> ChatResponse:
             user_id=request.user_id,
             chat_id=request.chat_id,
             latitude=request.latitude,
-            longitude=request.longitude
+            longitude=request.longitude,
+            renderer=request.renderer
         )
         
-        return ChatResponse(reply=result["reply"], chat_id=result["chat_id"])
+        return ChatResponse(reply=result["reply"], chat_id=result["chat_id"], renderer=result["renderer"], cached=result["cached"], cctv=result["cctv"])
         
     except ValueError as e:
         raise HTTPException(status_code=400, detail=str(e))
@@ -156,6 +209,48 @@ async def chat(request: ChatRequest) -> ChatResponse:
         print(f"챗봇 오류: {e}")
         raise HTTPException(status_code=500, detail="일시적인 오류가 발생했습니다. 다시 시도해주세요.")
 
+@app.post("/api/chat/stream")
+async def chat_stream(request: ChatRequest, format: str = "sse"):
+    """
+    /api/chat의 스트리밍 버전. 함수 선택, 데이터 조회 진행 상황을 이벤트로 보내고, 최종 답변은 생성되는 즉시 조각(token)으로 보낸다.
+    마지막에는 전체 답변과 첫 조각까지 걸린 시간(time_to_first_token_ms)을 담은 done 이벤트를 보낸다.
+
+    Args:
+        request (ChatRequest): 사용자 메시지와 관련된 요청 데이터.
+        format (str): "sse"(기본값, Server-Sent Events) 또는 "ndjson"(한 줄에 JSON 이벤트 하나).
+
+    Returns:
+        StreamingResponse: start, function, data, token, done 이벤트로 이루어진 스트림.
+    """
+    if format not in ("ndjson", "sse"):
+        raise HTTPException(status_code=400, detail="format은 ndjson 또는 sse만 지원합니다.")
+
+    try:
+        events = await chatbot_service.stream_message(
+            message=request.message,
+            user_id=request.user_id,
+            chat_id=request.chat_id,
+            latitude=request.latitude,
+            longitude=request.longitude,
+            renderer=request.renderer
+        )
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
+    except Exception as e:
+        print(f"챗봇 오류: {e}")
+        raise HTTPException(status_code=500, detail="일시적인 오류가 발생했습니다. 다시 시도해주세요.")
+
+    async def event_stream():
+        async for event in events:
+            data = json.dumps(event, ensure_ascii=False)
+            if format == "sse":
+                yield f"event: {event['event']}\ndata: {data}\n\n"
+            else:
+                yield f"{data}\n"
+
+    media_type = "text/event-stream" if format == "sse" else "application/x-ndjson"
+    return StreamingResponse(event_stream(), media_type=media_type, headers={"Cache-Control": "no-cache"})
+
 @app.get("/api/chat/{chat_id}/messages")
 async def get_chat_messages(chat_id: int):
     """
@@ -319,5 +414,10 @@ async def health_check():
         "gemini_api": "configured" if gemini_api_key else "not_configured",
         "kma_api": "configured" if forecast_service.is_kma_api_configured() else "not_configured",
         "cctv_api": "configured" if cctv_api_key else "not_configured",
+        "gemini_calls": get_gemini_runner().stats(),
+        "intent_fast_path": intent_stats(),
+        "answer_cache": answer_cache_stats(),
+        "conversation_cache": get_conversation_cache().stats(),
+        "forecast_prefetch": forecast_prefetch_stats(),
         "supported_locations": forecast_service.get_supported_locations()["locations"]
     }
\ No newline at end of file
@@ -0,0 +1,18 @@
+import math
+
+import numpy as np
+
+# 지구 평균 반지름(km). 하버사인 거리와 KD-tree(단위 구) 거리 변환에 함께 사용한다.
+EARTH_RADIUS_KM = 6371.0
+
+
+def to_unit_vectors(latitudes: np.ndarray, longitudes: np.ndarray) -> np.ndarray:
+    """위도/경도(도)를 단위 구 위의 3차원 좌표로 변환합니다. (유클리드 거리가 구면 거리 순서와 같아짐)"""
+    lat = np.radians(latitudes)
+    lon = np.radians(longitudes)
+    return np.column_stack((np.cos(lat) * np.cos(lon), np.cos(lat) * np.sin(lon), np.sin(lat)))
+
+
+def chord_to_km(chord: float) -> float:
+    """단위 구 위의 직선(현) 거리를 지표면 거리(km)로 변환합니다."""
+    return 2 * EARTH_RADIUS_KM * math.asin(min(1.0, chord / 2))
@@ -362,7 +362,18 @@ export function Chat() {
         cctvData: cctvData,
       };
 
-      setMessages((prev) => [...prev, botMessage]);
+      // 여러 함수를 함께 호출한 답변의 CCTV 영상은 답변 뒤에 별도 메시지로 표시
+      const cctvMessages = (response.cctv ?? []).map((content, index) =>
+        convertAPIMessageToUIMessage({
+          id: Date.now() + 2 + index,
+          chat_id: response.chat_id,
+          role: "assistant",
+          content,
+          created_at: new Date().toISOString(),
+        })
+      );
+
+      setMessages((prev) => [...prev, botMessage, ...cctvMessages]);
       setStatus("idle");
     } catch (err) {
       console.error("메시지 전송 실패:", err);
@@ -15,6 +15,7 @@ export interface ChatRequest {
 export interface ChatResponse {
   reply: string;
   chat_id: number;
+  cctv?: string[]; // 답변과 별도로 표시할 CCTV 영상 정보 ("cctv_data:" 형식)
 }
 
 export interface ChatMessage {